@@ -1,21 +1,15 @@
 #!/usr/bin/env python3
 """Analyze actual Bybit trades to calculate real P&L"""
 
-from pybit.unified_trading import HTTP
-from dotenv import load_dotenv
-import os
+from scripts_common import get_shared_client
+from src.config import config
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-load_dotenv()
-
-client = HTTP(
-    testnet=True,
-    api_key=os.getenv('BYBIT_API_KEY'),
-    api_secret=os.getenv('BYBIT_API_SECRET')
-)
+client = get_shared_client()
 
 print("=" * 80)
-print("ACTUAL TRADE P&L ANALYSIS")
+print("ACTUAL TRADE P&L ANALYSIS (TESTNET)" if config.bybit.testnet else "ACTUAL TRADE P&L ANALYSIS (MAINNET)")
 print("=" * 80)
 
 # Get recent trades for each symbol
@@ -24,15 +18,28 @@ symbols = ['ETHUSDT', 'XRPUSDT', 'BTCUSDT']
 total_pnl = 0
 total_trades = 0
 
-for symbol in symbols:
+
+def fetch_closed_pnl(symbol):
+    """Fetch closed P&L for one symbol, returning the exception instead of raising"""
     try:
-        # Get closed P&L
-        result = client.get_closed_pnl(
+        return client.get_closed_pnl(
             category="linear",
             symbol=symbol,
             limit=50
         )
-        
+    except Exception as e:
+        return e
+
+
+# Fire all symbol requests at once; results come back in symbol order
+with ThreadPoolExecutor(max_workers=len(symbols)) as executor:
+    results = list(executor.map(fetch_closed_pnl, symbols))
+
+for symbol, result in zip(symbols, results):
+    try:
+        if isinstance(result, Exception):
+            raise result
+
         if result['retCode'] == 0 and result['result']['list']:
             print(f"\n📊 {symbol} Closed Positions:")
             print("-" * 80)
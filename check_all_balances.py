@@ -1,15 +1,12 @@
 """Check balances across all Bybit account types"""
 
-from pybit.unified_trading import HTTP
+from scripts_common import get_shared_client
 from src.config import config
 import json
+import sys
 
 # Initialize client
-client = HTTP(
-    testnet=config.bybit.testnet,
-    api_key=config.bybit.api_key,
-    api_secret=config.bybit.api_secret
-)
+client = get_shared_client()
 
 print("=" * 80)
 print("BYBIT ACCOUNT BALANCES (TESTNET)" if config.bybit.testnet else "BYBIT ACCOUNT BALANCES (MAINNET)")
@@ -57,23 +54,29 @@ for account_type in account_types:
         # Print coin balances
         if 'coin' in account_data:
             print(f"   Coin Balances:")
+            blocks = []
             for coin in account_data['coin']:
-                coin_name = coin.get('coin', 'UNKNOWN')
-                wallet_balance = float(coin.get('walletBalance', 0))
-                available_balance = float(coin.get('availableToWithdraw', 0))
-                equity = float(coin.get('equity', 0))
-                locked = float(coin.get('locked', 0))
+                get = coin.get
+                wallet_balance = float(get('walletBalance', 0))
+                equity = float(get('equity', 0))
+                locked = float(get('locked', 0))
 
                 if wallet_balance > 0 or equity > 0 or locked > 0:
-                    print(f"   • {coin_name}:")
-                    print(f"     - Wallet Balance: {wallet_balance:.6f}")
-                    print(f"     - Available to Withdraw: {available_balance:.6f}")
-                    print(f"     - Equity: {equity:.6f}")
-                    print(f"     - Locked: {locked:.6f}")
+                    coin_name = get('coin', 'UNKNOWN')
+                    available_balance = float(get('availableToWithdraw', 0))
+                    blocks.append(
+                        f"   • {coin_name}:\n"
+                        f"     - Wallet Balance: {wallet_balance:.6f}\n"
+                        f"     - Available to Withdraw: {available_balance:.6f}\n"
+                        f"     - Equity: {equity:.6f}\n"
+                        f"     - Locked: {locked:.6f}\n"
+                    )
 
                     if coin_name == 'USDT':
                         total_usdt += wallet_balance
 
+            sys.stdout.write(''.join(blocks))
+
         print()
 
     except Exception as e:
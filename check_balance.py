@@ -1,100 +1,107 @@
-"""Check Bybit testnet balances across all account types"""
+"""Check Bybit balances across all account types"""
 
-import os
-from dotenv import load_dotenv
-from pybit.unified_trading import HTTP
-
-load_dotenv()
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from scripts_common import get_shared_client
+from src.config import config
 
 # Initialize client
-client = HTTP(
-    testnet=True,
-    api_key=os.getenv('BYBIT_API_KEY'),
-    api_secret=os.getenv('BYBIT_API_SECRET')
-)
+client = get_shared_client()
 
 print("=" * 60)
-print("BYBIT TESTNET ACCOUNT BALANCES")
+print("BYBIT TESTNET ACCOUNT BALANCES" if config.bybit.testnet else "BYBIT MAINNET ACCOUNT BALANCES")
 print("=" * 60)
 print()
 
-# 1. Check Unified Account (Used for perpetual futures)
-print("1. UNIFIED ACCOUNT (Perpetual Futures):")
-print("-" * 60)
-try:
-    response = client.get_wallet_balance(accountType="UNIFIED")
-    print(f"Response Code: {response['retCode']}")
-    print(f"Response Message: {response['retMsg']}")
-
-    if response['retCode'] == 0 and response['result']['list']:
-        account = response['result']['list'][0]
-        print(f"\nTotal Equity: ${account.get('totalEquity', 'N/A')}")
-        print(f"Total Wallet Balance: ${account.get('totalWalletBalance', 'N/A')}")
-        print(f"Total Available Balance: ${account.get('totalAvailableBalance', 'N/A')}")
-        print(f"Total Margin Balance: ${account.get('totalMarginBalance', 'N/A')}")
-
-        print("\nCoins:")
-        for coin in account.get('coin', []):
-            if float(coin.get('walletBalance', 0)) > 0:
-                print(f"  {coin['coin']}:")
-                print(f"    Wallet Balance: {coin.get('walletBalance', '0')}")
-                print(f"    Available: {coin.get('availableToWithdraw', '0')}")
-                print(f"    Equity: {coin.get('equity', '0')}")
-    else:
-        print("No unified account data or error")
-        print(response)
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 60)
-
-# 2. Check Contract Account (Old perpetual account type)
-print("2. CONTRACT ACCOUNT:")
-print("-" * 60)
-try:
-    response = client.get_wallet_balance(accountType="CONTRACT")
-    print(f"Response Code: {response['retCode']}")
-    print(f"Response Message: {response['retMsg']}")
-
-    if response['retCode'] == 0 and response['result']['list']:
-        account = response['result']['list'][0]
-        print(f"\nTotal Equity: ${account.get('totalEquity', 'N/A')}")
-        print(f"Total Wallet Balance: ${account.get('totalWalletBalance', 'N/A')}")
-
-        print("\nCoins:")
-        for coin in account.get('coin', []):
-            if float(coin.get('walletBalance', 0)) > 0:
-                print(f"  {coin['coin']}: {coin.get('walletBalance', '0')}")
-    else:
-        print("No contract account data")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 60)
-
-# 3. Check Spot Account
-print("3. SPOT ACCOUNT:")
-print("-" * 60)
-try:
-    response = client.get_wallet_balance(accountType="SPOT")
-    print(f"Response Code: {response['retCode']}")
-    print(f"Response Message: {response['retMsg']}")
-
-    if response['retCode'] == 0 and response['result']['list']:
-        account = response['result']['list'][0]
-
-        print("\nCoins:")
-        for coin in account.get('coin', []):
-            if float(coin.get('walletBalance', 0)) > 0:
-                print(f"  {coin['coin']}:")
-                print(f"    Wallet Balance: {coin.get('walletBalance', '0')}")
-                print(f"    Available: {coin.get('availableToWithdraw', '0')}")
-    else:
-        print("No spot account data")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 60)
+# Wallet sections: (account type, heading, summary fields, per-coin fields, empty message,
+# dump the raw response when empty). A per-coin field list of None prints a compact
+# "COIN: balance" line.
+SECTIONS = [
+    (
+        "UNIFIED",
+        "1. UNIFIED ACCOUNT (Perpetual Futures):",
+        [
+            ("Total Equity", 'totalEquity'),
+            ("Total Wallet Balance", 'totalWalletBalance'),
+            ("Total Available Balance", 'totalAvailableBalance'),
+            ("Total Margin Balance", 'totalMarginBalance'),
+        ],
+        [("Wallet Balance", 'walletBalance'), ("Available", 'availableToWithdraw'), ("Equity", 'equity')],
+        "No unified account data or error",
+        True,
+    ),
+    (
+        "CONTRACT",
+        "2. CONTRACT ACCOUNT:",
+        [("Total Equity", 'totalEquity'), ("Total Wallet Balance", 'totalWalletBalance')],
+        None,
+        "No contract account data",
+        False,
+    ),
+    (
+        "SPOT",
+        "3. SPOT ACCOUNT:",
+        [],
+        [("Wallet Balance", 'walletBalance'), ("Available", 'availableToWithdraw')],
+        "No spot account data",
+        False,
+    ),
+]
+
+
+def fetch_wallet(account_type):
+    """Fetch one wallet balance, returning the exception instead of raising"""
+    try:
+        return client.get_wallet_balance(accountType=account_type)
+    except Exception as e:
+        return e
+
+
+def format_coin(coin, coin_fields):
+    """Format one coin entry for printing"""
+    if coin_fields is None:
+        return f"  {coin['coin']}: {coin.get('walletBalance', '0')}\n"
+    return f"  {coin['coin']}:\n" + ''.join(
+        f"    {label}: {coin.get(key, '0')}\n" for label, key in coin_fields
+    )
+
+
+# The wallet calls are independent, so issue them all at once
+with ThreadPoolExecutor(max_workers=len(SECTIONS)) as executor:
+    responses = list(executor.map(fetch_wallet, [section[0] for section in SECTIONS]))
+
+for (account_type, heading, summary_fields, coin_fields, empty_message, dump_response), response in zip(
+    SECTIONS, responses
+):
+    print(heading)
+    print("-" * 60)
+    try:
+        if isinstance(response, Exception):
+            raise response
+        print(f"Response Code: {response['retCode']}")
+        print(f"Response Message: {response['retMsg']}")
+
+        if response['retCode'] == 0 and response['result']['list']:
+            account = response['result']['list'][0]
+            if summary_fields:
+                print()
+            for label, key in summary_fields:
+                print(f"{label}: ${account.get(key, 'N/A')}")
+
+            print("\nCoins:")
+            sys.stdout.write(''.join(
+                format_coin(coin, coin_fields)
+                for coin in account.get('coin', [])
+                if float(coin.get('walletBalance', 0)) > 0
+            ))
+        else:
+            print(empty_message)
+            if dump_response:
+                print(response)
+    except Exception as e:
+        print(f"Error: {e}")
+
+    print("\n" + "=" * 60)
 
 # 4. Get Coin Balance (simpler API)
 print("4. COIN BALANCES (All Accounts):")
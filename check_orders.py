@@ -1,34 +1,52 @@
 """Check recent orders on Bybit testnet"""
 
-from pybit.unified_trading import HTTP
-from src.config import config
-from datetime import datetime, timedelta
+from scripts_common import get_shared_client
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 
 print("=" * 80)
 print("BYBIT TESTNET - RECENT ORDERS")
 print("=" * 80)
 print()
 
-client = HTTP(
-    testnet=config.bybit.testnet,
-    api_key=config.bybit.api_key,
-    api_secret=config.bybit.api_secret
-)
+client = get_shared_client()
 
 # Check orders for ETH and XRP
 symbols = ["ETHUSDT", "XRPUSDT"]
 
-for symbol in symbols:
+
+def format_ms_timestamps(values):
+    """Convert Bybit millisecond epoch strings to UTC timestamp strings in one pass"""
+    times = np.array(values, dtype=np.int64).view('datetime64[ms]')
+    return np.char.replace(np.datetime_as_string(times, unit='ms'), 'T', ' ')
+
+
+def fetch_all(method, **params):
+    """Call `method` for every symbol concurrently, keeping exceptions as results"""
+    def fetch(symbol):
+        try:
+            return method(category="linear", symbol=symbol, **params)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(symbols)) as executor:
+        return list(executor.map(fetch, symbols))
+
+
+# Order history and executions are independent, so request them together
+with ThreadPoolExecutor(max_workers=2) as executor:
+    order_future = executor.submit(fetch_all, client.get_order_history, limit=10)
+    execution_future = executor.submit(fetch_all, client.get_executions, limit=10)
+    order_responses = order_future.result()
+    execution_responses = execution_future.result()
+
+for symbol, response in zip(symbols, order_responses):
     print(f"📊 Recent orders for {symbol}:")
     print("-" * 80)
 
     try:
-        # Get order history (last 24 hours)
-        response = client.get_order_history(
-            category="linear",
-            symbol=symbol,
-            limit=10
-        )
+        if isinstance(response, Exception):
+            raise response
 
         if response['retCode'] == 0:
             orders = response['result']['list']
@@ -36,20 +54,21 @@ for symbol in symbols:
             if not orders:
                 print(f"   No orders found for {symbol}")
             else:
-                for order in orders:
+                created_times = format_ms_timestamps([o['createdTime'] for o in orders])
+                updated_times = format_ms_timestamps([o['updatedTime'] for o in orders])
+
+                for order, created, updated in zip(orders, created_times, updated_times):
                     order_id = order['orderId']
                     side = order['side']
                     qty = order['qty']
                     price = order['avgPrice'] if order['avgPrice'] != '' else order['price']
                     status = order['orderStatus']
-                    created = datetime.fromtimestamp(int(order['createdTime']) / 1000)
-                    updated = datetime.fromtimestamp(int(order['updatedTime']) / 1000)
 
                     print(f"   Order ID: {order_id}")
                     print(f"   Side: {side} | Qty: {qty} | Price: ${price}")
                     print(f"   Status: {status}")
-                    print(f"   Created: {created}")
-                    print(f"   Updated: {updated}")
+                    print(f"   Created: {created} UTC")
+                    print(f"   Updated: {updated} UTC")
                     print()
         else:
             print(f"   ❌ Error: {response['retMsg']}")
@@ -63,13 +82,10 @@ for symbol in symbols:
 print("📈 Recent trades:")
 print("-" * 80)
 
-for symbol in symbols:
+for symbol, response in zip(symbols, execution_responses):
     try:
-        response = client.get_executions(
-            category="linear",
-            symbol=symbol,
-            limit=10
-        )
+        if isinstance(response, Exception):
+            raise response
 
         if response['retCode'] == 0:
             trades = response['result']['list']
@@ -78,14 +94,15 @@ for symbol in symbols:
                 print(f"   No trades for {symbol}")
             else:
                 print(f"   {symbol}:")
-                for trade in trades:
+                exec_times = format_ms_timestamps([t['execTime'] for t in trades])
+
+                for trade, exec_time in zip(trades, exec_times):
                     exec_id = trade['execId']
                     side = trade['side']
                     qty = trade['execQty']
                     price = trade['execPrice']
-                    exec_time = datetime.fromtimestamp(int(trade['execTime']) / 1000)
 
-                    print(f"     {exec_time}: {side} {qty} @ ${price}")
+                    print(f"     {exec_time} UTC: {side} {qty} @ ${price}")
     except Exception as e:
         print(f"   ❌ Error: {e}")
 
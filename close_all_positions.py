@@ -6,8 +6,6 @@ Use this when you need to flatten your book instantly.
 import asyncio
 import logging
 import sys
-from src.execution.position_manager import PositionManager
-from src.execution.order_manager import OrderManager
 from src.data.models import PositionSide, OrderType, OrderSide
 
 # Configure logging
@@ -20,8 +18,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger("EmergencyClose")
 
+# Cap in-flight close orders so a large book doesn't trip Bybit's rate limits
+MAX_CONCURRENT_ORDERS = 10
+
+# Order side that flattens each position side
+_FLIP = {PositionSide.LONG: OrderSide.SELL, PositionSide.SHORT: OrderSide.BUY}
+
+
+async def _bounded(sem, coro):
+    """Await `coro` under `sem`, returning any exception instead of raising.
+
+    Raising inside the TaskGroup would cancel every other close order, which
+    is the opposite of what an emergency flatten needs.
+    """
+    async with sem:
+        try:
+            return await coro
+        except Exception as e:
+            return e
+
+
 async def close_all():
     """Close all open positions immediately"""
+    # Managers pull in the exchange client stack; import only when closing
+    from src.execution.position_manager import PositionManager
+    from src.execution.order_manager import OrderManager
+
     logger.info("🚨 INITIATING EMERGENCY CLOSE OF ALL POSITIONS 🚨")
     
     position_manager = PositionManager()
@@ -36,34 +58,36 @@ async def close_all():
 
     logger.info(f"Found {len(positions)} open positions. Closing now...")
     
+    sem = asyncio.Semaphore(MAX_CONCURRENT_ORDERS)
     tasks = []
-    for pos in positions:
-        logger.info(f"Closing {pos.pair_id} (Size: {pos.size_a} / {pos.size_b})...")
+    async with asyncio.TaskGroup() as tg:
+        for pos in positions:
+            logger.info(f"Closing {pos.pair_id} (Size: {pos.size_a} / {pos.size_b})...")
         
-        # Close Leg A
-        side_a = OrderSide.SELL if pos.side_a == PositionSide.LONG else OrderSide.BUY
-        task_a = order_manager.client.place_order(
-            symbol=pos.symbol_a,
-            side=side_a,
-            order_type=OrderType.MARKET,
-            qty=str(pos.qty_a),  # Use stored quantity
-            reduce_only=True
-        )
-        tasks.append(task_a)
+            # Close Leg A
+            side_a = _FLIP[pos.side_a]
+            task_a = tg.create_task(_bounded(sem, order_manager.client.place_order(
+                symbol=pos.symbol_a,
+                side=side_a,
+                order_type=OrderType.MARKET,
+                qty=str(pos.qty_a),  # Use stored quantity
+                reduce_only=True
+            )))
+            tasks.append(task_a)
         
-        # Close Leg B
-        side_b = OrderSide.SELL if pos.side_b == PositionSide.LONG else OrderSide.BUY
-        task_b = order_manager.client.place_order(
-            symbol=pos.symbol_b,
-            side=side_b,
-            order_type=OrderType.MARKET,
-            qty=str(pos.qty_b),  # Use stored quantity
-            reduce_only=True
-        )
-        tasks.append(task_b)
-        
-    # Execute all close orders in parallel
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Close Leg B
+            side_b = _FLIP[pos.side_b]
+            task_b = tg.create_task(_bounded(sem, order_manager.client.place_order(
+                symbol=pos.symbol_b,
+                side=side_b,
+                order_type=OrderType.MARKET,
+                qty=str(pos.qty_b),  # Use stored quantity
+                reduce_only=True
+            )))
+            tasks.append(task_b)
+
+    # All close orders have completed once the TaskGroup exits
+    results = [task.result() for task in tasks]
     
     # Check results
     success_count = 0
@@ -1,145 +1,204 @@
 """Comprehensive sanity test for Bybit pairs trading system"""
 
-import requests
-import json
-from src.config import config
-from src.data.bybit_client import get_bybit_client
-import asyncio
-
-print("=" * 80)
-print("🧪 BYBIT PAIRS TRADING - COMPREHENSIVE SANITY TEST")
-print("=" * 80)
-print()
-
-# Test 1: Configuration
-print("📋 TEST 1: Configuration Check")
-print("-" * 80)
-print(f"✅ Testnet Mode: {config.bybit.testnet}")
-print(f"✅ Trading Enabled: {config.trading.enabled}")
-print(f"✅ Z-Score Entry Threshold: {config.trading.zscore_entry_threshold}")
-print(f"✅ Z-Score Exit Threshold: {config.trading.zscore_exit_threshold}")
-print(f"✅ Cointegration P-Value Threshold: {config.trading.cointegration_pvalue_threshold}")
-print(f"✅ Cointegration Window: {config.trading.cointegration_window} minutes")
-print(f"✅ Max Position Size: ${config.trading.max_position_size}")
-print(f"✅ Trading Pairs: {len(config.get_trading_pairs())}")
-for pair in config.get_trading_pairs():
-    print(f"   - {pair['symbol_a']} / {pair['symbol_b']}")
-print()
-
-# Test 2: Bybit API Connection
-print("📡 TEST 2: Bybit API Connection")
-print("-" * 80)
-try:
-    client = get_bybit_client()
-    balance = client.get_account_balance()
-    print(f"✅ Connected to Bybit {'Testnet' if config.bybit.testnet else 'Mainnet'}")
-    print(f"✅ Account Balance: ${balance:.2f}")
-    print()
-except Exception as e:
-    print(f"❌ Bybit API Connection Failed: {e}")
-    print()
+import re
+from concurrent.futures import ThreadPoolExecutor
 
-# Test 3: Dashboard Server
-print("🌐 TEST 3: Dashboard Server")
-print("-" * 80)
-try:
-    response = requests.get("http://localhost:5000/", timeout=5)
-    if response.status_code == 200:
-        print(f"✅ Dashboard server is running on http://localhost:5000")
-        print(f"✅ HTTP Status: {response.status_code}")
-    else:
-        print(f"⚠️  Dashboard returned status: {response.status_code}")
-    print()
-except Exception as e:
-    print(f"❌ Dashboard server not accessible: {e}")
-    print()
+# Heavy dependencies (pybit, requests, pydantic config) are imported inside
+# the tests that need them so startup stays fast
 
-# Test 4: Dashboard Data File
-print("📁 TEST 4: Dashboard Data File")
-print("-" * 80)
-try:
-    with open("/tmp/bybit_dashboard_data.json", "r") as f:
-        dashboard_data = json.load(f)
-
-    print(f"✅ Dashboard data file exists")
-    print(f"✅ Account Balance: ${dashboard_data.get('account_balance', 0):.2f}")
-    print(f"✅ Available Balance: ${dashboard_data.get('available_balance', 0):.2f}")
-    print(f"✅ Total P&L: ${dashboard_data.get('total_pnl', 0):.2f}")
-    print(f"✅ Daily P&L: ${dashboard_data.get('daily_pnl', 0):.2f}")
-    print(f"✅ Total Trades: {dashboard_data.get('total_trades', 0)}")
-    print(f"✅ Trading Pairs in Data: {len(dashboard_data.get('pairs', {}))}")
-
-    for pair_id, pair_data in dashboard_data.get('pairs', {}).items():
-        print(f"   - {pair_id}:")
-        print(f"     Z-Score: {pair_data.get('zscore', 0):.3f}")
-        print(f"     Signal: {pair_data.get('signal', 'N/A')}")
-        print(f"     Confidence: {pair_data.get('confidence', 0)*100:.1f}%")
-        print(f"     Cointegrated: {pair_data.get('cointegration', {}).get('pvalue', 1.0) < 0.2}")
-    print()
-except Exception as e:
-    print(f"⚠️  Dashboard data file not found or error: {e}")
-    print()
+# Log markers highlighted in Test 5, in priority order (first match wins)
+LOG_ICONS = [
+    ("Account balance", "💰 "),
+    ("Decision for", "🎯 "),
+    ("Loop time", "⏱️  "),
+    ("ERROR", "❌ "),
+    ("WARNING", "⚠️  "),
+]
+LOG_PRIORITY = {marker: i for i, (marker, _) in enumerate(LOG_ICONS)}
+LOG_MARKER_RE = re.compile("|".join(re.escape(marker) for marker, _ in LOG_ICONS))
 
-# Test 5: Trading Engine Log
-print("📊 TEST 5: Trading Engine Status")
-print("-" * 80)
-try:
-    with open("logs/trading.log", "r") as f:
-        lines = f.readlines()
-        recent_logs = lines[-20:]  # Last 20 lines
-
-    print(f"✅ Trading log file exists")
-    print(f"✅ Recent log entries (last 20 lines):")
-    for line in recent_logs:
-        line = line.strip()
-        if "Account balance" in line:
-            print(f"   💰 {line}")
-        elif "Decision for" in line:
-            print(f"   🎯 {line}")
-        elif "Loop time" in line:
-            print(f"   ⏱️  {line}")
-        elif "ERROR" in line:
-            print(f"   ❌ {line}")
-        elif "WARNING" in line:
-            print(f"   ⚠️  {line}")
-    print()
-except Exception as e:
-    print(f"⚠️  Trading log not found or error: {e}")
+
+def tail(path, n=20, block_size=8192):
+    """Return the last `n` lines of a file, reading backwards from EOF in blocks"""
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return [line.decode("utf-8", errors="replace") for line in data.splitlines()[-n:]]
+
+
+def check_configuration():
+    """Test 1: Configuration"""
+    from src.config import config
+
+    print("📋 TEST 1: Configuration Check")
+    print("-" * 80)
+    print(f"✅ Testnet Mode: {config.bybit.testnet}")
+    print(f"✅ Trading Enabled: {config.trading.enabled}")
+    print(f"✅ Z-Score Entry Threshold: {config.trading.zscore_entry_threshold}")
+    print(f"✅ Z-Score Exit Threshold: {config.trading.zscore_exit_threshold}")
+    print(f"✅ Cointegration P-Value Threshold: {config.trading.cointegration_pvalue_threshold}")
+    print(f"✅ Cointegration Window: {config.trading.cointegration_window} minutes")
+    print(f"✅ Max Position Size: ${config.trading.max_position_size}")
+    pairs = config.get_trading_pairs()
+    print(f"✅ Trading Pairs: {len(pairs)}")
+    for pair in pairs:
+        print(f"   - {pair['symbol_a']} / {pair['symbol_b']}")
     print()
 
-# Test 6: WebSocket Connection
-print("🔌 TEST 6: WebSocket Data Stream")
-print("-" * 80)
-try:
-    client = get_bybit_client()
-
-    # Check tick buffer
-    symbols_with_data = 0
-    for symbol in ['BTCUSDT', 'ETHUSDT', 'XRPUSDT', 'BCHUSDT', 'LTCUSDT', 'DOGEUSDT']:
-        price = client.get_latest_price(symbol)
-        if price:
-            print(f"✅ {symbol}: ${price:.2f}")
-            symbols_with_data += 1
+
+def check_api_connection():
+    """Test 2: Bybit API Connection"""
+    from src.config import config
+
+    print("📡 TEST 2: Bybit API Connection")
+    print("-" * 80)
+    try:
+        from src.data.bybit_client import get_bybit_client
+
+        client = get_bybit_client()
+        balance = client.get_account_balance()
+        print(f"✅ Connected to Bybit {'Testnet' if config.bybit.testnet else 'Mainnet'}")
+        print(f"✅ Account Balance: ${balance:.2f}")
+        print()
+    except Exception as e:
+        print(f"❌ Bybit API Connection Failed: {e}")
+        print()
+
+
+def check_dashboard_server():
+    """Test 3: Dashboard Server"""
+    print("🌐 TEST 3: Dashboard Server")
+    print("-" * 80)
+    try:
+        import requests
+
+        response = requests.get("http://localhost:5000/", timeout=5)
+        if response.status_code == 200:
+            print(f"✅ Dashboard server is running on http://localhost:5000")
+            print(f"✅ HTTP Status: {response.status_code}")
         else:
-            print(f"⚠️  {symbol}: No data yet")
+            print(f"⚠️  Dashboard returned status: {response.status_code}")
+        print()
+    except Exception as e:
+        print(f"❌ Dashboard server not accessible: {e}")
+        print()
+
+
+def check_dashboard_data():
+    """Test 4: Dashboard Data File"""
+    print("📁 TEST 4: Dashboard Data File")
+    print("-" * 80)
+    try:
+        import orjson
 
-    if symbols_with_data >= 4:
-        print(f"\n✅ WebSocket is receiving live data for {symbols_with_data}/6 symbols")
-    else:
-        print(f"\n⚠️  Only {symbols_with_data}/6 symbols have data - may need more time")
+        with open("/tmp/bybit_dashboard_data.json", "rb") as f:
+            dashboard_data = orjson.loads(f.read())
+
+        print(f"✅ Dashboard data file exists")
+        print(f"✅ Account Balance: ${dashboard_data.get('account_balance', 0):.2f}")
+        print(f"✅ Available Balance: ${dashboard_data.get('available_balance', 0):.2f}")
+        print(f"✅ Total P&L: ${dashboard_data.get('total_pnl', 0):.2f}")
+        print(f"✅ Daily P&L: ${dashboard_data.get('daily_pnl', 0):.2f}")
+        print(f"✅ Total Trades: {dashboard_data.get('total_trades', 0)}")
+        print(f"✅ Trading Pairs in Data: {len(dashboard_data.get('pairs', {}))}")
+
+        for pair_id, pair_data in dashboard_data.get('pairs', {}).items():
+            print(f"   - {pair_id}:")
+            print(f"     Z-Score: {pair_data.get('zscore', 0):.3f}")
+            print(f"     Signal: {pair_data.get('signal', 'N/A')}")
+            print(f"     Confidence: {pair_data.get('confidence', 0)*100:.1f}%")
+            print(f"     Cointegrated: {pair_data.get('cointegration', {}).get('pvalue', 1.0) < 0.2}")
+        print()
+    except Exception as e:
+        print(f"⚠️  Dashboard data file not found or error: {e}")
+        print()
+
+
+def check_trading_log():
+    """Test 5: Trading Engine Log"""
+    print("📊 TEST 5: Trading Engine Status")
+    print("-" * 80)
+    try:
+        recent_logs = tail("logs/trading.log", 20)  # Last 20 lines
+
+        print(f"✅ Trading log file exists")
+        print(f"✅ Recent log entries (last 20 lines):")
+        for line in recent_logs:
+            line = line.strip()
+            markers = LOG_MARKER_RE.findall(line)
+            if markers:
+                icon = LOG_ICONS[min(LOG_PRIORITY[m] for m in markers)][1]
+                print(f"   {icon}{line}")
+        print()
+    except Exception as e:
+        print(f"⚠️  Trading log not found or error: {e}")
+        print()
+
+
+def check_websocket():
+    """Test 6: WebSocket Connection"""
+    print("🔌 TEST 6: WebSocket Data Stream")
+    print("-" * 80)
+    try:
+        from src.data.bybit_client import get_bybit_client
+
+        client = get_bybit_client()
+
+        # Check tick buffer
+        symbols = ['BTCUSDT', 'ETHUSDT', 'XRPUSDT', 'BCHUSDT', 'LTCUSDT', 'DOGEUSDT']
+        with ThreadPoolExecutor(max_workers=len(symbols)) as executor:
+            prices = list(executor.map(client.get_latest_price, symbols))
+
+        symbols_with_data = 0
+        for symbol, price in zip(symbols, prices):
+            if price:
+                print(f"✅ {symbol}: ${price:.2f}")
+                symbols_with_data += 1
+            else:
+                print(f"⚠️  {symbol}: No data yet")
+
+        if symbols_with_data >= 4:
+            print(f"\n✅ WebSocket is receiving live data for {symbols_with_data}/6 symbols")
+        else:
+            print(f"\n⚠️  Only {symbols_with_data}/6 symbols have data - may need more time")
+        print()
+    except Exception as e:
+        print(f"❌ WebSocket test failed: {e}")
+        print()
+
+
+def main():
+    """Run all sanity checks"""
+    print("=" * 80)
+    print("🧪 BYBIT PAIRS TRADING - COMPREHENSIVE SANITY TEST")
+    print("=" * 80)
     print()
-except Exception as e:
-    print(f"❌ WebSocket test failed: {e}")
+
+    check_configuration()
+    check_api_connection()
+    check_dashboard_server()
+    check_dashboard_data()
+    check_trading_log()
+    check_websocket()
+
+    print("=" * 80)
+    print("🎉 SANITY TEST COMPLETE")
+    print("=" * 80)
     print()
+    print("Summary:")
+    print("- If all tests passed ✅, the system is running correctly")
+    print("- Dashboard: http://localhost:5000")
+    print("- Trading loop runs every 10 seconds (ULTRA AGGRESSIVE mode)")
+    print("- Z-Score threshold: 0.1 (very low = more trades)")
+    print("- You should see trades executing soon!")
+    print()
+
 
-print("=" * 80)
-print("🎉 SANITY TEST COMPLETE")
-print("=" * 80)
-print()
-print("Summary:")
-print("- If all tests passed ✅, the system is running correctly")
-print("- Dashboard: http://localhost:5000")
-print("- Trading loop runs every 10 seconds (ULTRA AGGRESSIVE mode)")
-print("- Z-Score threshold: 0.1 (very low = more trades)")
-print("- You should see trades executing soon!")
-print()
+if __name__ == "__main__":
+    main()
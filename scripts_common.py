@@ -0,0 +1,49 @@
+"""Shared helpers for the standalone Bybit diagnostic scripts"""
+
+from typing import Optional
+
+from pybit.unified_trading import HTTP
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import config
+
+_client: Optional[HTTP] = None
+
+
+def configure_client(client: HTTP) -> HTTP:
+    """
+    Mount a pooled, retrying adapter on the client's requests.Session
+
+    Retry only covers idempotent methods (urllib3 default), so order
+    placement POSTs are never replayed.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    )
+    client.client.mount('https://', adapter)
+    return client
+
+
+def get_shared_client() -> HTTP:
+    """
+    Get the process-wide Bybit HTTP client
+
+    pybit keeps a single requests.Session per HTTP instance, so reusing one
+    client keeps the TCP/TLS connection alive across every call a script makes.
+    """
+    global _client
+    if _client is None:
+        _client = configure_client(HTTP(
+            testnet=config.bybit.testnet,
+            api_key=config.bybit.api_key,
+            api_secret=config.bybit.api_secret,
+            recv_window=5000
+        ))
+    return _client
@@ -1,6 +1,7 @@
 """Setup script for pairs trading system"""
 
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -12,19 +13,23 @@ def run_command(command, description):
     print(f"{description}")
     print(f"{'='*60}")
 
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error: {e.stderr}")
+    # Stream output as it arrives instead of buffering it until exit
+    proc = subprocess.Popen(
+        command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+    for line in proc.stdout:
+        print(line, end='')
+
+    returncode = proc.wait()
+    if returncode != 0:
+        print(f"Error: command exited with status {returncode}")
         return False
+    return True
 
 
 def check_python_version():
@@ -64,21 +69,27 @@ def install_python_deps():
 
 def setup_env_file():
     """Setup .env file"""
-    if not os.path.exists(".env"):
-        print("\nCreating .env file from template...")
-
-        # Copy .env.example to .env
-        with open(".env.example", "r") as src:
-            with open(".env", "w") as dst:
-                dst.write(src.read())
-
-        print("✓ .env file created")
-        print("\n⚠️  IMPORTANT: Edit .env file with your API keys:")
-        print("  - BYBIT_API_KEY")
-        print("  - BYBIT_API_SECRET")
-        print("  - GEMINI_API_KEY")
-    else:
+    # Exclusive create doubles as the existence check, so no separate stat
+    try:
+        dst = open(".env", "xb")
+    except FileExistsError:
         print("✓ .env file already exists")
+        return True
+
+    print("\nCreating .env file from template...")
+    try:
+        with dst, open(".env.example", "rb") as src:
+            shutil.copyfileobj(src, dst)
+    except FileNotFoundError:
+        # Don't leave an empty .env behind to be mistaken for a configured one
+        os.remove(".env")
+        raise
+
+    print("✓ .env file created")
+    print("\n⚠️  IMPORTANT: Edit .env file with your API keys:")
+    print("  - BYBIT_API_KEY")
+    print("  - BYBIT_API_SECRET")
+    print("  - GEMINI_API_KEY")
 
     return True
 
@@ -88,7 +99,7 @@ def create_directories():
     directories = ["logs", "data", "backtest_results"]
 
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
+        Path(directory).mkdir(parents=True, exist_ok=True)
         print(f"✓ Created directory: {directory}")
 
     return True
@@ -0,0 +1,243 @@
+"""Numeric kernels for the quant and risk agents
+
+The per-tick spread statistics and the branch cascades behind
+QuantAgent._get_recommendation and RiskAgent.should_close_position, reduced to
+array/float-in, int-code-out functions compiled with Numba when it is
+installed. Callers map the codes back to action strings and reason messages.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Plain-Python fallback when numba isn't installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Action codes returned by decide()
+AVOID = 0
+CLOSE = 1
+SHORT_SPREAD = 2
+LONG_SPREAD = 3
+HOLD = 4
+
+ACTION_NAMES = ('AVOID', 'CLOSE', 'SHORT_SPREAD', 'LONG_SPREAD', 'HOLD')
+
+# Reason codes returned by decide()
+REASON_NOT_COINTEGRATED = 0
+REASON_WEAK_MEAN_REVERSION = 1
+REASON_ZSCORE_STOP = 2
+REASON_ZSCORE_HIGH = 3
+REASON_ZSCORE_LOW = 4
+REASON_REVERSION_COMPLETE = 5
+REASON_ZSCORE_NEUTRAL = 6
+
+# Reason codes returned by decide_close()
+CLOSE_NONE = 0
+CLOSE_EMERGENCY_STOP = 1
+CLOSE_MIN_HOLDING = 2
+CLOSE_QUICK_PROFIT = 3
+CLOSE_BREAKEVEN = 4
+CLOSE_TRAILING_STOP = 5
+CLOSE_PNL_PCT_STOP = 6
+CLOSE_ZSCORE_STOP = 7
+CLOSE_MEAN_REVERSION = 8
+CLOSE_MAX_HOLDING = 9
+CLOSE_PNL_STOP = 10
+
+
+@njit(cache=True)
+def decide(zscore, mr_score, is_coint, has_pos, entry_thr, exit_thr, sl_thr):
+    """
+    Quant recommendation for a pair
+
+    Returns:
+        (action code, reason code, confidence)
+    """
+    if not is_coint:
+        if has_pos:
+            return CLOSE, REASON_NOT_COINTEGRATED, 0.0
+        return AVOID, REASON_NOT_COINTEGRATED, 0.0
+
+    if mr_score < 0.3:
+        return AVOID, REASON_WEAK_MEAN_REVERSION, 0.2
+
+    if abs(zscore) > sl_thr:
+        return CLOSE, REASON_ZSCORE_STOP, 0.9
+
+    if zscore > entry_thr:
+        return SHORT_SPREAD, REASON_ZSCORE_HIGH, min(0.9, (zscore - 2.0) * 0.3 + 0.5)
+
+    if zscore < -entry_thr:
+        return LONG_SPREAD, REASON_ZSCORE_LOW, min(0.9, (-zscore - 2.0) * 0.3 + 0.5)
+
+    if abs(zscore) < exit_thr and has_pos:
+        return CLOSE, REASON_REVERSION_COMPLETE, 0.7
+
+    return HOLD, REASON_ZSCORE_NEUTRAL, 0.5
+
+
+@njit(cache=True)
+def decide_close(
+    unrealized_pnl,
+    holding_s,
+    position_value,
+    max_profit_pct,
+    zscore,
+    sl_thr,
+    exit_thr,
+    max_holding_s,
+    min_holding_s
+):
+    """
+    Exit decision for an open position
+
+    `max_profit_pct` is NaN until the trailing stop has been armed.
+
+    Returns:
+        (should_close, reason code, pnl_pct, updated max_profit_pct)
+    """
+    # Emergency Stop Loss (Always active)
+    if unrealized_pnl < -100.0:
+        return True, CLOSE_EMERGENCY_STOP, 0.0, max_profit_pct
+
+    # Enforce minimum holding time for NON-emergency exits
+    if holding_s < min_holding_s:
+        return False, CLOSE_MIN_HOLDING, 0.0, max_profit_pct
+
+    pnl_pct = unrealized_pnl / position_value * 100.0 if position_value > 0 else 0.0
+
+    if pnl_pct >= 0.2:
+        return True, CLOSE_QUICK_PROFIT, pnl_pct, max_profit_pct
+
+    if pnl_pct >= 0.0 and holding_s >= 120.0:
+        return True, CLOSE_BREAKEVEN, pnl_pct, max_profit_pct
+
+    # Trailing stop: armed at 0.3% profit, trails by 0.15%
+    if pnl_pct >= 0.3:
+        if math.isnan(max_profit_pct):
+            max_profit_pct = pnl_pct
+        else:
+            max_profit_pct = max(max_profit_pct, pnl_pct)
+
+        if pnl_pct < max_profit_pct - 0.15:
+            return True, CLOSE_TRAILING_STOP, pnl_pct, max_profit_pct
+
+    if pnl_pct <= -0.3:
+        return True, CLOSE_PNL_PCT_STOP, pnl_pct, max_profit_pct
+
+    if abs(zscore) > sl_thr:
+        return True, CLOSE_ZSCORE_STOP, pnl_pct, max_profit_pct
+
+    if abs(zscore) < exit_thr:
+        return True, CLOSE_MEAN_REVERSION, pnl_pct, max_profit_pct
+
+    if holding_s > max_holding_s:
+        return True, CLOSE_MAX_HOLDING, pnl_pct, max_profit_pct
+
+    # Stop-loss at -0.5% of position value
+    if unrealized_pnl != 0.0 and unrealized_pnl < -position_value * 0.005:
+        return True, CLOSE_PNL_STOP, pnl_pct, max_profit_pct
+
+    return False, CLOSE_NONE, pnl_pct, max_profit_pct
+
+
+@njit(cache=True)
+def hurst_score(spread):
+    """
+    Mean reversion score from the Hurst exponent of a spread
+
+    Same estimator as src.strategy.zscore.detect_mean_reversion_strength:
+    sample std of lagged differences (NaNs skipped), log-log slope, and
+    (0.5 - H) * 2 clipped to [0, 1]; 0.0 when undefined.
+    """
+    n = spread.size
+    if n < 100:
+        return 0.0
+
+    max_lag = min(100, n // 2)
+    k = max_lag - 2
+    if k < 2:
+        return 0.0
+
+    log_lags = np.empty(k)
+    log_tau = np.empty(k)
+    for i in range(k):
+        lag = i + 2
+        diff = spread[lag:] - spread[:-lag]
+        diff = diff[~np.isnan(diff)]
+        m = diff.size
+        if m < 2:
+            return 0.0
+        centered = diff - diff.mean()
+        tau = math.sqrt((centered * centered).sum() / (m - 1))
+        if tau <= 0.0:
+            return 0.0
+        log_lags[i] = math.log(lag)
+        log_tau[i] = math.log(tau)
+
+    x = log_lags - log_lags.mean()
+    hurst = (x * (log_tau - log_tau.mean())).sum() / (x * x).sum()
+
+    if hurst < 0.5:
+        return min(max((0.5 - hurst) * 2.0, 0.0), 1.0)
+    return 0.0
+
+
+@njit(cache=True)
+def quant_core(spread, mr_score, is_coint, has_pos, entry_thr, exit_thr, sl_thr):
+    """
+    Per-tick numeric core of QuantAgent.analyze_pair
+
+    From the spread: current value, its z-score against all prior values,
+    the whole-spread mean/std (sample, NaNs skipped), then the recommendation.
+
+    Returns:
+        (current, zscore, mean, std, n_history, action code, reason code, confidence)
+    """
+    current = spread[-1]
+    history = spread[:-1]
+    history = history[~np.isnan(history)]
+
+    # Sums are taken around the first value so the variance doesn't cancel
+    # catastrophically for spreads far from zero
+    n = history.size
+    shift = history[0] if n else 0.0
+    centered = history - shift
+    total = centered.sum()
+    total_sq = (centered * centered).sum()
+    n_history = n
+
+    zscore = 0.0
+    if n >= 30:
+        mean_prev = shift + total / n
+        var_prev = max((total_sq - total * total / n) / (n - 1), 0.0)
+        std_prev = math.sqrt(var_prev)
+        if std_prev > 0.0:
+            z = (current - mean_prev) / std_prev
+            if not (math.isnan(z) or math.isinf(z)):
+                zscore = z
+
+    if not math.isnan(current):
+        n += 1
+        total += current - shift
+        total_sq += (current - shift) ** 2
+
+    mean = math.nan
+    std = math.nan
+    if n > 0:
+        mean = shift + total / n
+        if n > 1:
+            std = math.sqrt(max((total_sq - total * total / n) / (n - 1), 0.0))
+
+    action, reason, confidence = decide(zscore, mr_score, is_coint, has_pos, entry_thr, exit_thr, sl_thr)
+    return current, zscore, mean, std, n_history, action, reason, confidence
@@ -1,21 +1,92 @@
 """Orchestrator agent - coordinates all other agents"""
 
 import asyncio
+import sys
+from dataclasses import asdict, dataclass, field, fields
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import logging
+import numpy as np
 import pandas as pd
 
-from src.agents.quant_agent import QuantAgent
+from src.agents.quant_agent import AnalysisResult, QuantAgent
 from src.agents.sentiment_agent import SentimentAgent
 from src.agents.risk_agent import RiskAgent
 from src.strategy.strategy_manager import StrategyManager
-from src.data.models import Signal, Position, TradeSignal
+from src.data.models import Signal, Position, PositionSide, TradeSignal
 from src.data.bybit_client import get_bybit_client
 from src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Fixed action domain for agent voting
+_ACTIONS = ('HOLD', 'LONG_SPREAD', 'SHORT_SPREAD', 'CLOSE', 'AVOID')
+_ACTION_IDX = {a: i for i, a in enumerate(_ACTIONS)}
+_N_ACTIONS = len(_ACTIONS)
+
+# Stand-in for SentimentAgent output while sentiment analysis is disabled
+_DISABLED_SENTIMENT = SimpleNamespace(summary="Sentiment analysis disabled", sentiment_score=0.0)
+
+# QuantAgent takes lowercase position labels
+_QUANT_POSITION_LABELS = {'LONG_SPREAD': 'long_spread', 'SHORT_SPREAD': 'short_spread'}
+
+
+@dataclass(slots=True)
+class Decision:
+    """
+    Trading decision produced by the orchestrator
+
+    Supports the dict-style access (decision['action'], decision.get(...),
+    'pair' in decision) existing consumers use; optional fields that are
+    still None read as absent.
+    """
+    action: str
+    reason: str
+    confidence: float
+    timestamp: datetime
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    pair: Optional[Dict[str, Any]] = None
+    strategy: Optional[str] = None
+    symbol_a: Optional[str] = None
+    symbol_b: Optional[str] = None
+    pair_id: Optional[str] = None
+    position_size_a: Optional[float] = None
+    position_size_b: Optional[float] = None
+    hedge_ratio: Optional[float] = None
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, None)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return getattr(self, key, None) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def keys(self) -> List[str]:
+        return [f.name for f in fields(self) if getattr(self, f.name) is not None]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with the absent optional fields dropped"""
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+
+def _coint_fields(quant_analysis: AnalysisResult) -> tuple:
+    """Unpack (pvalue, hedge_ratio, half_life, is_cointegrated, zscore) from a quant analysis"""
+    coint = quant_analysis.cointegration
+    zscore = quant_analysis.zscore.zscore if quant_analysis.zscore is not None else 0
+    if coint is None:
+        return 1.0, 1.0, None, False, zscore
+    return coint.pvalue, coint.hedge_ratio, coint.half_life, coint.is_cointegrated, zscore
+
 
 class OrchestratorAgent:
     """
@@ -40,158 +111,20 @@ class OrchestratorAgent:
 
         self.min_consensus = self.orchestrator_config.get('min_agent_consensus', 2)
         self.enable_override = self.orchestrator_config.get('enable_override', True)
+        self._long_side = PositionSide.LONG
 
-        logger.info("Orchestrator initialized with multi-strategy support")
-
-    async def make_decision(
-        self,
-        symbol_a: str,
-        symbol_b: str,
-        price_history_a: pd.Series,
-        price_history_b: pd.Series,
-        current_positions: List[Position],
-        account_balance: float,
-        daily_pnl: float
-    ) -> Dict[str, Any]:
-        """
-        Make trading decision for a pair
+        # Caps concurrent pair evaluations so a large pair list doesn't burst
+        # past Bybit's REST rate limits
+        self.max_parallel_pairs = self.orchestrator_config.get('max_parallel_pairs', 8)
+        self._pair_semaphore = asyncio.Semaphore(self.max_parallel_pairs)
 
-        Returns:
-            Decision dictionary with action, reason, and metadata
-        """
-        try:
-            pair_id = f"{symbol_a}_{symbol_b}"
-            logger.info(f"Making decision for {pair_id}...")
-
-            # Check if we have a current position for this pair
-            current_position = None
-            for pos in current_positions:
-                if pos.pair_id == pair_id:
-                    current_position = pos
-                    break
-
-            # 1. Get quantitative analysis from multiple strategies
-            logger.debug("Running multi-strategy analysis...")
-
-            # Run old quant agent for cointegration data
-            quant_analysis = await self.quant_agent.analyze_pair(
-                symbol_a=symbol_a,
-                symbol_b=symbol_b,
-                price_history_a=price_history_a,
-                price_history_b=price_history_b,
-                current_position='long_spread' if current_position and current_position.side_a.value == 'Long' else
-                                'short_spread' if current_position else None
-            )
-
-            # Fetch order book data for OBI strategy
-            orderbook_a = self.client.get_orderbook(symbol_a)
-            orderbook_b = self.client.get_orderbook(symbol_b)
-
-            # Run new multi-strategy system
-            strategy_signal = await self.strategy_manager.generate_aggregated_signal(
-                prices_a=price_history_a,
-                prices_b=price_history_b,
-                pair_id=pair_id,
-                current_position='LONG_SPREAD' if current_position and current_position.side_a.value == 'Long' else
-                               'SHORT_SPREAD' if current_position else None,
-                orderbook_a=orderbook_a,
-                orderbook_b=orderbook_b
-            )
-
-            logger.info(f"Multi-strategy signal: {strategy_signal.action} "
-                       f"(confidence: {strategy_signal.confidence:.2f}, consensus: {strategy_signal.consensus})")
-
-            # Use strategy manager signal if it's strong/moderate, fallback to quant for weak signals
-            if strategy_signal.consensus in ['STRONG', 'MODERATE'] and strategy_signal.action != 'HOLD':
-                quant_recommendation = {
-                    'action': strategy_signal.action,
-                    'confidence': strategy_signal.confidence,
-                    'reason': f"Multi-strategy {strategy_signal.consensus} consensus: {strategy_signal.action}"
-                }
-            elif quant_analysis.get('recommendation'):
-                quant_recommendation = quant_analysis['recommendation']
-            else:
-                return self._make_decision_response('HOLD', 'Insufficient data from all strategies', 0.0)
+        # Bars of price history handed to analysis per symbol (None = all)
+        self.price_lookback = self.orchestrator_config.get('price_lookback')
 
-            # 2. Get sentiment analysis (DISABLED)
-            logger.debug("Sentiment analysis disabled by user request")
-            sentiment_score = 0.0
-            sentiment_data = type('obj', (object,), {'summary': 'Sentiment disabled', 'sentiment_score': 0.0})
+        # Latest quant analysis per pair, keyed by a fingerprint of its inputs
+        self._quant_cache: Dict[str, tuple] = {}
 
-            # 3. Check for major events (DISABLED)
-            # Skipping major events check - trading on pure statistics
-
-            # 4. Get risk management input
-            logger.debug("Running risk assessment...")
-
-            # First check general risk limits
-            is_safe, violations = self.risk_agent.check_risk_limits(
-                current_positions,
-                daily_pnl,
-                account_balance
-            )
-
-            if not is_safe:
-                logger.warning(f"Risk violations: {violations}")
-                if current_position:
-                    # We might need to close positions to reduce risk
-                    return self._make_decision_response(
-                        'CLOSE',
-                        f'Risk limit: {violations[0]}',
-                        1.0
-                    )
-                else:
-                    return self._make_decision_response(
-                        'HOLD',
-                        f'Risk limit: {violations[0]}',
-                        1.0
-                    )
-
-            # 5. Combine agent recommendations
-            decision = self._combine_agent_decisions(
-                quant_recommendation=quant_recommendation,
-                sentiment_score=sentiment_score,
-                sentiment_data=sentiment_data,
-                current_position=current_position,
-                quant_analysis=quant_analysis
-            )
-
-            # 6. Final risk check for the proposed action
-            risk_recommendation = self.risk_agent.get_recommendation(
-                signal_action=decision['action'],
-                current_positions=current_positions,
-                account_balance=account_balance,
-                daily_pnl=daily_pnl
-            )
-
-            if risk_recommendation['action'] != 'APPROVE':
-                return self._make_decision_response(
-                    risk_recommendation['action'],
-                    risk_recommendation['reason'],
-                    risk_recommendation['confidence']
-                )
-
-            # 7. Calculate position size if opening a position
-            if decision['action'] in ['LONG_SPREAD', 'SHORT_SPREAD']:
-                size_a, size_b = self.risk_agent.calculate_position_size(
-                    pair_id=pair_id,
-                    account_balance=account_balance,
-                    signal_confidence=decision['confidence']
-                )
-                decision['position_size_a'] = size_a
-                decision['position_size_b'] = size_b
-                decision['hedge_ratio'] = quant_analysis['cointegration']['hedge_ratio']
-
-            logger.info(
-                f"Decision for {pair_id}: {decision['action']} "
-                f"(confidence: {decision['confidence']:.2f})"
-            )
-
-            return decision
-
-        except Exception as e:
-            logger.error(f"Error making decision: {e}")
-            return self._make_decision_response('HOLD', f'Error: {str(e)}', 0.0)
+        logger.info("Orchestrator initialized with multi-strategy support")
 
     def _combine_agent_decisions(
         self,
@@ -199,8 +132,9 @@ class OrchestratorAgent:
         sentiment_score: float,
         sentiment_data: Any,
         current_position: Optional[Position],
-        quant_analysis: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        quant_analysis: AnalysisResult,
+        now: Optional[datetime] = None
+    ) -> Decision:
         """
         Combine recommendations from all agents
 
@@ -220,68 +154,54 @@ class OrchestratorAgent:
             current_position
         )
 
-        # Collect votes
-        votes = {
-            'quant': {
-                'action': quant_action,
-                'confidence': quant_confidence,
-                'reason': quant_recommendation['reason']
-            },
-            'sentiment': {
-                'action': sentiment_action['action'],
-                'confidence': sentiment_action['confidence'],
-                'reason': sentiment_action['reason']
-            }
-        }
-
-        # Count votes for each action
-        action_votes = {}
-        for agent, vote in votes.items():
-            action = vote['action']
-            if action not in action_votes:
-                action_votes[action] = {
-                    'count': 0,
-                    'total_confidence': 0.0,
-                    'agents': []
-                }
-
-            action_votes[action]['count'] += 1
-            action_votes[action]['total_confidence'] += vote['confidence']
-            action_votes[action]['agents'].append(agent)
-
-        # Find action with most votes
-        best_action = max(action_votes.items(), key=lambda x: (x[1]['count'], x[1]['total_confidence']))
-        action = best_action[0]
-        action_data = best_action[1]
+        # Tally votes into fixed per-action slots (voter order: quant, sentiment)
+        voters = (
+            ('quant', _ACTION_IDX[quant_action], quant_confidence),
+            ('sentiment', _ACTION_IDX[sentiment_action['action']], sentiment_action['confidence'])
+        )
+        counts = [0] * _N_ACTIONS
+        confs = [0.0] * _N_ACTIONS
+        for _, idx, vote_confidence in voters:
+            counts[idx] += 1
+            confs[idx] += vote_confidence
+
+        # Find action with most votes (ties go to the earlier voter)
+        best = voters[0][1]
+        for _, idx, _ in voters[1:]:
+            if counts[idx] > counts[best] or (counts[idx] == counts[best] and confs[idx] > confs[best]):
+                best = idx
+        action = _ACTIONS[best]
 
         # Calculate overall confidence
-        confidence = action_data['total_confidence'] / len(votes)
+        confidence = confs[best] / len(voters)
 
         # Build reason
-        agent_list = ', '.join(action_data['agents'])
-        reason = f"Consensus ({action_data['count']}/{len(votes)} agents: {agent_list})"
+        agent_list = ', '.join(agent for agent, idx, _ in voters if idx == best)
+        reason = f"Consensus ({counts[best]}/{len(voters)} agents: {agent_list})"
 
         # Add specific details
         if quant_action == action:
-            reason += f" | Quant: {votes['quant']['reason']}"
+            reason += f" | Quant: {quant_recommendation['reason']}"
         if sentiment_action['action'] == action:
-            reason += f" | Sentiment: {votes['sentiment']['reason']}"
+            reason += f" | Sentiment: {sentiment_action['reason']}"
+
+        pvalue, hedge_ratio, half_life, is_cointegrated, zscore = _coint_fields(quant_analysis)
 
         return self._make_decision_response(
             action=action,
             reason=reason,
             confidence=confidence,
             metadata={
-                'votes': votes,
                 'sentiment_score': sentiment_score,
                 'sentiment_summary': sentiment_data.summary,
-                'zscore': quant_analysis['zscore']['zscore'] if quant_analysis.get('zscore') else 0,
-                'pvalue': quant_analysis['cointegration']['pvalue'] if quant_analysis.get('cointegration') else 1.0,
-                'hedge_ratio': quant_analysis['cointegration']['hedge_ratio'] if quant_analysis.get('cointegration') else 1.0,
-                'half_life': quant_analysis['cointegration'].get('half_life') if quant_analysis.get('cointegration') else None,
-                'mean_reversion_score': quant_analysis.get('mean_reversion_score', 0),
-                'is_cointegrated': quant_analysis['cointegration']['is_cointegrated'] if quant_analysis.get('cointegration') else False
-            }
+                'zscore': zscore,
+                'pvalue': pvalue,
+                'hedge_ratio': hedge_ratio,
+                'half_life': half_life,
+                'mean_reversion_score': quant_analysis.mean_reversion_score,
+                'is_cointegrated': is_cointegrated
+            },
+            now=now
         )
 
     def _sentiment_to_action(
@@ -341,16 +261,127 @@ class OrchestratorAgent:
         action: str,
         reason: str,
         confidence: float,
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """Create standardized decision response"""
-        return {
-            'action': action,
-            'reason': reason,
-            'confidence': confidence,
-            'timestamp': datetime.now(),
-            'metadata': metadata or {}
-        }
+        metadata: Optional[Dict[str, Any]] = None,
+        now: Optional[datetime] = None
+    ) -> Decision:
+        """
+        Create standardized decision response
+
+        Batch callers pass one shared `now` so every decision in a tick carries
+        the same timestamp; direct callers get the current time.
+        """
+        return Decision(
+            action=action,
+            reason=reason,
+            confidence=confidence,
+            timestamp=now or datetime.now(),
+            metadata=metadata or {}
+        )
+
+    def _position_label(self, position: Optional[Position]) -> Optional[str]:
+        """Spread direction of an open position ('LONG_SPREAD'/'SHORT_SPREAD'), or None"""
+        if position is None:
+            return None
+        return 'LONG_SPREAD' if position.side_a is self._long_side else 'SHORT_SPREAD'
+
+    @staticmethod
+    def _pair_id(symbol_a: str, symbol_b: str) -> str:
+        """Build the interned pair identifier used as a key across agents"""
+        return sys.intern(f"{symbol_a}_{symbol_b}")
+
+    @staticmethod
+    def _index_positions(current_positions: List[Position]) -> Dict[str, Position]:
+        """Map pair_id -> position, keeping the first position per pair like a linear scan"""
+        return {pos.pair_id: pos for pos in reversed(current_positions)}
+
+    @staticmethod
+    def _series_key(series: pd.Series) -> tuple:
+        """Cheap fingerprint of a price series: length, last timestamp, last two values"""
+        n = len(series)
+        if n == 0:
+            return (0,)
+        return (n, series.index[-1], series.iloc[-1], series.iloc[-2] if n > 1 else None)
+
+    async def _analyze_pair_cached(
+        self,
+        symbol_a: str,
+        symbol_b: str,
+        price_history_a: pd.Series,
+        price_history_b: pd.Series,
+        current_position: Optional[str],
+        pair_id: Optional[str] = None
+    ) -> AnalysisResult:
+        """
+        Run quant analysis, reusing the last result when the inputs are unchanged
+
+        make_decision and make_all_strategy_decisions both analyze the same
+        pair on a tick; only the first one pays for the cointegration tests.
+        """
+        if pair_id is None:
+            pair_id = self._pair_id(symbol_a, symbol_b)
+        key = (
+            current_position,
+            self._series_key(price_history_a),
+            self._series_key(price_history_b)
+        )
+
+        cached = self._quant_cache.get(pair_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        analysis = await self.quant_agent.analyze_pair(
+            symbol_a=symbol_a,
+            symbol_b=symbol_b,
+            price_history_a=price_history_a,
+            price_history_b=price_history_b,
+            current_position=current_position
+        )
+        self._quant_cache[pair_id] = (key, analysis)
+        return analysis
+
+    async def _bounded(self, coro):
+        """Await a coroutine while holding a slot of the pair semaphore"""
+        async with self._pair_semaphore:
+            return await coro
+
+    async def _get_orderbook(self, symbol: str, prefetched: Optional[Dict] = None) -> Optional[Dict]:
+        """Return the prefetched order book, or fetch it off the event loop"""
+        if prefetched is not None:
+            return prefetched
+        return await asyncio.to_thread(self.client.get_orderbook, symbol)
+
+    def _price_windows(
+        self,
+        price_data: Dict[str, pd.Series],
+        symbols: set
+    ) -> Dict[str, pd.Series]:
+        """Slice each symbol's analysis window once per batch, shared by every pair it is in"""
+        if not self.price_lookback:
+            return {symbol: price_data[symbol] for symbol in symbols}
+        lookback = self.price_lookback
+        return {symbol: price_data[symbol].iloc[-lookback:] for symbol in symbols}
+
+    async def _prefetch_orderbooks(self, symbols) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch order books for all symbols concurrently
+
+        Each symbol is fetched once even when it appears in several pairs.
+        A failed fetch maps to an empty book, which the OBI strategy treats as
+        missing data, so make_decision does not retry it synchronously.
+        """
+        symbols = list(symbols)
+        results = await asyncio.gather(
+            *(self._bounded(asyncio.to_thread(self.client.get_orderbook, symbol)) for symbol in symbols),
+            return_exceptions=True
+        )
+
+        orderbooks = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.warning("Order book fetch failed for %s: %s", symbol, result)
+                result = {}
+            orderbooks[symbol] = result
+        return orderbooks
 
     async def batch_make_decisions(
         self,
@@ -360,7 +391,7 @@ class OrchestratorAgent:
         current_positions: List[Position],
         account_balance: float,
         daily_pnl: float
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Decision]:
         """
         Make decisions for multiple pairs concurrently
 
@@ -368,38 +399,67 @@ class OrchestratorAgent:
             List of decisions
         """
         tasks = []
-        pairs_list = []
-
-        for pair in pairs:
-            if not pair.get('enabled', True):
-                continue
-
+        pairs_list = [
+            pair for pair in pairs
+            if pair.get('enabled', True)
+            and pair['symbol_a'] in price_data and pair['symbol_b'] in price_data
+        ]
+
+        # With no open positions an account-level risk breach pauses every
+        # pair, so answer the whole batch from one check
+        if not current_positions:
+            is_safe, violations = await asyncio.to_thread(
+                self.risk_agent.check_risk_limits,
+                current_positions,
+                daily_pnl,
+                account_balance
+            )
+            if not is_safe:
+                logger.warning("Risk violations, pausing all pairs: %s", violations)
+                batch_ts = datetime.now()
+                reason = f"Risk violations: {'; '.join(violations)}"
+                decisions = []
+                for pair in pairs_list:
+                    decision = self._make_decision_response('PAUSE', reason, 1.0, now=batch_ts)
+                    decision.pair = pair
+                    decisions.append(decision)
+                return decisions
+
+        # Fetch every order book once up front instead of twice per pair
+        symbols = {s for pair in pairs_list for s in (pair['symbol_a'], pair['symbol_b'])}
+        orderbooks = await self._prefetch_orderbooks(symbols)
+        price_windows = self._price_windows(price_data, symbols)
+        positions_by_pair = self._index_positions(current_positions)
+        batch_ts = datetime.now()
+
+        for pair in pairs_list:
             symbol_a = pair['symbol_a']
             symbol_b = pair['symbol_b']
 
-            if symbol_a not in price_data or symbol_b not in price_data:
-                continue
-
             task = self.make_decision(
                 symbol_a=symbol_a,
                 symbol_b=symbol_b,
-                price_history_a=price_data[symbol_a],
-                price_history_b=price_data[symbol_b],
+                price_history_a=price_windows[symbol_a],
+                price_history_b=price_windows[symbol_b],
                 candle_history_a=candle_data.get(symbol_a),  # Pass candles
                 candle_history_b=candle_data.get(symbol_b),  # Pass candles
                 current_positions=current_positions,
                 account_balance=account_balance,
-                daily_pnl=daily_pnl
+                daily_pnl=daily_pnl,
+                orderbook_a=orderbooks[symbol_a],
+                orderbook_b=orderbooks[symbol_b],
+                positions_by_pair=positions_by_pair,
+                pair_id=self._pair_id(symbol_a, symbol_b),
+                now=batch_ts
             )
             tasks.append(task)
-            pairs_list.append(pair)
 
-        results = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*(self._bounded(task) for task in tasks))
         
         # Attach pair info to decisions
         decisions = []
         for decision, pair in zip(results, pairs_list):
-            decision['pair'] = pair
+            decision.pair = pair
             decisions.append(decision)
             
         return decisions
@@ -410,55 +470,65 @@ class OrchestratorAgent:
         symbol_b: str,
         price_history_a: pd.Series,
         price_history_b: pd.Series,
-        candle_history_a: Optional[pd.DataFrame],  # Added
-        candle_history_b: Optional[pd.DataFrame],  # Added
         current_positions: List[Position],
         account_balance: float,
-        daily_pnl: float
-    ) -> Dict[str, Any]:
+        daily_pnl: float,
+        candle_history_a: Optional[pd.DataFrame] = None,
+        candle_history_b: Optional[pd.DataFrame] = None,
+        orderbook_a: Optional[Dict] = None,
+        orderbook_b: Optional[Dict] = None,
+        positions_by_pair: Optional[Dict[str, Position]] = None,
+        pair_id: Optional[str] = None,
+        now: Optional[datetime] = None
+    ) -> Decision:
         """
         Make trading decision for a pair
 
+        Order books, the pair_id -> position index and the pair_id prepared by
+        the batch caller are used as-is; otherwise they are built here.
+
         Returns:
             Decision dictionary with action, reason, and metadata
         """
         try:
-            pair_id = f"{symbol_a}_{symbol_b}"
-            logger.info(f"Making decision for {pair_id}...")
+            if pair_id is None:
+                pair_id = self._pair_id(symbol_a, symbol_b)
+            logger.info("Making decision for %s...", pair_id)
 
             # Check if we have a current position for this pair
-            current_position = None
-            for pos in current_positions:
-                if pos.pair_id == pair_id:
-                    current_position = pos
-                    break
+            if positions_by_pair is None:
+                positions_by_pair = self._index_positions(current_positions)
+            current_position = positions_by_pair.get(pair_id)
+            position_label = self._position_label(current_position)
+            sm = self.strategy_manager
+            ra = self.risk_agent
 
             # 1. Get quantitative analysis from multiple strategies
             logger.debug("Running multi-strategy analysis...")
 
-            # Run old quant agent for cointegration data
-            quant_analysis = await self.quant_agent.analyze_pair(
-                symbol_a=symbol_a,
-                symbol_b=symbol_b,
-                price_history_a=price_history_a,
-                price_history_b=price_history_b,
-                current_position='long_spread' if current_position and current_position.side_a.value == 'Long' else
-                                'short_spread' if current_position else None
+            # Run old quant agent for cointegration data while any order books
+            # that weren't prefetched are fetched for the OBI strategy
+            quant_analysis, orderbook_a, orderbook_b = await asyncio.gather(
+                self._analyze_pair_cached(
+                    symbol_a=symbol_a,
+                    symbol_b=symbol_b,
+                    price_history_a=price_history_a,
+                    price_history_b=price_history_b,
+                    current_position=_QUANT_POSITION_LABELS.get(position_label),
+                    pair_id=pair_id
+                ),
+                self._get_orderbook(symbol_a, orderbook_a),
+                self._get_orderbook(symbol_b, orderbook_b)
             )
 
-            # Fetch order book data for OBI strategy
-            orderbook_a = self.client.get_orderbook(symbol_a)
-            orderbook_b = self.client.get_orderbook(symbol_b)
-
             # Run new multi-strategy system
-            strategy_signal = await self.strategy_manager.generate_aggregated_signal(
+            strategy_signal = await sm.generate_aggregated_signal(
                 prices_a=price_history_a,
                 prices_b=price_history_b,
                 candles_a=candle_history_a,  # Pass candles
                 candles_b=candle_history_b,  # Pass candles
                 pair_id=pair_id,
-                current_position='LONG_SPREAD' if current_position and current_position.side_a.value == 'Long' else
-                               'SHORT_SPREAD' if current_position else None,
+                current_position=position_label,
                 orderbook_a=orderbook_a,
                 orderbook_b=orderbook_b
             )
@@ -468,10 +538,7 @@ class OrchestratorAgent:
             #     symbol_b=symbol_b
             # )
             sentiment_score = 0.0  # Neutral
-            class DummySentimentData:
-                def __init__(self, summary):
-                    self.summary = summary
-            sentiment_data = DummySentimentData("Sentiment analysis disabled")
+            sentiment_data = _DISABLED_SENTIMENT
             
             # logger.info(f"Sentiment for {symbol_a}: {sentiment_score:.2f} ({sentiment_summary})")
 
@@ -488,12 +555,14 @@ class OrchestratorAgent:
                 sentiment_score=sentiment_score,
                 sentiment_data=sentiment_data,
                 current_position=current_position,
-                quant_analysis=quant_analysis
+                quant_analysis=quant_analysis,
+                now=now
             )
 
             # 6. Final risk check for the proposed action
-            risk_recommendation = self.risk_agent.get_recommendation(
-                signal_action=decision['action'],
+            risk_recommendation = await asyncio.to_thread(
+                ra.get_recommendation,
+                signal_action=decision.action,
                 current_positions=current_positions,
                 account_balance=account_balance,
                 daily_pnl=daily_pnl
@@ -503,40 +572,44 @@ class OrchestratorAgent:
                 return self._make_decision_response(
                     risk_recommendation['action'],
                     risk_recommendation['reason'],
-                    risk_recommendation['confidence']
+                    risk_recommendation['confidence'],
+                    now=now
                 )
 
             # 7. Calculate position size if opening a position
-            if decision['action'] in ['LONG_SPREAD', 'SHORT_SPREAD']:
-                size_a, size_b = self.risk_agent.calculate_position_size(
+            if decision.action in ['LONG_SPREAD', 'SHORT_SPREAD']:
+                size_a, size_b = await asyncio.to_thread(
+                    ra.calculate_position_size,
                     pair_id=pair_id,
                     account_balance=account_balance,
-                    signal_confidence=decision['confidence']
+                    signal_confidence=decision.confidence
                 )
-                decision['position_size_a'] = size_a
-                decision['position_size_b'] = size_b
-                decision['hedge_ratio'] = quant_analysis['cointegration']['hedge_ratio']
+                decision.position_size_a = size_a
+                decision.position_size_b = size_b
+                decision.hedge_ratio = quant_analysis.cointegration.hedge_ratio
 
             # Add top-level symbol info for robustness
-            decision['symbol_a'] = symbol_a
-            decision['symbol_b'] = symbol_b
-            decision['pair_id'] = pair_id
+            decision.symbol_a = symbol_a
+            decision.symbol_b = symbol_b
+            decision.pair_id = pair_id
 
             logger.info(
-                f"Decision for {pair_id}: {decision['action']} "
-                f"(confidence: {decision['confidence']:.2f})"
+                "Decision for %s: %s (confidence: %.2f)",
+                pair_id, decision.action, decision.confidence
             )
 
             return decision
 
         except Exception as e:
-            logger.error(f"Error making decision: {e}")
-            return self._make_decision_response('HOLD', f'Error: {str(e)}', 0.0)
+            logger.error("Error making decision: %s", e)
+            return self._make_decision_response('HOLD', f'Error: {str(e)}', 0.0, now=now)
 
     def clear_all_caches(self):
         """Clear all agent caches"""
         self.quant_agent.clear_cache()
         self.sentiment_agent.clear_cache()
+        self.strategy_manager.clear_cache()
+        self._quant_cache.clear()
         logger.info("All agent caches cleared")
 
     async def make_all_strategy_decisions(
@@ -547,8 +620,14 @@ class OrchestratorAgent:
         price_history_b: pd.Series,
         current_positions: List[Position],
         account_balance: float,
-        daily_pnl: float
-    ) -> List[Dict[str, Any]]:
+        daily_pnl: float,
+        orderbook_a: Optional[Dict] = None,
+        orderbook_b: Optional[Dict] = None,
+        positions_by_pair: Optional[Dict[str, Position]] = None,
+        pair_id: Optional[str] = None,
+        now: Optional[datetime] = None,
+        risk_checked: bool = False
+    ) -> List[Decision]:
         """
         Make trading decisions for ALL strategies independently (OR logic)
 
@@ -557,113 +636,139 @@ class OrchestratorAgent:
         This allows parallel execution of multiple strategies on the same pair
         """
         try:
-            pair_id = f"{symbol_a}_{symbol_b}"
-            logger.info(f"Getting individual strategy signals for {pair_id}...")
+            if pair_id is None:
+                pair_id = self._pair_id(symbol_a, symbol_b)
+            logger.info("Getting individual strategy signals for %s...", pair_id)
+            if now is None:
+                now = datetime.now()
 
             # Check if we have a current position for this pair
-            current_position = None
-            for pos in current_positions:
-                if pos.pair_id == pair_id:
-                    current_position = pos
-                    break
-
-            # Fetch order book data for OBI strategy
-            orderbook_a = self.client.get_orderbook(symbol_a)
-            orderbook_b = self.client.get_orderbook(symbol_b)
-
-            # Get quantitative analysis (for cointegration data)
-            quant_analysis = await self.quant_agent.analyze_pair(
-                symbol_a=symbol_a,
-                symbol_b=symbol_b,
-                price_history_a=price_history_a,
-                price_history_b=price_history_b,
-                current_position='long_spread' if current_position and current_position.side_a.value == 'Long' else
-                                'short_spread' if current_position else None
+            if positions_by_pair is None:
+                positions_by_pair = self._index_positions(current_positions)
+            current_position = positions_by_pair.get(pair_id)
+            position_label = self._position_label(current_position)
+            sm = self.strategy_manager
+            ra = self.risk_agent
+
+            # Quant analysis (for cointegration data), order books that weren't
+            # prefetched, and the account-level risk check are independent
+            quant_analysis, orderbook_a, orderbook_b, (is_safe, violations) = await asyncio.gather(
+                self._analyze_pair_cached(
+                    symbol_a=symbol_a,
+                    symbol_b=symbol_b,
+                    price_history_a=price_history_a,
+                    price_history_b=price_history_b,
+                    current_position=_QUANT_POSITION_LABELS.get(position_label),
+                    pair_id=pair_id
+                ),
+                self._get_orderbook(symbol_a, orderbook_a),
+                self._get_orderbook(symbol_b, orderbook_b),
+                # Batch callers already ran the account-level check once
+                asyncio.sleep(0, result=(True, [])) if risk_checked else asyncio.to_thread(
+                    ra.check_risk_limits,
+                    current_positions,
+                    daily_pnl,
+                    account_balance
+                )
             )
 
+            # Risk check first
+            if not is_safe:
+                logger.warning("Risk violations: %s", violations)
+                return []  # No trades if risk limits breached
+
             # Get ALL individual strategy signals (OR logic - no aggregation!)
-            strategy_signals = await self.strategy_manager.generate_all_individual_signals(
+            strategy_signals = await sm.generate_all_individual_signals(
                 prices_a=price_history_a,
                 prices_b=price_history_b,
                 pair_id=pair_id,
-                current_position='LONG_SPREAD' if current_position and current_position.side_a.value == 'Long' else
-                               'SHORT_SPREAD' if current_position else None,
+                current_position=position_label,
                 orderbook_a=orderbook_a,
                 orderbook_b=orderbook_b
             )
 
-            # Risk check first
-            is_safe, violations = self.risk_agent.check_risk_limits(
+            # Create a decision for EACH strategy signal
+            decisions = []
+            if not strategy_signals:
+                return decisions
+
+            names = list(strategy_signals)
+            signals = list(strategy_signals.values())
+            actions = np.array([signal['action'] for signal in signals])
+            confs = np.array([signal['confidence'] for signal in signals], dtype=np.float64)
+
+            # One risk evaluation for every candidate action, then one sizing
+            # pass for the approved openers
+            approved = await asyncio.to_thread(
+                ra.check_bulk,
+                actions,
                 current_positions,
-                daily_pnl,
-                account_balance
+                account_balance,
+                daily_pnl
             )
+            opens = approved & np.isin(actions, ('LONG_SPREAD', 'SHORT_SPREAD'))
+            sizes = np.zeros(len(signals))
+            if opens.any():
+                sizes[opens] = await asyncio.to_thread(
+                    ra.calculate_position_sizes,
+                    pair_id,
+                    account_balance,
+                    confs[opens]
+                )
 
-            if not is_safe:
-                logger.warning(f"Risk violations: {violations}")
-                return []  # No trades if risk limits breached
-
-            # Create a decision for EACH strategy signal
-            decisions = []
+            pvalue, hedge_ratio, half_life, is_cointegrated, zscore = _coint_fields(quant_analysis)
 
-            for strategy_name, signal in strategy_signals.items():
+            log_info = logger.isEnabledFor(logging.INFO)
+            for i, (strategy_name, signal) in enumerate(zip(names, signals)):
                 action = signal['action']
 
-                # Risk check for this specific action
-                risk_recommendation = self.risk_agent.get_recommendation(
-                    signal_action=action,
-                    current_positions=current_positions,
-                    account_balance=account_balance,
-                    daily_pnl=daily_pnl
-                )
-
-                if risk_recommendation['action'] != 'APPROVE':
-                    logger.info(f"{strategy_name}: {action} blocked by risk agent")
+                if not approved[i]:
+                    logger.info("%s: %s blocked by risk agent", strategy_name, action)
                     continue
 
-                # Calculate position size if opening a position
-                decision = {
-                    'action': action,
-                    'reason': f"{strategy_name}: {signal.get('details', {}).get('entry_reason', 'Signal')}",
-                    'confidence': signal['confidence'],
-                    'timestamp': datetime.now(),
-                    'strategy': strategy_name,
-                    'pair_id': pair_id,
-                    'symbol_a': symbol_a,
-                    'symbol_b': symbol_b,
-                    'metadata': {
+                decision = Decision(
+                    action=action,
+                    reason=f"{strategy_name}: {signal.get('details', {}).get('entry_reason', 'Signal')}",
+                    confidence=signal['confidence'],
+                    timestamp=now,
+                    strategy=strategy_name,
+                    pair_id=pair_id,
+                    symbol_a=symbol_a,
+                    symbol_b=symbol_b,
+                    metadata={
                         'strategy_name': strategy_name,
-                        'zscore': quant_analysis.get('zscore', {}).get('zscore', 0),
-                        'pvalue': quant_analysis.get('cointegration', {}).get('pvalue', 1.0),
-                        'hedge_ratio': quant_analysis.get('cointegration', {}).get('hedge_ratio', 1.0),
-                        'half_life': quant_analysis.get('cointegration', {}).get('half_life'),
-                        'is_cointegrated': quant_analysis.get('cointegration', {}).get('is_cointegrated', False)
+                        'zscore': zscore,
+                        'pvalue': pvalue,
+                        'hedge_ratio': hedge_ratio,
+                        'half_life': half_life,
+                        'is_cointegrated': is_cointegrated
                     }
-                }
+                )
 
-                if action in ['LONG_SPREAD', 'SHORT_SPREAD']:
-                    size_a, size_b = self.risk_agent.calculate_position_size(
-                        pair_id=pair_id,
-                        account_balance=account_balance,
-                        signal_confidence=signal['confidence']
-                    )
-                    decision['position_size_a'] = size_a
-                    decision['position_size_b'] = size_b
-                    decision['hedge_ratio'] = quant_analysis.get('cointegration', {}).get('hedge_ratio', 1.0)
+                if opens[i]:
+                    size = float(sizes[i])
+                    decision.position_size_a = size
+                    decision.position_size_b = size
+                    decision.hedge_ratio = hedge_ratio
 
                 decisions.append(decision)
 
-                logger.info(
-                    f"✓ {strategy_name}: {action} (confidence: {signal['confidence']:.2f})"
-                )
+                if log_info:
+                    logger.info(
+                        "%s: %s (confidence: %.2f)",
+                        strategy_name, action, signal['confidence']
+                    )
 
             if decisions:
-                logger.info(f"Generated {len(decisions)} decisions for {pair_id} from {len(strategy_signals)} strategy signals")
+                logger.info(
+                    "Generated %d decisions for %s from %d strategy signals",
+                    len(decisions), pair_id, len(strategy_signals)
+                )
 
             return decisions
 
         except Exception as e:
-            logger.error(f"Error making strategy decisions: {e}", exc_info=True)
+            logger.error("Error making strategy decisions: %s", e, exc_info=True)
             return []
 
     async def batch_make_all_strategy_decisions(
@@ -673,7 +778,7 @@ class OrchestratorAgent:
         current_positions: List[Position],
         account_balance: float,
         daily_pnl: float
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Decision]:
         """
         Make decisions for multiple pairs using OR logic (all strategies independently)
 
@@ -682,37 +787,64 @@ class OrchestratorAgent:
         """
         all_decisions = []
         tasks = []
-
-        for pair in pairs:
-            if not pair.get('enabled', True):
-                continue
-
+        active_pairs = [
+            pair for pair in pairs
+            if pair.get('enabled', True)
+            and pair['symbol_a'] in price_data and pair['symbol_b'] in price_data
+        ]
+
+        # The account-level risk check is the same for every pair; one breach
+        # means no strategy decisions anywhere
+        is_safe, violations = await asyncio.to_thread(
+            self.risk_agent.check_risk_limits,
+            current_positions,
+            daily_pnl,
+            account_balance
+        )
+        if not is_safe:
+            logger.warning("Risk violations: %s", violations)
+            return all_decisions
+
+        # Fetch every order book once up front instead of twice per pair
+        symbols = {s for pair in active_pairs for s in (pair['symbol_a'], pair['symbol_b'])}
+        orderbooks = await self._prefetch_orderbooks(symbols)
+        price_windows = self._price_windows(price_data, symbols)
+        positions_by_pair = self._index_positions(current_positions)
+        batch_ts = datetime.now()
+
+        for pair in active_pairs:
             symbol_a = pair['symbol_a']
             symbol_b = pair['symbol_b']
 
-            if symbol_a not in price_data or symbol_b not in price_data:
-                continue
-
             task = self.make_all_strategy_decisions(
                 symbol_a=symbol_a,
                 symbol_b=symbol_b,
-                price_history_a=price_data[symbol_a],
-                price_history_b=price_data[symbol_b],
+                price_history_a=price_windows[symbol_a],
+                price_history_b=price_windows[symbol_b],
                 current_positions=current_positions,
                 account_balance=account_balance,
-                daily_pnl=daily_pnl
+                daily_pnl=daily_pnl,
+                orderbook_a=orderbooks[symbol_a],
+                orderbook_b=orderbooks[symbol_b],
+                positions_by_pair=positions_by_pair,
+                pair_id=self._pair_id(symbol_a, symbol_b),
+                now=batch_ts,
+                risk_checked=True
             )
             tasks.append((pair, task))
 
         # Run all pairs in parallel
-        results = await asyncio.gather(*[task for _, task in tasks])
+        results = await asyncio.gather(*(self._bounded(task) for _, task in tasks))
 
         # Flatten results and add pair info
         for (pair, _), decisions in zip(tasks, results):
             for decision in decisions:
-                decision['pair'] = pair
+                decision.pair = pair
                 all_decisions.append(decision)
 
-        logger.info(f"Generated {len(all_decisions)} total strategy decisions across {len(pairs)} pairs")
+        logger.info(
+            "Generated %d total strategy decisions across %d pairs",
+            len(all_decisions), len(pairs)
+        )
 
         return all_decisions
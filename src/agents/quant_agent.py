@@ -1,18 +1,81 @@
 """Quantitative analysis agent"""
 
+import asyncio
+import math
+import os
+import threading
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Any
 from datetime import datetime
+from types import MappingProxyType
 import logging
 
 from src.data.models import Signal, CointegrationResult, ZScoreData
 from src.strategy.cointegration import CointegrationAnalyzer
-from src.strategy.zscore import ZScoreCalculator, detect_mean_reversion_strength
+from src.strategy.zscore import ZScoreCalculator
 from src.strategy.signals import SignalGenerator
 from src.config import config
+from src.agents import _decision_kernels as kernels
 
 logger = logging.getLogger(__name__)
 
+_RECOMMENDATION_REASONS = {
+    kernels.REASON_NOT_COINTEGRATED: 'Pair not cointegrated',
+    kernels.REASON_WEAK_MEAN_REVERSION: 'Weak mean reversion',
+    kernels.REASON_ZSCORE_STOP: 'Stop-loss: z-score {zscore:.2f}',
+    kernels.REASON_ZSCORE_HIGH: 'Z-score high: {zscore:.2f}',
+    kernels.REASON_ZSCORE_LOW: 'Z-score low: {zscore:.2f}',
+    kernels.REASON_REVERSION_COMPLETE: 'Mean reversion complete: z-score {zscore:.2f}',
+    kernels.REASON_ZSCORE_NEUTRAL: 'Z-score neutral: {zscore:.2f}',
+}
+
+# Recommendations whose reason needs no formatting are shared read-only
+# singletons; callers that want to mutate one must copy it with dict()
+_STATIC_RECOMMENDATIONS = {
+    (action, reason): MappingProxyType({
+        'action': kernels.ACTION_NAMES[action],
+        'reason': _RECOMMENDATION_REASONS[reason],
+        'confidence': confidence
+    })
+    for action, reason, confidence in (
+        (kernels.AVOID, kernels.REASON_NOT_COINTEGRATED, 0.0),
+        (kernels.CLOSE, kernels.REASON_NOT_COINTEGRATED, 0.0),
+        (kernels.AVOID, kernels.REASON_WEAK_MEAN_REVERSION, 0.2),
+    )
+}
+
+_INSUFFICIENT_DATA = MappingProxyType({
+    'action': 'AVOID',
+    'reason': 'Insufficient data',
+    'confidence': 0.0
+})
+
+_EMPTY_SPREAD_STATS = MappingProxyType({})
+
+@dataclass(slots=True)
+class AnalysisResult:
+    """
+    Result of QuantAgent.analyze_pair
+
+    Holds the result models as-is rather than a nested dict of their fields.
+    """
+    pair_id: str
+    timestamp: datetime
+    cointegration: Optional[CointegrationResult]
+    zscore: Optional[ZScoreData]
+    signal: Optional[Signal]
+    mean_reversion_score: float
+    spread_stats: Mapping[str, Any]
+    recommendation: Mapping[str, Any]
+
+
+# Pair analysis is blocking statsmodels/NumPy work; run it off the event loop
+_ANALYSIS_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="quant")
+
 
 class QuantAgent:
     """
@@ -30,9 +93,24 @@ class QuantAgent:
         self.zscore_calculator = ZScoreCalculator()
         self.signal_generator = SignalGenerator()
 
-        self.pair_states: Dict[str, Dict[str, Any]] = {}
+        self.pair_states: Dict[str, AnalysisResult] = {}
         self.last_analysis: Dict[str, datetime] = {}
 
+        # Cointegration result and the spread-derived values that depend only
+        # on it, keyed by a fingerprint of the price windows (LRU)
+        self._coint_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.coint_cache_size = 512
+        self._coint_cache_lock = threading.Lock()
+
+        self.refresh_config()
+
+    def refresh_config(self):
+        """Re-bind z-score thresholds from config (call after a config reload)"""
+        zscore_config = config.zscore
+        self._zc_entry = zscore_config.entry_threshold
+        self._zc_exit = zscore_config.exit_threshold
+        self._zc_sl = zscore_config.stoploss_threshold
+
     async def analyze_pair(
         self,
         symbol_a: str,
@@ -40,29 +118,98 @@ class QuantAgent:
         price_history_a: pd.Series,
         price_history_b: pd.Series,
         current_position: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> AnalysisResult:
         """
         Perform comprehensive quantitative analysis on a pair
 
         Returns:
-            Dictionary with analysis results
+            AnalysisResult
         """
+        return await asyncio.get_running_loop().run_in_executor(
+            _ANALYSIS_EXECUTOR,
+            self._analyze_pair_sync,
+            symbol_a,
+            symbol_b,
+            price_history_a,
+            price_history_b,
+            current_position
+        )
+
+    def _analyze_pair_sync(
+        self,
+        symbol_a: str,
+        symbol_b: str,
+        price_history_a: pd.Series,
+        price_history_b: pd.Series,
+        current_position: Optional[str] = None
+    ) -> AnalysisResult:
+        """Blocking body of analyze_pair, run on the analysis thread pool"""
+        now = datetime.now()
         try:
             pair_id = f"{symbol_a}_{symbol_b}"
-            logger.debug(f"Analyzing {pair_id}...")
+            logger.debug("Analyzing %s...", pair_id)
 
             if len(price_history_a) < 30 or len(price_history_b) < 30:
-                logger.warning(f"Insufficient data for {pair_id}")
-                return self._empty_analysis(pair_id)
+                logger.warning("Insufficient data for %s", pair_id)
+                return self._empty_analysis(pair_id, now)
+
+            # 1. Cointegration analysis (+ spread and its statistics), reused
+            # while both windows cover the same bars with the same last prices.
+            # The lookback window has a fixed length, so its first/last index
+            # values are what tell a moved window apart; non-finite prices
+            # skip the cache.
+            last_a = float(price_history_a.iloc[-1])
+            last_b = float(price_history_b.iloc[-1])
+            cached = None
+            key = None
+            if math.isfinite(last_a) and math.isfinite(last_b):
+                key = (
+                    symbol_a, symbol_b,
+                    len(price_history_a), len(price_history_b),
+                    price_history_a.index[0], price_history_a.index[-1],
+                    price_history_b.index[0], price_history_b.index[-1],
+                    last_a, last_b
+                )
+                with self._coint_cache_lock:
+                    cached = self._coint_cache.get(key)
+                    if cached is not None:
+                        self._coint_cache.move_to_end(key)
+            if cached is not None:
+                coint, spread_values, mean_reversion_score, spread_stats = cached
+            else:
+                coint = self.coint_analyzer.test_cointegration_incremental(
+                    pair_id,
+                    price_history_a,
+                    price_history_b
+                )
+
+                # 2. Calculate spread
+                spread = self.coint_analyzer.calculate_spread(
+                    price_history_a,
+                    price_history_b,
+                    coint[3]
+                )
+
+                spread_values = spread.to_numpy(dtype=np.float64)
+
+                # 4. Mean reversion strength
+                mean_reversion_score = kernels.hurst_score(spread_values)
+
+                # 5. Calculate additional metrics
+                spread_stats = self.zscore_calculator.calculate_spread_statistics(spread)
+
+                if key is not None:
+                    with self._coint_cache_lock:
+                        self._coint_cache[key] = (coint, spread_values, mean_reversion_score, spread_stats)
+                        if len(self._coint_cache) > self.coint_cache_size:
+                            self._coint_cache.popitem(last=False)
 
-            # 1. Cointegration analysis
-            is_coint, pvalue, test_stat, hedge_ratio, half_life = \
-                self.coint_analyzer.test_cointegration(price_history_a, price_history_b)
+            is_coint, pvalue, test_stat, hedge_ratio, half_life = coint
 
             coint_result = CointegrationResult(
                 symbol_a=symbol_a,
                 symbol_b=symbol_b,
-                timestamp=datetime.now(),
+                timestamp=now,
                 is_cointegrated=is_coint,
                 pvalue=pvalue,
                 test_statistic=test_stat,
@@ -72,34 +219,31 @@ class QuantAgent:
                 half_life=half_life
             )
 
-            # 2. Calculate spread
-            spread = self.coint_analyzer.calculate_spread(
-                price_history_a,
-                price_history_b,
-                hedge_ratio
-            )
-
-            # 3. Calculate z-score
-            current_spread = float(spread.iloc[-1])
-            zscore = self.zscore_calculator.calculate_current_zscore(
-                current_spread,
-                spread[:-1]
+            # 3. Z-score, spread mean/std and the recommendation in one compiled pass
+            (current_spread, zscore, spread_mean, spread_std, n_history,
+             action, reason, confidence) = kernels.quant_core(
+                spread_values,
+                mean_reversion_score,
+                bool(is_coint),
+                bool(current_position),
+                self._zc_entry,
+                self._zc_exit,
+                self._zc_sl
             )
+            if n_history < 30:
+                logger.warning("Insufficient data for z-score calculation")
 
             zscore_data = ZScoreData(
                 symbol_a=symbol_a,
                 symbol_b=symbol_b,
-                timestamp=datetime.now(),
+                timestamp=now,
                 spread=current_spread,
                 zscore=zscore,
-                mean=float(spread.mean()),
-                std=float(spread.std())
+                mean=spread_mean,
+                std=spread_std
             )
 
-            # 4. Mean reversion strength
-            mean_reversion_score = detect_mean_reversion_strength(spread)
-
-            # 5. Generate signal (without sentiment, that comes from sentiment agent)
+            # 6. Generate signal (without sentiment, that comes from sentiment agent)
             signal = self.signal_generator.generate_signal(
                 symbol_a=symbol_a,
                 symbol_b=symbol_b,
@@ -109,34 +253,26 @@ class QuantAgent:
                 sentiment_score=None  # Will be added by orchestrator
             )
 
-            # 6. Calculate additional metrics
-            spread_stats = self.zscore_calculator.calculate_spread_statistics(spread)
-
-            analysis = {
-                'pair_id': pair_id,
-                'timestamp': datetime.now(),
-                'cointegration': coint_result.dict(),
-                'zscore': zscore_data.dict(),
-                'signal': signal.dict() if signal else None,
-                'mean_reversion_score': mean_reversion_score,
-                'spread_stats': spread_stats,
-                'recommendation': self._get_recommendation(
-                    is_coint,
-                    zscore,
-                    mean_reversion_score,
-                    current_position
-                )
-            }
+            analysis = AnalysisResult(
+                pair_id=pair_id,
+                timestamp=now,
+                cointegration=coint_result,
+                zscore=zscore_data,
+                signal=signal,
+                mean_reversion_score=mean_reversion_score,
+                spread_stats=spread_stats,
+                recommendation=self._format_recommendation(action, reason, confidence, zscore)
+            )
 
             # Cache state
             self.pair_states[pair_id] = analysis
-            self.last_analysis[pair_id] = datetime.now()
+            self.last_analysis[pair_id] = now
 
             return analysis
 
         except Exception as e:
             logger.error(f"Error in quant analysis: {e}")
-            return self._empty_analysis(f"{symbol_a}_{symbol_b}")
+            return self._empty_analysis(f"{symbol_a}_{symbol_b}", now)
 
     def _get_recommendation(
         self,
@@ -144,89 +280,63 @@ class QuantAgent:
         zscore: float,
         mean_reversion_score: float,
         current_position: Optional[str]
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """
         Generate trading recommendation
 
         Returns:
             Dictionary with recommendation details
         """
-        if not is_cointegrated:
-            return {
-                'action': 'CLOSE' if current_position else 'AVOID',
-                'reason': 'Pair not cointegrated',
-                'confidence': 0.0
-            }
-
-        if mean_reversion_score < 0.3:
-            return {
-                'action': 'AVOID',
-                'reason': 'Weak mean reversion',
-                'confidence': 0.2
-            }
-
-        # Check z-score thresholds
-        zscore_config = config.zscore
-
-        if abs(zscore) > zscore_config.stoploss_threshold:
-            return {
-                'action': 'CLOSE',
-                'reason': f'Stop-loss: z-score {zscore:.2f}',
-                'confidence': 0.9
-            }
-
-        if zscore > zscore_config.entry_threshold:
-            return {
-                'action': 'SHORT_SPREAD',
-                'reason': f'Z-score high: {zscore:.2f}',
-                'confidence': min(0.9, (zscore - 2.0) * 0.3 + 0.5)
-            }
-
-        if zscore < -zscore_config.entry_threshold:
-            return {
-                'action': 'LONG_SPREAD',
-                'reason': f'Z-score low: {zscore:.2f}',
-                'confidence': min(0.9, (-zscore - 2.0) * 0.3 + 0.5)
-            }
-
-        if abs(zscore) < zscore_config.exit_threshold and current_position:
-            return {
-                'action': 'CLOSE',
-                'reason': f'Mean reversion complete: z-score {zscore:.2f}',
-                'confidence': 0.7
-            }
-
+        action, reason, confidence = kernels.decide(
+            float(zscore),
+            float(mean_reversion_score),
+            bool(is_cointegrated),
+            bool(current_position),
+            self._zc_entry,
+            self._zc_exit,
+            self._zc_sl
+        )
+
+        return self._format_recommendation(action, reason, confidence, zscore)
+
+    @staticmethod
+    def _format_recommendation(
+        action: int,
+        reason: int,
+        confidence: float,
+        zscore: float
+    ) -> Mapping[str, Any]:
+        """Map kernel action/reason codes to a recommendation dict"""
+        static = _STATIC_RECOMMENDATIONS.get((action, reason))
+        if static is not None:
+            return static
         return {
-            'action': 'HOLD',
-            'reason': f'Z-score neutral: {zscore:.2f}',
-            'confidence': 0.5
+            'action': kernels.ACTION_NAMES[action],
+            'reason': _RECOMMENDATION_REASONS[reason].format(zscore=zscore),
+            'confidence': confidence
         }
 
-    def _empty_analysis(self, pair_id: str) -> Dict[str, Any]:
+    def _empty_analysis(self, pair_id: str, now: Optional[datetime] = None) -> AnalysisResult:
         """Return empty analysis"""
-        return {
-            'pair_id': pair_id,
-            'timestamp': datetime.now(),
-            'cointegration': None,
-            'zscore': None,
-            'signal': None,
-            'mean_reversion_score': 0.0,
-            'spread_stats': {},
-            'recommendation': {
-                'action': 'AVOID',
-                'reason': 'Insufficient data',
-                'confidence': 0.0
-            }
-        }
+        return AnalysisResult(
+            pair_id=pair_id,
+            timestamp=now or datetime.now(),
+            cointegration=None,
+            zscore=None,
+            signal=None,
+            mean_reversion_score=0.0,
+            spread_stats=_EMPTY_SPREAD_STATS,
+            recommendation=_INSUFFICIENT_DATA
+        )
 
     async def analyze_multiple_pairs(
         self,
         pairs: List[Dict[str, Any]],
         price_data: Dict[str, pd.Series],
         current_positions: Dict[str, str]
-    ) -> List[Dict[str, Any]]:
-        """Analyze multiple pairs"""
-        analyses = []
+    ) -> List[AnalysisResult]:
+        """Analyze multiple pairs concurrently"""
+        tasks = []
 
         for pair in pairs:
             if not pair.get('enabled', True):
@@ -238,19 +348,24 @@ class QuantAgent:
             if symbol_a not in price_data or symbol_b not in price_data:
                 continue
 
-            analysis = await self.analyze_pair(
+            tasks.append(self.analyze_pair(
                 symbol_a=symbol_a,
                 symbol_b=symbol_b,
                 price_history_a=price_data[symbol_a],
                 price_history_b=price_data[symbol_b],
                 current_position=current_positions.get(f"{symbol_a}_{symbol_b}")
-            )
+            ))
 
-            analyses.append(analysis)
+        analyses = []
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error in quant analysis: {result}")
+                continue
+            analyses.append(result)
 
         return analyses
 
-    def get_pair_state(self, pair_id: str) -> Optional[Dict[str, Any]]:
+    def get_pair_state(self, pair_id: str) -> Optional[AnalysisResult]:
         """Get cached state for a pair"""
         return self.pair_states.get(pair_id)
 
@@ -258,3 +373,6 @@ class QuantAgent:
         """Clear cached states"""
         self.pair_states.clear()
         self.last_analysis.clear()
+        with self._coint_cache_lock:
+            self._coint_cache.clear()
+        self.coint_analyzer.clear_streams()
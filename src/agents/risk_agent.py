@@ -1,14 +1,57 @@
 """Risk management agent"""
 
-from typing import Dict, List, Optional, Any
+from collections import deque
+from typing import Deque, Dict, List, Mapping, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import logging
+import math
+import threading
+import time
+from types import MappingProxyType
+
+import numpy as np
 
 from src.data.models import Position, RiskMetrics
 from src.config import config
+from src.monitoring.performance_tracker import performance_tracker
+from src.agents import _decision_kernels as kernels
 
 logger = logging.getLogger(__name__)
 
+MIN_HOLDING_SECONDS = 30  # Quick in, quick out for HFT
+
+_MIN_HOLDING_REASON = "Holding time {held:.1f}s < {min_hold}s"
+
+_CLOSE_REASONS = {
+    kernels.CLOSE_EMERGENCY_STOP: "Emergency stop loss: ${pnl:.2f}",
+    kernels.CLOSE_MIN_HOLDING: _MIN_HOLDING_REASON,
+    kernels.CLOSE_QUICK_PROFIT: "Quick profit: {pnl_pct:.2f}% (held {held:.0f}s)",
+    kernels.CLOSE_BREAKEVEN: "Breakeven exit after {held:.0f}s",
+    kernels.CLOSE_TRAILING_STOP: "Trailing stop: {pnl_pct:.2f}% (max was {max_pct:.2f}%)",
+    kernels.CLOSE_PNL_PCT_STOP: "P&L stop-loss: {pnl_pct:.2f}%",
+    kernels.CLOSE_ZSCORE_STOP: "Stop-loss: z-score {zscore:.2f}",
+    kernels.CLOSE_MEAN_REVERSION: "Mean reversion: z-score {zscore:.2f}",
+    kernels.CLOSE_MAX_HOLDING: "Max holding period exceeded: {hours:.1f} hours",
+    kernels.CLOSE_PNL_STOP: "P&L stop-loss: ${pnl:.2f}",
+}
+
+
+# Fixed recommendations are shared read-only singletons; copy with dict()
+# before mutating
+_APPROVE = MappingProxyType({
+    'action': 'APPROVE',
+    'reason': 'Risk checks passed',
+    'confidence': 1.0
+})
+
+_MAX_POSITIONS_REACHED = MappingProxyType({
+    'action': 'HOLD',
+    'reason': 'Max positions reached',
+    'confidence': 1.0
+})
+
+_OPEN_ACTIONS = frozenset(('LONG_SPREAD', 'SHORT_SPREAD'))
+
 
 class RiskAgent:
     """
@@ -27,9 +70,29 @@ class RiskAgent:
         self.risk_config = config.get_trading_pairs()  # From YAML
 
         self.daily_pnl_history: List[float] = []
-        self.trade_history: List[Dict[str, Any]] = []
+        self.trade_history: Deque[Dict[str, Any]] = deque(maxlen=1000)
+        # Ring buffers mirroring trade_history for vectorized metrics
+        self._returns_arr = np.empty(1000, dtype=np.float64)
+        self._pnl_arr = np.empty(1000, dtype=np.float64)
+        self._n_recorded = 0
         self.max_equity: float = 0.0
         self.current_drawdown: float = 0.0
+        # Risk checks may run on worker threads (orchestrator offloads them)
+        self._drawdown_lock = threading.Lock()
+        # (fetched_at, stats) from performance_tracker, reused for a short TTL
+        # since session stats only change when a trade closes
+        self._stats_cache: Tuple[float, Dict[str, Any]] = (float('-inf'), {})
+        self.stats_cache_ttl = 2.0
+
+        self.refresh_config()
+
+    def refresh_config(self):
+        """Re-bind exit thresholds from config (call after a config reload)"""
+        zscore_config = config.zscore
+        self._zc_exit = zscore_config.exit_threshold
+        self._zc_sl = zscore_config.stoploss_threshold
+        max_holding_hours = config.yaml_config.get('strategy', {}).get('signals', {}).get('max_holding_period_hours', 24)
+        self._max_holding_s = timedelta(hours=max_holding_hours).total_seconds()
 
     def calculate_position_size(
         self,
@@ -47,26 +110,7 @@ class RiskAgent:
         - If Win Rate > 55% (min 5 trades): Increase size by 50-100%
         """
         try:
-            # Base position size from config
-            base_size = self.trading_config.max_position_size
-            
-            # --- DYNAMIC SIZING LOGIC ---
-            try:
-                from src.monitoring.performance_tracker import performance_tracker
-                stats = performance_tracker.get_session_stats()
-                win_rate = stats.get('win_rate', 0)
-                total_trades = stats.get('total_trades', 0)
-                
-                if total_trades >= 5:
-                    if win_rate >= 0.60:
-                        base_size *= 2.0  # Double size for excellent performance
-                        logger.info(f"🔥 HOT STREAK: Doubling position size! Win rate: {win_rate*100:.1f}%")
-                    elif win_rate >= 0.55:
-                        base_size *= 1.5  # 50% increase for good performance
-                        logger.info(f"✅ Good Performance: Increasing size by 50%. Win rate: {win_rate*100:.1f}%")
-            except Exception as e:
-                logger.warning(f"Could not get performance stats for dynamic sizing: {e}")
-            # ----------------------------
+            base_size = self._base_position_size()
 
             # Adjust for confidence (0.5 to 1.0 multiplier)
             confidence_multiplier = 0.5 + (signal_confidence * 0.5)
@@ -81,24 +125,24 @@ class RiskAgent:
             # Calculate risk per trade
             risk_amount = account_balance * self.trading_config.risk_per_trade
 
-            # Final position size
+            # Final position size, capped at 10x the risk amount and 20% of
+            # the account balance
             position_size = min(
                 base_size * confidence_multiplier * vol_multiplier,
-                risk_amount * 10  # Max 10x the risk amount
+                risk_amount * 10.0,
+                account_balance * 0.2
             )
 
-            # Ensure we don't exceed account balance
-            position_size = min(position_size, account_balance * 0.2)  # Max 20% per position
-            
             # Enforce minimum position size to meet exchange requirements
             # Bybit requires minimum 0.001 BTC (~$95-100 at current prices)
             # But with 1% risk and smaller base size, we need higher minimum
-            min_position_size = 500.0  # $500 minimum to ensure BTC orders work
-            position_size = max(position_size, min_position_size)
+            # ($500 minimum to ensure BTC orders work)
+            if position_size < 500.0:
+                position_size = 500.0
 
             logger.debug(
-                f"Position size for {pair_id}: ${position_size:.2f} "
-                f"(confidence: {signal_confidence:.2f}, vol_mult: {vol_multiplier:.2f})"
+                "Position size for %s: $%.2f (confidence: %.2f, vol_mult: %.2f)",
+                pair_id, position_size, signal_confidence, vol_multiplier
             )
 
             return position_size, position_size  # Equal sizes for both legs
@@ -107,6 +151,61 @@ class RiskAgent:
             logger.error(f"Error calculating position size: {e}")
             return 100.0, 100.0  # Minimum safe size
 
+    def _base_position_size(self) -> float:
+        """Base position size from config, scaled up on a winning session"""
+        base_size = self.trading_config.max_position_size
+
+        # --- DYNAMIC SIZING LOGIC ---
+        try:
+            t = time.monotonic()
+            if t - self._stats_cache[0] > self.stats_cache_ttl:
+                self._stats_cache = (t, performance_tracker.get_session_stats())
+            stats = self._stats_cache[1]
+            win_rate = stats.get('win_rate', 0)
+            total_trades = stats.get('total_trades', 0)
+
+            if total_trades >= 5:
+                if win_rate >= 0.60:
+                    base_size *= 2.0  # Double size for excellent performance
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("🔥 HOT STREAK: Doubling position size! Win rate: %.1f%%", win_rate * 100)
+                elif win_rate >= 0.55:
+                    base_size *= 1.5  # 50% increase for good performance
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("✅ Good Performance: Increasing size by 50%%. Win rate: %.1f%%", win_rate * 100)
+        except Exception as e:
+            logger.warning(f"Could not get performance stats for dynamic sizing: {e}")
+        # ----------------------------
+
+        return base_size
+
+    def calculate_position_sizes(
+        self,
+        pair_id: str,
+        account_balance: float,
+        signal_confidences: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_position_size for several signals on one pair
+
+        Returns one size per confidence (both legs are sized equally)
+        """
+        try:
+            base_size = self._base_position_size()
+            confidence_multiplier = 0.5 + np.asarray(signal_confidences, dtype=np.float64) * 0.5
+            risk_amount = account_balance * self.trading_config.risk_per_trade
+
+            cap = min(risk_amount * 10.0, account_balance * 0.2)
+            position_sizes = np.clip(base_size * confidence_multiplier, None, cap)
+            np.maximum(position_sizes, 500.0, out=position_sizes)
+
+            logger.debug("Position sizes for %s: %s", pair_id, position_sizes)
+            return position_sizes
+
+        except Exception as e:
+            logger.error(f"Error calculating position sizes: {e}")
+            return np.full(len(signal_confidences), 100.0)
+
     def check_risk_limits(
         self,
         current_positions: List[Position],
@@ -137,19 +236,31 @@ class RiskAgent:
         # 3. Check total exposure
         # Position sizes are in CONTRACTS (qty), so we must multiply by price to get USD value
         total_exposure = 0.0
-        for pos in current_positions:
+        n = len(current_positions)
+        if n:
+            sizes_a = np.fromiter((p.size_a for p in current_positions), dtype=np.float64, count=n)
+            sizes_b = np.fromiter((p.size_b for p in current_positions), dtype=np.float64, count=n)
+            current_a = np.fromiter((p.current_price_a for p in current_positions), dtype=np.float64, count=n)
+            current_b = np.fromiter((p.current_price_b for p in current_positions), dtype=np.float64, count=n)
+            entry_a = np.fromiter((p.entry_price_a for p in current_positions), dtype=np.float64, count=n)
+            entry_b = np.fromiter((p.entry_price_b for p in current_positions), dtype=np.float64, count=n)
+
             # Use current price if available, else entry price
-            price_a = pos.current_price_a if pos.current_price_a > 0 else pos.entry_price_a
-            price_b = pos.current_price_b if pos.current_price_b > 0 else pos.entry_price_b
-            
-            exposure_a = pos.size_a * price_a
-            exposure_b = pos.size_b * price_b
-            
-            total_exposure += (exposure_a + exposure_b)
-            
+            prices_a = np.where(current_a > 0, current_a, entry_a)
+            prices_b = np.where(current_b > 0, current_b, entry_b)
+
+            exposures_a = sizes_a * prices_a
+            exposures_b = sizes_b * prices_b
+            total_exposure = float(exposures_a.sum() + exposures_b.sum())
+
             # Debug log for large positions
-            if (exposure_a + exposure_b) > 100000:
-                logger.warning(f"Large position detected: {pos.pair_id} | A: {pos.size_a} * {price_a} = ${exposure_a:.2f} | B: {pos.size_b} * {price_b} = ${exposure_b:.2f}")
+            for i in np.flatnonzero(exposures_a + exposures_b > 100000):
+                pos = current_positions[i]
+                logger.warning(
+                    "Large position detected: %s | A: %s * %s = $%.2f | B: %s * %s = $%.2f",
+                    pos.pair_id, pos.size_a, prices_a[i], exposures_a[i],
+                    pos.size_b, prices_b[i], exposures_b[i]
+                )
 
         max_exposure = account_balance * 0.8  # Max 80% of balance
         if total_exposure > max_exposure:
@@ -158,10 +269,10 @@ class RiskAgent:
             )
 
         # 4. Check drawdown
-        self._update_drawdown(account_balance)
-        if self.current_drawdown > 0.20:  # 20% drawdown
+        drawdown = self._update_drawdown(account_balance)
+        if drawdown > 0.20:  # 20% drawdown
             violations.append(
-                f"High drawdown: {self.current_drawdown * 100:.1f}%"
+                f"High drawdown: {drawdown * 100:.1f}%"
             )
 
         is_safe = len(violations) == 0
@@ -172,94 +283,68 @@ class RiskAgent:
         position: Position,
         current_price_a: float,
         current_price_b: float,
-        current_zscore: float
+        current_zscore: float,
+        now: Optional[datetime] = None
     ) -> tuple[bool, str]:
         """
         Determine if a position should be closed
 
+        Batch callers checking many positions can pass one `now` for all of them.
+
         Returns:
             - should_close: bool
             - reason: str
         """
-        zscore_config = config.zscore
-        
-        # 0. MINIMUM HOLDING TIME - Prevent rapid open/close
-        holding_time_delta = datetime.now() - position.entry_time
-        holding_seconds = holding_time_delta.total_seconds()
-        MIN_HOLDING_SECONDS = 30  # Quick in, quick out for HFT
-        
-        # Emergency Stop Loss (Always active)
-        if position.unrealized_pnl and position.unrealized_pnl < -100:  # -$100 stop loss
-             return True, f"Emergency stop loss: ${position.unrealized_pnl:.2f}"
-
-        # Enforce minimum holding time for NON-emergency exits
-        if holding_seconds < MIN_HOLDING_SECONDS:
-            return False, f"Holding time {holding_seconds:.1f}s < {MIN_HOLDING_SECONDS}s"
-
-        # Calculate P&L percentage
-        position_value = position.size_a * position.entry_price_a
-        pnl_pct = (position.unrealized_pnl / position_value * 100) if position_value > 0 else 0.0
-        
-        # AGGRESSIVE EXIT: Take profit at 0.2% (covers fees + small profit)
-        if pnl_pct >= 0.2:  # Already checked holding_seconds >= 30 above
-            return True, f'Quick profit: {pnl_pct:.2f}% (held {holding_seconds:.0f}s)'
-        
-        # VERY AGGRESSIVE: Exit at breakeven if held > 2 minutes
-        if pnl_pct >= 0.0 and holding_seconds >= 120:
-            return True, f'Breakeven exit after {holding_seconds:.0f}s'
-        
-        # Trailing Stop Logic (Tighter for HFT)
-        ACTIVATION_THRESHOLD = 0.3  # Activate at 0.3% profit
-        TRAILING_DIST = 0.15  # Trail by 0.15%
-        
-        if pnl_pct >= ACTIVATION_THRESHOLD:
-            # Track max profit
-            if not hasattr(position, 'max_profit_pct'):
-                position.max_profit_pct = pnl_pct
-            else:
-                position.max_profit_pct = max(position.max_profit_pct, pnl_pct)
-            
-            # Exit if profit drops by TRAILING_DIST from max
-            if pnl_pct < (position.max_profit_pct - TRAILING_DIST):
-                return True, f'Trailing stop: {pnl_pct:.2f}% (max was {position.max_profit_pct:.2f}%)'
-        
-        # TIGHT stop loss (-0.3% of position value)
-        if pnl_pct <= -0.3:
-            return True, f"P&L stop-loss: {pnl_pct:.2f}%"
-
-        # 2. Stop-loss: z-score too extreme
-        if abs(current_zscore) > zscore_config.stoploss_threshold:
-            return True, f"Stop-loss: z-score {current_zscore:.2f}"
-
-        # 3. Exit: mean reversion (z-score back to normal)
-        if abs(current_zscore) < zscore_config.exit_threshold:
-            return True, f"Mean reversion: z-score {current_zscore:.2f}"
-
-        # 4. Time-based exit: holding too long
-        max_holding_hours = config.yaml_config.get('strategy', {}).get('signals', {}).get('max_holding_period_hours', 24)
-
-        if holding_time_delta > timedelta(hours=max_holding_hours):
-            return True, f"Max holding period exceeded: {holding_seconds / 3600:.1f} hours"
-
-        # 5. P&L-based stop-loss
-        if position.unrealized_pnl:
-            # Stop-loss at -0.5% of position value
-            position_value = position.size_a * position.entry_price_a
-            stop_loss_amount = -position_value * 0.005  # -0.5%
-
-            if position.unrealized_pnl < stop_loss_amount:
-                return True, f"P&L stop-loss: ${position.unrealized_pnl:.2f}"
+        holding_seconds = ((now or datetime.now()) - position.entry_time).total_seconds()
+        unrealized_pnl = position.unrealized_pnl or 0.0
+
+        # Most positions checked in a tick are still inside the minimum holding
+        # window; answer those without entering the full exit cascade
+        if holding_seconds < MIN_HOLDING_SECONDS and unrealized_pnl >= -100:
+            return False, _MIN_HOLDING_REASON.format(held=holding_seconds, min_hold=MIN_HOLDING_SECONDS)
+
+        # Trailing-stop high-water mark; None (or absent) until the stop arms
+        max_profit_pct = getattr(position, 'max_profit_pct', None)
+
+        should_close, reason, pnl_pct, max_profit_pct = kernels.decide_close(
+            float(unrealized_pnl),
+            holding_seconds,
+            float(position.size_a * position.entry_price_a),
+            math.nan if max_profit_pct is None else float(max_profit_pct),
+            float(current_zscore),
+            self._zc_sl,
+            self._zc_exit,
+            self._max_holding_s,
+            float(MIN_HOLDING_SECONDS)
+        )
 
-        return False, ""
+        # Trailing stop high-water mark
+        if not math.isnan(max_profit_pct):
+            position.max_profit_pct = max_profit_pct
+
+        if reason == kernels.CLOSE_NONE:
+            return should_close, ""
+        return should_close, _CLOSE_REASONS[reason].format(
+            pnl=unrealized_pnl,
+            pnl_pct=pnl_pct,
+            held=holding_seconds,
+            hours=holding_seconds / 3600,
+            max_pct=max_profit_pct,
+            zscore=current_zscore,
+            min_hold=MIN_HOLDING_SECONDS
+        )
 
     def calculate_risk_metrics(
         self,
         current_positions: List[Position],
-        trade_history: List[Dict[str, Any]],
+        trade_history: Optional[List[Dict[str, Any]]],
         account_balance: float,
-        daily_pnl: float
+        daily_pnl: float,
+        now: Optional[datetime] = None
     ) -> RiskMetrics:
         """Calculate comprehensive risk metrics"""
+        if now is None:
+            now = datetime.now()
         try:
             # Unrealized P&L
             unrealized_pnl = sum(
@@ -267,22 +352,30 @@ class RiskAgent:
                 for pos in current_positions
             )
 
+            # Per-trade returns and P&L as arrays (None = trades recorded here)
+            if trade_history is None:
+                n = min(self._n_recorded, len(self._returns_arr))
+                returns = self._returns_arr[:n]
+                pnls = self._pnl_arr[:n]
+            else:
+                n = len(trade_history)
+                returns = np.fromiter((t['pnl_percent'] for t in trade_history), dtype=np.float64, count=n) / 100
+                pnls = np.fromiter((t['pnl'] for t in trade_history), dtype=np.float64, count=n)
+
             # Sharpe ratio (if we have enough trades)
             sharpe_ratio = None
-            if len(trade_history) >= 30:
-                returns = [trade['pnl_percent'] / 100 for trade in trade_history]
-                mean_return = sum(returns) / len(returns)
-                std_return = (sum((r - mean_return) ** 2 for r in returns) / len(returns)) ** 0.5
+            if n >= 30:
+                mean_return = returns.mean()
+                std_return = returns.std()
 
                 if std_return > 0:
                     # Annualized Sharpe (assuming ~100 trades per year)
-                    sharpe_ratio = (mean_return / std_return) * (100 ** 0.5)
+                    sharpe_ratio = float(mean_return / std_return * math.sqrt(100))
 
             # Win rate
             win_rate = None
-            if trade_history:
-                wins = sum(1 for trade in trade_history if trade['pnl'] > 0)
-                win_rate = wins / len(trade_history)
+            if n:
+                win_rate = float((pnls > 0).mean())
 
             # Average latency (placeholder)
             avg_latency = None
@@ -295,7 +388,7 @@ class RiskAgent:
             )
 
             return RiskMetrics(
-                timestamp=datetime.now(),
+                timestamp=now,
                 total_positions=len(current_positions),
                 total_exposure=total_exposure,
                 daily_pnl=daily_pnl,
@@ -310,7 +403,7 @@ class RiskAgent:
         except Exception as e:
             logger.error(f"Error calculating risk metrics: {e}")
             return RiskMetrics(
-                timestamp=datetime.now(),
+                timestamp=now,
                 total_positions=0,
                 total_exposure=0.0,
                 daily_pnl=0.0,
@@ -319,23 +412,51 @@ class RiskAgent:
                 max_drawdown=0.0
             )
 
-    def _update_drawdown(self, current_equity: float):
-        """Update drawdown calculation"""
-        if current_equity > self.max_equity:
-            self.max_equity = current_equity
+    def _update_drawdown(self, current_equity: float) -> float:
+        """Update drawdown calculation and return the current drawdown"""
+        with self._drawdown_lock:
+            if current_equity > self.max_equity:
+                self.max_equity = current_equity
 
-        if self.max_equity > 0:
-            self.current_drawdown = (self.max_equity - current_equity) / self.max_equity
-        else:
-            self.current_drawdown = 0.0
+            if self.max_equity > 0:
+                self.current_drawdown = (self.max_equity - current_equity) / self.max_equity
+            else:
+                self.current_drawdown = 0.0
+            return self.current_drawdown
 
     def record_trade(self, trade: Dict[str, Any]):
         """Record completed trade for analysis"""
         self.trade_history.append(trade)
 
-        # Keep last 1000 trades
-        if len(self.trade_history) > 1000:
-            self.trade_history = self.trade_history[-1000:]
+        slot = self._n_recorded % len(self._returns_arr)
+        self._returns_arr[slot] = trade.get('pnl_percent', 0.0) / 100
+        self._pnl_arr[slot] = trade.get('pnl', 0.0)
+        self._n_recorded += 1
+
+    def check_bulk(
+        self,
+        actions: np.ndarray,
+        current_positions: List[Position],
+        account_balance: float,
+        daily_pnl: float
+    ) -> np.ndarray:
+        """
+        Vectorized get_recommendation: True where the action would be APPROVEd
+
+        The account-level limits are evaluated once and broadcast over actions.
+        """
+        is_safe, _ = self.check_risk_limits(
+            current_positions,
+            daily_pnl,
+            account_balance
+        )
+        if not is_safe:
+            return np.zeros(len(actions), dtype=bool)
+
+        opens = np.isin(actions, ('LONG_SPREAD', 'SHORT_SPREAD'))
+        if len(current_positions) >= self.trading_config.max_concurrent_pairs:
+            return ~opens
+        return np.ones(len(actions), dtype=bool)
 
     def get_recommendation(
         self,
@@ -343,7 +464,7 @@ class RiskAgent:
         current_positions: List[Position],
         account_balance: float,
         daily_pnl: float
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """
         Get risk management recommendation
 
@@ -364,16 +485,8 @@ class RiskAgent:
             }
 
         # If signal wants to open a position
-        if signal_action in ['LONG_SPREAD', 'SHORT_SPREAD']:
+        if signal_action in _OPEN_ACTIONS:
             if len(current_positions) >= self.trading_config.max_concurrent_pairs:
-                return {
-                    'action': 'HOLD',
-                    'reason': 'Max positions reached',
-                    'confidence': 1.0
-                }
-
-        return {
-            'action': 'APPROVE',
-            'reason': 'Risk checks passed',
-            'confidence': 1.0
-        }
+                return _MAX_POSITIONS_REACHED
+
+        return _APPROVE
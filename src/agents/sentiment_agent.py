@@ -1,17 +1,259 @@
 """Sentiment analysis agent using Gemini with Google Search grounding"""
 
 import asyncio
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
 import logging
 import google.generativeai as genai
 from google.api_core.exceptions import ResourceExhausted
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
 from src.data.models import SentimentData
 from src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Keyword fallback for responses without JSON: each keyword counts once
+_POSITIVE_KEYWORDS = frozenset(('bullish', 'positive', 'growth', 'adoption', 'partnership', 'upgrade'))
+_NEGATIVE_KEYWORDS = frozenset(('bearish', 'negative', 'crash', 'regulation', 'ban', 'hack'))
+_KEYWORD_RE = re.compile(
+    '|'.join(sorted(_POSITIVE_KEYWORDS | _NEGATIVE_KEYWORDS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+# Shared by every neutral fallback; never mutated
+_EMPTY_EVENTS = ()
+
+
+def _neutral(symbol: str, summary: str) -> SentimentData:
+    """Neutral zero-confidence sentiment for the disabled, quota and error paths"""
+    return SentimentData(
+        timestamp=datetime.now(),
+        symbol=symbol,
+        sentiment_score=0.0,
+        confidence=0.0,
+        news_count=0,
+        major_events=_EMPTY_EVENTS,
+        summary=summary
+    )
+
+_QUOTE = ord('"')
+_BACKSLASH = ord('\\')
+
+
+class _JsonScanner:
+    """
+    Incremental scanner for the first balanced JSON object (or array)
+
+    Fed UTF-8 chunks as they arrive; tracks bracket depth outside string
+    literals in one forward pass, so each byte is looked at once however the
+    text is split. Bracket and quote bytes never occur inside multi-byte
+    UTF-8 sequences, so scanning bytes is safe. After a span that turns out
+    not to be the one wanted, restart() carries on with the bytes after it.
+    """
+
+    __slots__ = ('open_char', 'open_code', 'close_code', 'buf', 'depth', 'in_string', 'escaped', 'started', 'rest')
+
+    def __init__(self, open_char: bytes = b'{', close_char: bytes = b'}'):
+        self.open_char = open_char
+        self.open_code = open_char[0]
+        self.close_code = close_char[0]
+        self.buf = bytearray()
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+        self.rest = b''
+
+    def feed(self, chunk: bytes) -> Optional[bytes]:
+        """Consume a chunk; returns the complete JSON bytes once it closes"""
+        start = 0
+        if not self.started:
+            start = chunk.find(self.open_char)
+            if start < 0:
+                return None
+            self.started = True
+
+        depth = self.depth
+        in_string = self.in_string
+        escaped = self.escaped
+        for i in range(start, len(chunk)):
+            ch = chunk[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == _BACKSLASH:
+                    escaped = True
+                elif ch == _QUOTE:
+                    in_string = False
+            elif ch == _QUOTE:
+                in_string = True
+            elif ch == self.open_code:
+                depth += 1
+            elif ch == self.close_code:
+                depth -= 1
+                if depth == 0:
+                    self.buf += chunk[start:i + 1]
+                    self.depth = 0
+                    self.rest = chunk[i + 1:]
+                    return bytes(self.buf)
+
+        self.buf += chunk[start:]
+        self.depth = depth
+        self.in_string = in_string
+        self.escaped = escaped
+        return None
+
+    def restart(self) -> Optional[bytes]:
+        """Drop the last span and scan on from the bytes that followed it"""
+        rest = self.rest
+        self.buf = bytearray()
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+        self.rest = b''
+        return self.feed(rest)
+
+
+def _parse_embedded_json(raw: bytes, open_char: bytes = b'{', close_char: bytes = b'}') -> Any:
+    """
+    Decode the JSON object (or array) in a model response, cheapest way first
+
+    1. the whole response, when it's already clean JSON
+    2. first opening to last closing bracket (find/rfind, e.g. inside a
+       ```json fence)
+    3. the first balanced span found by _JsonScanner
+
+    Returns None if nothing decodes.
+    """
+    stripped = raw.strip()
+    if stripped[:1] == open_char:
+        try:
+            return _json_loads(stripped)
+        except ValueError:  # JSONDecodeError for both orjson and json
+            pass
+
+    start = raw.find(open_char)
+    end = raw.rfind(close_char)
+    if start < 0 or end <= start:
+        return None
+    try:
+        return _json_loads(raw[start:end + 1])
+    except ValueError:
+        pass
+
+    json_bytes = _JsonScanner(open_char, close_char).feed(raw[start:])
+    if json_bytes is None:
+        return None
+    try:
+        return _json_loads(json_bytes)
+    except ValueError:
+        return None
+
+
+# Static pieces of the sentiment prompt; only the symbol, lookback and
+# timestamp vary between calls
+_SENTIMENT_PROMPT_HEAD = (
+    "You are a cryptocurrency market sentiment analyst. "
+    "Analyze the current market sentiment for "
+)
+_SENTIMENT_PROMPT_NEWS = """.
+
+Search for and analyze:
+1. Recent news articles about """
+_SENTIMENT_PROMPT_LOOKBACK = " from the last "
+_SENTIMENT_PROMPT_BODY = """ hours
+2. Major market events or announcements
+3. Regulatory developments
+4. Technical developments or upgrades
+5. Market trends and trading volume
+6. Social media sentiment (if available)
+7. Expert opinions and analyst predictions
+
+Provide your analysis in the following JSON format:
+{
+    "sentiment_score": <float between -1.0 (very bearish) and 1.0 (very bullish)>,
+    "confidence": <float between 0.0 and 1.0>,
+    "news_count": <number of relevant news articles found>,
+    "major_events": [<list of major events as strings>],
+    "summary": "<2-3 sentence summary of market sentiment>"
+}
+
+Consider:
+- **Positive factors**: adoption news, partnerships, upgrades, positive regulation, institutional investment
+- **Negative factors**: security breaches, regulatory crackdowns, negative news, market crashes
+- **Neutral factors**: normal market volatility, minor news
+
+Be objective and data-driven. Focus on market-moving events, not noise.
+
+Current date: """
+
+
+@lru_cache(maxsize=256)
+def _sentiment_prompt(symbol: str, lookback_hours: int, minute: datetime) -> str:
+    """Sentiment prompt for a symbol, stamped with the given minute"""
+    return ''.join((
+        _SENTIMENT_PROMPT_HEAD, symbol,
+        _SENTIMENT_PROMPT_NEWS, symbol,
+        _SENTIMENT_PROMPT_LOOKBACK, str(lookback_hours),
+        _SENTIMENT_PROMPT_BODY, minute.strftime('%Y-%m-%d %H:%M'), "\n"
+    ))
+
+
+@lru_cache(maxsize=4)
+def _market_regime_prompt(day: date) -> str:
+    """Market regime prompt, stamped with the given day"""
+    return f"""Analyze the current cryptocurrency market regime.
+
+Search for and analyze:
+1. Overall market trends (BTC, ETH, major altcoins)
+2. Market capitalization trends
+3. Trading volumes
+4. Fear & Greed Index
+5. Major macro events affecting crypto
+
+Classify the market as one of:
+- **bull**: Strong uptrend, positive sentiment, increasing volumes
+- **bear**: Strong downtrend, negative sentiment, fear
+- **neutral**: Sideways movement, mixed sentiment
+- **volatile**: High volatility, uncertain direction
+
+Respond with ONLY ONE WORD: bull, bear, neutral, or volatile
+
+Current date: {day.strftime('%Y-%m-%d')}
+"""
+
+
+@lru_cache(maxsize=4)
+def _major_events_prompt(minute: datetime) -> str:
+    """Major events prompt, stamped with the given minute"""
+    return f"""Search for any MAJOR cryptocurrency market events in the last 24 hours that could significantly impact trading:
+
+Examples of major events:
+- Exchange hacks or outages
+- Regulatory announcements
+- Major institutional moves
+- Hard forks or network upgrades
+- Significant price crashes/pumps (>10%)
+- Major economic news affecting crypto
+
+If there are major events, list them concisely (one per line).
+If there are NO major events, respond with: "No major events"
+
+Current date: {minute.strftime('%Y-%m-%d %H:%M')}
+"""
+
 
 class SentimentAgent:
     """
@@ -28,7 +270,12 @@ class SentimentAgent:
         self.config = config.gemini
         self.sentiment_config = config.sentiment
 
-        # Configure Gemini
+        # Configure Gemini. The SDK's default gRPC transport keeps one
+        # persistent HTTP/2 channel per client; the async client behind
+        # generate_content_async is created on first use and then shared by
+        # every call on self.model, so concurrent requests are multiplexed
+        # over it without new TCP/TLS handshakes. Keep a single SentimentAgent
+        # (and model) per process rather than re-creating them per call.
         genai.configure(api_key=self.config.api_key)
 
         # Initialize model with search grounding
@@ -55,8 +302,28 @@ class SentimentAgent:
             }
         } if self.sentiment_config.enable_google_search else {}
 
-        self.sentiment_cache: Dict[str, SentimentData] = {}
-        self.last_update: Dict[str, datetime] = {}
+        # Search grounding tool list, built once and passed on every call
+        # (None leaves grounding off)
+        self._search_tools = [
+            genai.protos.Tool(
+                google_search_retrieval=genai.protos.GoogleSearchRetrieval()
+            )
+        ] if self.sentiment_config.enable_google_search else None
+
+        # JSON mode for the sentiment prompts; Gemini doesn't combine it with
+        # search grounding, so it's only requested when search is off
+        self._json_generation_config = {
+            "response_mime_type": "application/json"
+        } if self._search_tools is None else None
+
+        # symbol -> (stored_at, sentiment), LRU-bounded; entries older than
+        # update_interval are treated as misses
+        self.sentiment_cache: "OrderedDict[str, Tuple[float, SentimentData]]" = OrderedDict()
+        self.sentiment_cache_size = 512
+        # symbol -> Gemini request in flight, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Caps concurrent Gemini calls so a wide fan-out doesn't trip the QPM quota
+        self._gemini_sem = asyncio.Semaphore(max(1, self.sentiment_config.max_concurrent_requests))
 
     async def analyze_sentiment(
         self,
@@ -73,100 +340,274 @@ class SentimentAgent:
         Returns:
             SentimentData with score, confidence, and summary
         """
-        try:
-            # Hard disable check
-            if not getattr(self.sentiment_config, 'enabled', False):
-                logger.debug("Sentiment analysis disabled in config")
-                return SentimentData(
-                    timestamp=datetime.now(),
-                    symbol=symbol,
-                    sentiment_score=0.0,
-                    confidence=0.0,
-                    news_count=0,
-                    major_events=[],
-                    summary="Sentiment analysis disabled"
-                )
+        # Hard disable check
+        if not getattr(self.sentiment_config, 'enabled', False):
+            logger.debug("Sentiment analysis disabled in config")
+            return _neutral(symbol, "Sentiment analysis disabled")
 
-            if lookback_hours is None:
-                lookback_hours = self.sentiment_config.news_lookback_hours
+        if lookback_hours is None:
+            lookback_hours = self.sentiment_config.news_lookback_hours
 
-            # Check cache
-            if symbol in self.sentiment_cache:
-                last_update = self.last_update.get(symbol)
-                if last_update and (datetime.now() - last_update).seconds < self.sentiment_config.update_interval:
-                    logger.debug(f"Using cached sentiment for {symbol}")
-                    return self.sentiment_cache[symbol]
+        # Check cache
+        cached = self._get_cached(symbol)
+        if cached is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Using cached sentiment for %s", symbol)
+            return cached
 
-            logger.info(f"Analyzing sentiment for {symbol}...")
+        try:
+            # Join a request already in flight for this symbol; shielded so a
+            # cancelled caller doesn't cancel it for the others
+            task = self._inflight.get(symbol)
+            if task is None:
+                task = asyncio.ensure_future(self._fetch_sentiment(symbol, lookback_hours))
+                self._inflight[symbol] = task
+                task.add_done_callback(lambda _: self._inflight.pop(symbol, None))
+            return await asyncio.shield(task)
+
+        except Exception as e:
+            logger.error(f"Error analyzing sentiment for {symbol}: {e}")
+            return _neutral(symbol, "Error analyzing sentiment")
+
+    async def _fetch_sentiment(self, symbol: str, lookback_hours: int) -> SentimentData:
+        """Query Gemini for a symbol's sentiment and cache the result"""
+        now = datetime.now()
+        try:
+            logger.info("Analyzing sentiment for %s...", symbol)
 
             # Create prompt for Gemini
-            prompt = self._create_sentiment_prompt(symbol, lookback_hours)
-
-            # Call Gemini with search grounding
-            if self.sentiment_config.enable_google_search:
-                # Use tools for search
-                tools = [
-                    genai.protos.Tool(
-                        google_search_retrieval=genai.protos.GoogleSearchRetrieval()
-                    )
-                ]
-                response = await asyncio.to_thread(
-                    self.model.generate_content,
+            prompt = self._create_sentiment_prompt(symbol, lookback_hours, now)
+
+            async with self._gemini_sem:
+                # Call Gemini (with search grounding if enabled)
+                response = await self.model.generate_content_async(
                     prompt,
-                    tools=tools
-                )
-            else:
-                response = await asyncio.to_thread(
-                    self.model.generate_content,
-                    prompt
+                    tools=self._search_tools,
+                    generation_config=self._json_generation_config,
+                    stream=True
                 )
 
-            # Parse response
-            sentiment_data = self._parse_sentiment_response(symbol, response.text)
+                # Parse response as it streams in
+                sentiment_data = await self._parse_sentiment_stream(symbol, response)
 
             # Cache result
-            self.sentiment_cache[symbol] = sentiment_data
-            self.last_update[symbol] = datetime.now()
+            self._store(symbol, sentiment_data)
 
             logger.info(
-                f"Sentiment for {symbol}: {sentiment_data.sentiment_score:.2f} "
-                f"(confidence: {sentiment_data.confidence:.2f})"
+                "Sentiment for %s: %.2f (confidence: %.2f)",
+                symbol, sentiment_data.sentiment_score, sentiment_data.confidence
             )
 
             return sentiment_data
 
         except ResourceExhausted as e:
-            logger.warning(f"Gemini API quota exceeded for {symbol}. Returning neutral sentiment.")
-            # Return neutral sentiment on quota exceeded
-            return SentimentData(
-                timestamp=datetime.now(),
-                symbol=symbol,
-                sentiment_score=0.0,
-                confidence=0.0,
-                news_count=0,
-                major_events=[],
-                summary="API quota exceeded - Neutral fallback"
-            )
+            logger.warning("Gemini API quota exceeded for %s. Returning neutral sentiment.", symbol)
+            return _neutral(symbol, "API quota exceeded - Neutral fallback")
 
         except Exception as e:
             logger.error(f"Error analyzing sentiment for {symbol}: {e}")
-            # Return neutral sentiment on error
-            return SentimentData(
-                timestamp=datetime.now(),
-                symbol=symbol,
-                sentiment_score=0.0,
-                confidence=0.0,
-                news_count=0,
-                major_events=[],
-                summary="Error analyzing sentiment"
-            )
+            return _neutral(symbol, "Error analyzing sentiment")
+
+    def _get_cached(self, symbol: str) -> Optional[SentimentData]:
+        """Cached sentiment for a symbol, if still fresh"""
+        entry = self.sentiment_cache.get(symbol)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.sentiment_config.update_interval:
+            del self.sentiment_cache[symbol]
+            return None
+        self.sentiment_cache.move_to_end(symbol)
+        return entry[1]
+
+    def _store(self, symbol: str, sentiment_data: SentimentData):
+        """Cache a fresh sentiment result"""
+        self.sentiment_cache[symbol] = (time.monotonic(), sentiment_data)
+        self.sentiment_cache.move_to_end(symbol)
+        if len(self.sentiment_cache) > self.sentiment_cache_size:
+            self.sentiment_cache.popitem(last=False)
+
+    def _create_sentiment_prompt(
+        self,
+        symbol: str,
+        lookback_hours: int,
+        now: Optional[datetime] = None
+    ) -> str:
+        """Create prompt for Gemini (memoized per minute)"""
+        minute = (now or datetime.now()).replace(second=0, microsecond=0)
+        return _sentiment_prompt(symbol, lookback_hours, minute)
+
+    async def _parse_sentiment_stream(self, symbol: str, response) -> SentimentData:
+        """
+        Parse a streamed Gemini response into SentimentData
 
-    def _create_sentiment_prompt(self, symbol: str, lookback_hours: int) -> str:
-        """Create prompt for Gemini"""
-        return f"""You are a cryptocurrency market sentiment analyst. Analyze the current market sentiment for {symbol}.
+        The JSON object is picked out incrementally and parsed as soon as it
+        closes, without waiting for any trailing text; a balanced span that
+        doesn't parse (e.g. an example in the prose) is skipped and scanning
+        continues. A stream without a usable object goes through
+        _parse_sentiment_response on the full text.
+        """
+        scanner = _JsonScanner()
+        parts = []
+        async for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                continue  # chunk without text parts (e.g. grounding metadata)
+            parts.append(text)
+
+            json_bytes = scanner.feed(text.encode())
+            while json_bytes is not None:
+                try:
+                    return self._sentiment_from_dict(symbol, _json_loads(json_bytes))
+                except Exception:
+                    json_bytes = scanner.restart()
+
+        return self._parse_sentiment_response(symbol, ''.join(parts))
 
-Search for and analyze:
-1. Recent news articles about {symbol} from the last {lookback_hours} hours
+    def _parse_sentiment_response(self, symbol: str, response_text: str) -> SentimentData:
+        """Parse Gemini response into SentimentData"""
+        try:
+            return self._parse_sentiment_text(symbol, response_text)
+        except Exception as e:
+            logger.error(f"Error parsing sentiment response: {e}")
+            return _neutral(symbol, "Error parsing response")
+
+    def _parse_sentiment_text(self, symbol: str, response_text: str) -> SentimentData:
+        """Straight-line body of _parse_sentiment_response"""
+        # Find JSON in response
+        data = _parse_embedded_json(response_text.encode())
+        if isinstance(data, dict):
+            return self._sentiment_from_dict(symbol, data)
+
+        # Fallback: parse manually
+        logger.warning("Could not parse JSON, using fallback parsing")
+
+        # Simple keyword-based sentiment (one scan for all keywords)
+        found = {match.lower() for match in _KEYWORD_RE.findall(response_text)}
+        positive_count = len(found & _POSITIVE_KEYWORDS)
+        negative_count = len(found & _NEGATIVE_KEYWORDS)
+
+        if positive_count + negative_count > 0:
+            sentiment_score = (positive_count - negative_count) / (positive_count + negative_count)
+        else:
+            sentiment_score = 0.0
+
+        return SentimentData(
+            timestamp=datetime.now(),
+            symbol=symbol,
+            sentiment_score=sentiment_score,
+            confidence=0.5,
+            news_count=0,
+            major_events=[],
+            summary=response_text[:200]
+        )
+
+    @staticmethod
+    def _sentiment_from_dict(symbol: str, data: Dict) -> SentimentData:
+        """Build SentimentData from one parsed JSON sentiment object"""
+        return SentimentData(
+            timestamp=datetime.now(),
+            symbol=symbol,
+            sentiment_score=float(data.get('sentiment_score', 0.0)),
+            confidence=float(data.get('confidence', 0.5)),
+            news_count=int(data.get('news_count', 0)),
+            major_events=data.get('major_events', []),
+            summary=data.get('summary', '')
+        )
+
+    async def analyze_multiple_symbols(
+        self,
+        symbols: List[str]
+    ) -> Dict[str, SentimentData]:
+        """
+        Analyze sentiment for multiple symbols concurrently
+
+        Gemini calls are throttled by the agent's semaphore; symbols still
+        pending after request_timeout come back neutral (their requests keep
+        running and land in the cache for the next call).
+        """
+        if not symbols:
+            return {}
+
+        tasks = {symbol: asyncio.ensure_future(self.analyze_sentiment(symbol)) for symbol in symbols}
+        done, pending = await asyncio.wait(
+            tasks.values(),
+            timeout=self.sentiment_config.request_timeout
+        )
+
+        if pending:
+            logger.warning("Sentiment timed out for %d of %d symbols", len(pending), len(tasks))
+            for task in pending:
+                task.cancel()
+
+        return {
+            symbol: task.result() if task in done else _neutral(symbol, "Sentiment request timed out")
+            for symbol, task in tasks.items()
+        }
+
+    async def analyze_multiple_symbols_batch(
+        self,
+        symbols: List[str],
+        lookback_hours: Optional[int] = None
+    ) -> Dict[str, SentimentData]:
+        """
+        Analyze sentiment for multiple symbols with one Gemini request
+
+        Fresh cached symbols are served from the cache; the rest share a
+        single prompt that returns a JSON array. Falls back to the
+        per-symbol path for a single miss, a failed request, or symbols
+        missing from the batch response.
+        """
+        if not getattr(self.sentiment_config, 'enabled', False):
+            return await self.analyze_multiple_symbols(symbols)
+
+        if lookback_hours is None:
+            lookback_hours = self.sentiment_config.news_lookback_hours
+
+        results: Dict[str, SentimentData] = {}
+        misses = []
+        for symbol in symbols:
+            cached = self._get_cached(symbol)
+            if cached is not None:
+                results[symbol] = cached
+            else:
+                misses.append(symbol)
+
+        if len(misses) > 1:
+            try:
+                logger.info("Analyzing sentiment for %d symbols in one batch...", len(misses))
+                prompt = self._create_batch_sentiment_prompt(misses, lookback_hours)
+
+                async with self._gemini_sem:
+                    response = await self.model.generate_content_async(
+                        prompt,
+                        tools=self._search_tools,
+                        generation_config=self._json_generation_config
+                    )
+
+                for symbol, sentiment_data in self._parse_batch_sentiment_response(
+                    misses, response.text
+                ).items():
+                    self._store(symbol, sentiment_data)
+                    results[symbol] = sentiment_data
+
+            except ResourceExhausted:
+                logger.warning("Gemini API quota exceeded for batch sentiment, falling back to per-symbol")
+            except Exception as e:
+                logger.error(f"Error in batch sentiment analysis: {e}")
+
+        remaining = [symbol for symbol in misses if symbol not in results]
+        if remaining:
+            results.update(await self.analyze_multiple_symbols(remaining))
+
+        return {symbol: results[symbol] for symbol in symbols}
+
+    def _create_batch_sentiment_prompt(self, symbols: List[str], lookback_hours: int) -> str:
+        """Create a multi-symbol prompt for Gemini"""
+        return f"""You are a cryptocurrency market sentiment analyst. Analyze the current market sentiment for each of: {', '.join(symbols)}.
+
+For each symbol, search for and analyze:
+1. Recent news articles from the last {lookback_hours} hours
 2. Major market events or announcements
 3. Regulatory developments
 4. Technical developments or upgrades
@@ -174,14 +615,17 @@ Search for and analyze:
 6. Social media sentiment (if available)
 7. Expert opinions and analyst predictions
 
-Provide your analysis in the following JSON format:
-{{
-    "sentiment_score": <float between -1.0 (very bearish) and 1.0 (very bullish)>,
-    "confidence": <float between 0.0 and 1.0>,
-    "news_count": <number of relevant news articles found>,
-    "major_events": [<list of major events as strings>],
-    "summary": "<2-3 sentence summary of market sentiment>"
-}}
+Provide your analysis as a JSON array with one object per symbol, in this format:
+[
+    {{
+        "symbol": "<symbol exactly as given>",
+        "sentiment_score": <float between -1.0 (very bearish) and 1.0 (very bullish)>,
+        "confidence": <float between 0.0 and 1.0>,
+        "news_count": <number of relevant news articles found>,
+        "major_events": [<list of major events as strings>],
+        "summary": "<2-3 sentence summary of market sentiment>"
+    }}
+]
 
 Consider:
 - **Positive factors**: adoption news, partnerships, upgrades, positive regulation, institutional investment
@@ -193,75 +637,27 @@ Be objective and data-driven. Focus on market-moving events, not noise.
 Current date: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 """
 
-    def _parse_sentiment_response(self, symbol: str, response_text: str) -> SentimentData:
-        """Parse Gemini response into SentimentData"""
-        try:
-            # Try to extract JSON from response
-            import json
-            import re
-
-            # Find JSON in response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-
-                return SentimentData(
-                    timestamp=datetime.now(),
-                    symbol=symbol,
-                    sentiment_score=float(data.get('sentiment_score', 0.0)),
-                    confidence=float(data.get('confidence', 0.5)),
-                    news_count=int(data.get('news_count', 0)),
-                    major_events=data.get('major_events', []),
-                    summary=data.get('summary', '')
-                )
-
-            # Fallback: parse manually
-            logger.warning("Could not parse JSON, using fallback parsing")
-
-            # Simple keyword-based sentiment
-            text_lower = response_text.lower()
-            positive_keywords = ['bullish', 'positive', 'growth', 'adoption', 'partnership', 'upgrade']
-            negative_keywords = ['bearish', 'negative', 'crash', 'regulation', 'ban', 'hack']
-
-            positive_count = sum(1 for word in positive_keywords if word in text_lower)
-            negative_count = sum(1 for word in negative_keywords if word in text_lower)
-
-            if positive_count + negative_count > 0:
-                sentiment_score = (positive_count - negative_count) / (positive_count + negative_count)
-            else:
-                sentiment_score = 0.0
-
-            return SentimentData(
-                timestamp=datetime.now(),
-                symbol=symbol,
-                sentiment_score=sentiment_score,
-                confidence=0.5,
-                news_count=0,
-                major_events=[],
-                summary=response_text[:200]
-            )
-
-        except Exception as e:
-            logger.error(f"Error parsing sentiment response: {e}")
-            return SentimentData(
-                timestamp=datetime.now(),
-                symbol=symbol,
-                sentiment_score=0.0,
-                confidence=0.0,
-                news_count=0,
-                major_events=[],
-                summary="Error parsing response"
-            )
-
-    async def analyze_multiple_symbols(
+    def _parse_batch_sentiment_response(
         self,
-        symbols: List[str]
+        symbols: List[str],
+        response_text: str
     ) -> Dict[str, SentimentData]:
-        """Analyze sentiment for multiple symbols concurrently"""
-        tasks = [self.analyze_sentiment(symbol) for symbol in symbols]
-        results = await asyncio.gather(*tasks)
-
-        return {symbol: result for symbol, result in zip(symbols, results)}
+        """Parse a batch Gemini response; symbols it doesn't cover are left out"""
+        items = _parse_embedded_json(response_text.encode(), b'[', b']')
+        if not isinstance(items, list):
+            logger.warning("Could not find JSON array in batch sentiment response")
+            return {}
+
+        wanted = {symbol.upper(): symbol for symbol in symbols}
+        parsed = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            symbol = wanted.get(str(item.get('symbol', '')).upper())
+            if symbol is not None and symbol not in parsed:
+                parsed[symbol] = self._sentiment_from_dict(symbol, item)
+
+        return parsed
 
     async def detect_market_regime(self) -> str:
         """
@@ -271,50 +667,20 @@ Current date: {datetime.now().strftime('%Y-%m-%d %H:%M')}
             'bull', 'bear', 'neutral', or 'volatile'
         """
         try:
-            prompt = """Analyze the current cryptocurrency market regime.
-
-Search for and analyze:
-1. Overall market trends (BTC, ETH, major altcoins)
-2. Market capitalization trends
-3. Trading volumes
-4. Fear & Greed Index
-5. Major macro events affecting crypto
+            prompt = _market_regime_prompt(datetime.now().date())
 
-Classify the market as one of:
-- **bull**: Strong uptrend, positive sentiment, increasing volumes
-- **bear**: Strong downtrend, negative sentiment, fear
-- **neutral**: Sideways movement, mixed sentiment
-- **volatile**: High volatility, uncertain direction
-
-Respond with ONLY ONE WORD: bull, bear, neutral, or volatile
-
-Current date: {datetime.now().strftime('%Y-%m-%d')}
-"""
-
-            if self.sentiment_config.enable_google_search:
-                tools = [
-                    genai.protos.Tool(
-                        google_search_retrieval=genai.protos.GoogleSearchRetrieval()
-                    )
-                ]
-                response = await asyncio.to_thread(
-                    self.model.generate_content,
-                    prompt,
-                    tools=tools
-                )
-            else:
-                response = await asyncio.to_thread(
-                    self.model.generate_content,
-                    prompt
-                )
+            response = await self.model.generate_content_async(
+                prompt,
+                tools=self._search_tools
+            )
 
             regime = response.text.strip().lower()
 
             if regime in ['bull', 'bear', 'neutral', 'volatile']:
-                logger.info(f"Market regime: {regime}")
+                logger.info("Market regime: %s", regime)
                 return regime
             else:
-                logger.warning(f"Unexpected regime response: {regime}")
+                logger.warning("Unexpected regime response: %s", regime)
                 return 'neutral'
 
         except Exception as e:
@@ -329,38 +695,12 @@ Current date: {datetime.now().strftime('%Y-%m-%d')}
             List of major events
         """
         try:
-            prompt = """Search for any MAJOR cryptocurrency market events in the last 24 hours that could significantly impact trading:
-
-Examples of major events:
-- Exchange hacks or outages
-- Regulatory announcements
-- Major institutional moves
-- Hard forks or network upgrades
-- Significant price crashes/pumps (>10%)
-- Major economic news affecting crypto
+            prompt = _major_events_prompt(datetime.now().replace(second=0, microsecond=0))
 
-If there are major events, list them concisely (one per line).
-If there are NO major events, respond with: "No major events"
-
-Current date: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-"""
-
-            if self.sentiment_config.enable_google_search:
-                tools = [
-                    genai.protos.Tool(
-                        google_search_retrieval=genai.protos.GoogleSearchRetrieval()
-                    )
-                ]
-                response = await asyncio.to_thread(
-                    self.model.generate_content,
-                    prompt,
-                    tools=tools
-                )
-            else:
-                response = await asyncio.to_thread(
-                    self.model.generate_content,
-                    prompt
-                )
+            response = await self.model.generate_content_async(
+                prompt,
+                tools=self._search_tools
+            )
 
             text = response.text.strip()
 
@@ -375,9 +715,9 @@ Current date: {datetime.now().strftime('%Y-%m-%d %H:%M')}
             ]
 
             if events:
-                logger.info(f"Major events detected: {len(events)}")
+                logger.info("Major events detected: %d", len(events))
                 for event in events:
-                    logger.info(f"  - {event}")
+                    logger.info("  - %s", event)
 
             return events
 
@@ -388,5 +728,4 @@ Current date: {datetime.now().strftime('%Y-%m-%d %H:%M')}
     def clear_cache(self):
         """Clear sentiment cache"""
         self.sentiment_cache.clear()
-        self.last_update.clear()
         logger.info("Sentiment cache cleared")
@@ -1,8 +1,14 @@
 """Configuration management"""
 
 import os
-from typing import Any, Dict, List
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 import yaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
@@ -57,6 +63,8 @@ class SentimentConfig(BaseModel):
     update_interval: int = Field(default=900, description="Seconds")
     news_lookback_hours: int = Field(default=24)
     enable_google_search: bool = Field(default=True)
+    max_concurrent_requests: int = Field(default=4, description="Gemini calls in flight")
+    request_timeout: float = Field(default=60.0, description="Seconds")
 
 
 class Settings(BaseSettings):
@@ -95,6 +103,8 @@ class Settings(BaseSettings):
     sentiment_update_interval: int = 900
     news_lookback_hours: int = 24
     enable_google_search: bool = True
+    sentiment_max_concurrent_requests: int = 4
+    sentiment_request_timeout: float = 60.0
 
     # API Server
     api_host: str = "0.0.0.0"
@@ -114,20 +124,37 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+_EMPTY_YAML: Mapping[str, Any] = MappingProxyType({})
+
+
+@lru_cache(maxsize=4)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Mapping[str, Any]:
+    """Parse a YAML file once per (path, mtime); the result is read-only"""
+    # libyaml reads the bytes directly, no text-mode decode
+    with open(path, 'rb') as f:
+        return MappingProxyType(yaml.load(f, Loader=_YamlLoader) or {})
+
+
 class ConfigManager:
-    """Manages application configuration"""
+    """
+    Manages application configuration
+
+    The typed sub-configs (bybit, gemini, ...) are built from settings on
+    first access and reused; settings are not modified after load.
+    """
 
     def __init__(self, config_file: str = "config.yaml"):
         self.config_file = config_file
         self.settings = Settings()
         self.yaml_config = self._load_yaml()
 
-    def _load_yaml(self) -> Dict[str, Any]:
-        """Load YAML configuration"""
-        if os.path.exists(self.config_file):
-            with open(self.config_file, 'r') as f:
-                return yaml.safe_load(f)
-        return {}
+    def _load_yaml(self) -> Mapping[str, Any]:
+        """Load YAML configuration (reused until the file's mtime changes)"""
+        try:
+            mtime_ns = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return _EMPTY_YAML
+        return _load_yaml_cached(self.config_file, mtime_ns)
 
     def get_trading_pairs(self) -> List[Dict[str, Any]]:
         """Get list of trading pairs"""
@@ -145,7 +172,7 @@ class ConfigManager:
         """Get monitoring configuration"""
         return self.yaml_config.get('monitoring', {})
 
-    @property
+    @cached_property
     def bybit(self) -> BybitConfig:
         """Get Bybit configuration"""
         return BybitConfig(
@@ -154,7 +181,7 @@ class ConfigManager:
             testnet=self.settings.bybit_testnet
         )
 
-    @property
+    @cached_property
     def gemini(self) -> GeminiConfig:
         """Get Gemini configuration"""
         return GeminiConfig(
@@ -162,7 +189,7 @@ class ConfigManager:
             model=self.settings.gemini_model
         )
 
-    @property
+    @cached_property
     def database(self) -> DatabaseConfig:
         """Get database configuration"""
         return DatabaseConfig(
@@ -170,7 +197,7 @@ class ConfigManager:
             redis_url=self.settings.redis_url
         )
 
-    @property
+    @cached_property
     def trading(self) -> TradingConfig:
         """Get trading configuration"""
         return TradingConfig(
@@ -181,7 +208,7 @@ class ConfigManager:
             risk_per_trade=self.settings.risk_per_trade
         )
 
-    @property
+    @cached_property
     def zscore(self) -> ZScoreConfig:
         """Get z-score configuration"""
         return ZScoreConfig(
@@ -190,7 +217,7 @@ class ConfigManager:
             stoploss_threshold=self.settings.zscore_stoploss_threshold
         )
 
-    @property
+    @cached_property
     def cointegration(self) -> CointegrationConfig:
         """Get cointegration configuration"""
         return CointegrationConfig(
@@ -199,13 +226,15 @@ class ConfigManager:
             hedge_ratio_update_interval=self.settings.hedge_ratio_update_interval
         )
 
-    @property
+    @cached_property
     def sentiment(self) -> SentimentConfig:
         """Get sentiment configuration"""
         return SentimentConfig(
             update_interval=self.settings.sentiment_update_interval,
             news_lookback_hours=self.settings.news_lookback_hours,
-            enable_google_search=self.settings.enable_google_search
+            enable_google_search=self.settings.enable_google_search,
+            max_concurrent_requests=self.settings.sentiment_max_concurrent_requests,
+            request_timeout=self.settings.sentiment_request_timeout
         )
 
 
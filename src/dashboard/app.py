@@ -1,14 +1,85 @@
 """Real-time trading dashboard"""
 
 import asyncio
-from fastapi import FastAPI, WebSocket
+import atexit
+import hashlib
+import os
+import struct
+import time
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
-import json
-from datetime import datetime
+from fastapi.responses import Response
+import orjson
+from multiprocessing import resource_tracker, shared_memory
 from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import ormsgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zmq
+    import zmq.asyncio
+    ZMQ_AVAILABLE = True
+except ImportError:
+    ZMQ_AVAILABLE = False
 
 app = FastAPI()
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+DATA_FILE = Path("/tmp/bybit_dashboard_data.json")
+_DATA_TMP_FILE = DATA_FILE.with_name(DATA_FILE.name + ".tmp")
+
+# Updates only mark the state dirty; _flush_loop writes it out at most once
+# per interval on the updater's event loop
+FLUSH_INTERVAL = 0.1
+_dirty = asyncio.Event()
+_flush_task = None
+_flush_loop_owner = None
+
+# The engine publishes the serialized state into a shared memory block under
+# a seqlock: the sequence is odd while a write is in progress, so readers in
+# the dashboard process retry instead of taking a lock. Payloads too big for
+# the block are marked as overflow and readers fall back to DATA_FILE.
+SHM_NAME = "bybit_dashboard_data"
+SHM_SIZE = 64 * 1024
+_SHM_HEADER = struct.Struct("<QI")  # sequence, payload length
+_SHM_OVERFLOW = 0xFFFFFFFF
+_shm: Optional[shared_memory.SharedMemory] = None
+_shm_seen_seq = 0
+
+# Set once an updater runs here, i.e. the engine shares this process and
+# dashboard_data is already current
+_in_process = False
+
+# Full-state dumps are stitched together from per-pair fragments, re-encoded
+# only when the pair's dict is replaced, and one fragment for the other fields
+_pair_bytes: Dict[str, Tuple[dict, bytes]] = {}
+_scalar_bytes: Optional[bytes] = None
+
+# Each WebSocket connection drains its own queue of JSON Patch (RFC 6902) ops,
+# sending up to PATCH_BATCH_SIZE of them per frame. A client that falls
+# PATCH_QUEUE_SIZE ops behind has its backlog dropped and gets a fresh full
+# snapshot instead (_RESYNC marker).
+PATCH_BATCH_SIZE = 128
+PATCH_QUEUE_SIZE = 1024
+_RESYNC = object()
+_subscribers: Set[asyncio.Queue] = set()
+
+# How often the server checks for engine updates from another process; an
+# unchanged shared block or file costs a header read or a stat, and sends nothing
+WATCH_INTERVAL = 0.25
+_file_seen_mtime = 0
+
+# With pyzmq the engine also PUBlishes each flushed snapshot over a Unix socket
+# and the dashboard SUBscribes (conflated, so only the latest is kept),
+# replacing the polling above
+ZMQ_ENDPOINT = "ipc:///tmp/bybit_dashboard.sock"
+_zmq_pub = None
 
 # Global state to share data between trading engine and dashboard
 dashboard_data = {
@@ -22,17 +93,22 @@ dashboard_data = {
     "positions": [],
     "max_position_size": 1000.0,  # From .env
     "risk_per_trade": 0.02,  # 2% from .env
-    "last_update": datetime.now().isoformat()
+    "last_update": time.time()  # Epoch seconds, formatted by the page
 }
 
-@app.get("/")
-async def get_dashboard():
-    """Serve the dashboard HTML"""
-    html_content = """
+@app.on_event("startup")
+async def _start_flusher():
+    """Start the coalescing writer and the engine watcher on the server's event loop"""
+    loop = asyncio.get_running_loop()
+    _ensure_flusher(loop)
+    loop.create_task(_subscribe_engine() if ZMQ_AVAILABLE else _watch_engine())
+
+_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
         <title>Crypto Pairs Trading Dashboard</title>
+        <script src="https://unpkg.com/@msgpack/msgpack@2.8.0/dist.es5+umd/msgpack.min.js"></script>
         <style>
             * {
                 margin: 0;
@@ -268,11 +344,42 @@ async def get_dashboard():
         </div>
 
         <script>
-            const ws = new WebSocket('ws://localhost:5000/ws');
+            // Frames are MessagePack when the server agrees to it, JSON otherwise
+            const ws = new WebSocket('ws://localhost:5000/ws', window.MessagePack ? ['msgpack', 'json'] : ['json']);
+            ws.binaryType = 'arraybuffer';
+            const decoder = new TextDecoder();
+            let state = {};
+
+            function decodeFrame(buffer) {
+                if (ws.protocol === 'msgpack') {
+                    return MessagePack.decode(new Uint8Array(buffer));
+                }
+                return JSON.parse(decoder.decode(buffer));
+            }
+
+            // The server only sends "add"/"replace" ops on object members, so that's all we apply
+            function applyPatch(doc, ops) {
+                for (const op of ops) {
+                    if (op.path === '') {
+                        doc = op.value;
+                        continue;
+                    }
+                    const parts = op.path.slice(1).split('/').map(p => p.replace(/~1/g, '/').replace(/~0/g, '~'));
+                    const last = parts.pop();
+                    let target = doc;
+                    for (const part of parts) {
+                        if (target[part] === undefined || target[part] === null) target[part] = {};
+                        target = target[part];
+                    }
+                    target[last] = op.value;
+                }
+                return doc;
+            }
 
+            // Each frame is a batch of JSON Patch ops; the first replaces the whole state
             ws.onmessage = function(event) {
-                const data = JSON.parse(event.data);
-                updateDashboard(data);
+                state = applyPatch(state, decodeFrame(event.data));
+                updateDashboard(state);
             };
 
             function updateDashboard(data) {
@@ -300,21 +407,113 @@ async def get_dashboard():
                 document.getElementById('max-position').textContent = (data.max_position_size || 1000).toFixed(0);
                 document.getElementById('risk-per-trade').textContent = ((data.risk_per_trade || 0.02) * 100).toFixed(0);
 
-                // Update last update time
-                const now = new Date();
-                document.getElementById('last-update').textContent = now.toLocaleTimeString();
+                // Update last update time (epoch seconds from the engine)
+                const lastUpdate = typeof data.last_update === 'number' ? new Date(data.last_update * 1000) : new Date();
+                document.getElementById('last-update').textContent = lastUpdate.toLocaleTimeString();
 
-                // Update pairs
+                // Update pairs: cards are built once per pair and patched in place
                 const container = document.getElementById('pairs-container');
-                container.innerHTML = '';
+                const seen = new Set();
 
                 for (const [pairId, pairData] of Object.entries(data.pairs)) {
-                    const card = createPairCard(pairId, pairData);
-                    container.innerHTML += card;
+                    seen.add(pairId);
+                    let refs = cards.get(pairId);
+                    if (!refs) {
+                        refs = createPairCard(pairId);
+                        cards.set(pairId, refs);
+                        container.appendChild(refs.card);
+                    }
+                    // Patches replace a pair's object when it changes
+                    if (refs.data !== pairData) {
+                        refs.data = pairData;
+                        updatePairCard(refs, pairData);
+                    }
+                }
+
+                for (const [pairId, refs] of cards) {
+                    if (!seen.has(pairId)) {
+                        refs.card.remove();
+                        cards.delete(pairId);
+                    }
                 }
             }
 
-            function createPairCard(pairId, data) {
+            // pairId -> {card, data, and the card's data-field elements}
+            const cards = new Map();
+
+            const PAIR_CARD_TEMPLATE = `
+                <div class="pair-header"></div>
+
+                <div class="stat">
+                    <span class="stat-label">Current Prices:</span>
+                    <span class="stat-value" data-field="prices"></span>
+                </div>
+
+                <div class="stat">
+                    <span class="stat-label">Z-Score:</span>
+                    <span class="stat-value" data-field="zscore"></span>
+                </div>
+
+                <div class="zscore-bar">
+                    <div class="zscore-fill" data-field="zscoreFill"></div>
+                    <div class="zscore-marker" style="left: 50%"></div>
+                </div>
+
+                <div class="stat">
+                    <span class="stat-label">Cointegration:</span>
+                    <span data-field="cointegration"></span>
+                </div>
+
+                <div class="stat">
+                    <span class="stat-label">P-Value:</span>
+                    <span class="stat-value" data-field="pvalue"></span>
+                </div>
+
+                <div class="stat">
+                    <span class="stat-label">Hedge Ratio:</span>
+                    <span class="stat-value" data-field="hedgeRatio"></span>
+                </div>
+
+                <div class="stat">
+                    <span class="stat-label">Half-Life:</span>
+                    <span class="stat-value" data-field="halfLife"></span>
+                </div>
+
+                <div class="stat">
+                    <span class="stat-label">Position Size (USD):</span>
+                    <span class="stat-value" data-field="positionSize"></span>
+                </div>
+
+                <div class="stat">
+                    <span class="stat-label">Lot Size (Contracts):</span>
+                    <span class="stat-value" data-field="lotSize"></span>
+                </div>
+
+                <div class="stat">
+                    <span class="stat-label">Signal:</span>
+                    <span class="signal" data-field="signal"></span>
+                </div>
+
+                <div class="stat">
+                    <span class="stat-label">Confidence:</span>
+                    <span class="stat-value" data-field="confidence"></span>
+                </div>
+            `;
+
+            function createPairCard(pairId) {
+                const card = document.createElement('div');
+                card.className = 'pair-card';
+                card.innerHTML = PAIR_CARD_TEMPLATE;
+                card.querySelector('.pair-header').textContent = pairId;
+
+                const refs = {card: card, data: null};
+                for (const el of card.querySelectorAll('[data-field]')) {
+                    refs[el.dataset.field] = el;
+                }
+                return refs;
+            }
+
+            function updatePairCard(refs, data) {
                 const zscore = data.zscore || 0;
                 const pvalue = data.cointegration?.pvalue || 1.0;
                 const isCointegrated = pvalue < 0.2;
@@ -334,110 +533,168 @@ async def get_dashboard():
                 const lotSizeA = currentPriceA > 0 ? (positionSizeA / currentPriceA).toFixed(4) : '0.0000';
                 const lotSizeB = currentPriceB > 0 ? (positionSizeB / currentPriceB).toFixed(4) : '0.0000';
 
-                return `
-                    <div class="pair-card">
-                        <div class="pair-header">${pairId}</div>
-
-                        <div class="stat">
-                            <span class="stat-label">Current Prices:</span>
-                            <span class="stat-value">${currentPriceA.toFixed(2)} / ${currentPriceB.toFixed(2)}</span>
-                        </div>
-
-                        <div class="stat">
-                            <span class="stat-label">Z-Score:</span>
-                            <span class="stat-value ${zscoreColor}">${zscore.toFixed(3)}</span>
-                        </div>
-
-                        <div class="zscore-bar">
-                            <div class="zscore-fill" style="width: ${zscorePercent}%"></div>
-                            <div class="zscore-marker" style="left: 50%"></div>
-                        </div>
-
-                        <div class="stat">
-                            <span class="stat-label">Cointegration:</span>
-                            <span class="${isCointegrated ? 'cointegrated' : 'not-cointegrated'}">
-                                ${isCointegrated ? '✓ Yes' : '✗ No'}
-                            </span>
-                        </div>
-
-                        <div class="stat">
-                            <span class="stat-label">P-Value:</span>
-                            <span class="stat-value">${pvalue.toFixed(4)}</span>
-                        </div>
-
-                        <div class="stat">
-                            <span class="stat-label">Hedge Ratio:</span>
-                            <span class="stat-value">${hedgeRatio.toFixed(4)}</span>
-                        </div>
-
-                        <div class="stat">
-                            <span class="stat-label">Half-Life:</span>
-                            <span class="stat-value">${halfLife !== 'N/A' ? halfLife.toFixed(2) + ' min' : 'N/A'}</span>
-                        </div>
-
-                        <div class="stat">
-                            <span class="stat-label">Position Size (USD):</span>
-                            <span class="stat-value">$${positionSizeA.toFixed(2)} / $${positionSizeB.toFixed(2)}</span>
-                        </div>
-
-                        <div class="stat">
-                            <span class="stat-label">Lot Size (Contracts):</span>
-                            <span class="stat-value">${lotSizeA} / ${lotSizeB}</span>
-                        </div>
-
-                        <div class="stat">
-                            <span class="stat-label">Signal:</span>
-                            <span class="signal ${signal.toLowerCase()}">${signal}</span>
-                        </div>
-
-                        <div class="stat">
-                            <span class="stat-label">Confidence:</span>
-                            <span class="stat-value">${(confidence * 100).toFixed(1)}%</span>
-                        </div>
-                    </div>
-                `;
-            }
-
-            // Request updates every 2 seconds
-            setInterval(() => {
-                if (ws.readyState === WebSocket.OPEN) {
-                    ws.send('ping');
-                }
-            }, 2000);
+                refs.prices.textContent = `${currentPriceA.toFixed(2)} / ${currentPriceB.toFixed(2)}`;
+                refs.zscore.textContent = zscore.toFixed(3);
+                refs.zscore.className = `stat-value ${zscoreColor}`;
+                refs.zscoreFill.style.width = `${zscorePercent}%`;
+                refs.cointegration.textContent = isCointegrated ? '✓ Yes' : '✗ No';
+                refs.cointegration.className = isCointegrated ? 'cointegrated' : 'not-cointegrated';
+                refs.pvalue.textContent = pvalue.toFixed(4);
+                refs.hedgeRatio.textContent = hedgeRatio.toFixed(4);
+                refs.halfLife.textContent = halfLife !== 'N/A' ? halfLife.toFixed(2) + ' min' : 'N/A';
+                refs.positionSize.textContent = `$${positionSizeA.toFixed(2)} / $${positionSizeB.toFixed(2)}`;
+                refs.lotSize.textContent = `${lotSizeA} / ${lotSizeB}`;
+                refs.signal.textContent = signal;
+                refs.signal.className = `signal ${signal.toLowerCase()}`;
+                refs.confidence.textContent = `${(confidence * 100).toFixed(1)}%`;
+            }
         </script>
     </body>
     </html>
     """
-    return HTMLResponse(content=html_content)
+
+# The page never changes at runtime: encode it once and let browsers revalidate
+# against a content hash
+_HTML_BYTES = _HTML.encode("utf-8")
+_ETAG = '"%s"' % hashlib.blake2b(_HTML_BYTES, digest_size=8).hexdigest()
+_HTML_HEADERS = {"Cache-Control": "public, max-age=3600", "ETag": _ETAG}
+
+@app.get("/")
+async def get_dashboard(request: Request):
+    """Serve the dashboard HTML"""
+    if request.headers.get("if-none-match") == _ETAG:
+        return Response(status_code=304, headers=_HTML_HEADERS)
+    return Response(content=_HTML_BYTES, media_type="text/html", headers=_HTML_HEADERS)
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates"""
-    await websocket.accept()
+    # Negotiate the frame encoding through the subprotocol; JSON stays the
+    # default for clients that don't ask (or when ormsgpack isn't installed)
+    requested = websocket.scope.get("subprotocols") or []
+    if MSGPACK_AVAILABLE and "msgpack" in requested:
+        subprotocol, encode = "msgpack", _packb
+    else:
+        subprotocol, encode = ("json" if "json" in requested else None), _dumps
+    await websocket.accept(subprotocol=subprotocol)
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=PATCH_QUEUE_SIZE)
+    sender = None
     try:
+        # Subscribe before the snapshot so changes made while it's being sent
+        # are queued too (re-applying an "add" is harmless)
+        _subscribers.add(queue)
+        if not _in_process:
+            _load_dashboard_data()
+
+        # Full state first, then only the changes
+        await websocket.send_bytes(_snapshot(encode))
+        sender = asyncio.create_task(_send_patches(websocket, queue, encode))
+
+        # Updates are pushed by the sender; reading only notices the disconnect
         while True:
-            # Wait for ping from client
             await websocket.receive_text()
-
-            # Load latest data from file
+    except Exception as e:
+        print(f"WebSocket error: {e}")
+    finally:
+        _subscribers.discard(queue)
+        if sender is not None:
+            sender.cancel()
+
+async def _watch_engine():
+    """Pick up engine updates from another process while clients are connected"""
+    while True:
+        await asyncio.sleep(WATCH_INTERVAL)
+        if _subscribers and not _in_process:
             _load_dashboard_data()
 
-            # Send current data
-            await websocket.send_text(json.dumps(dashboard_data))
+async def _subscribe_engine():
+    """Apply snapshots the engine publishes over ZeroMQ; polls instead if the socket fails"""
+    sub = zmq.asyncio.Context.instance().socket(zmq.SUB)
+    try:
+        sub.setsockopt(zmq.CONFLATE, 1)
+        sub.setsockopt(zmq.LINGER, 0)
+        sub.setsockopt(zmq.SUBSCRIBE, b"")
+        sub.connect(ZMQ_ENDPOINT)
+        while True:
+            payload = await sub.recv()
+            if not _in_process:
+                _merge_loaded(orjson.loads(payload))
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
-        print(f"WebSocket error: {e}")
+        print(f"Dashboard subscriber error, falling back to polling: {e}")
+    finally:
+        sub.close()
+    await _watch_engine()
+
+async def _send_patches(websocket: WebSocket, queue: asyncio.Queue, encode: Callable[[list], bytes]):
+    """Send queued patch ops, coalescing everything already waiting into one frame"""
+    while True:
+        ops = [await queue.get()]
+        while len(ops) < PATCH_BATCH_SIZE:
+            try:
+                ops.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        for i, op in enumerate(ops):
+            if op is _RESYNC:
+                # The backlog was dropped: resend everything, then whatever
+                # was queued after the marker
+                await websocket.send_bytes(_snapshot(encode))
+                ops = ops[i + 1:]
+                break
+        if ops:
+            await websocket.send_bytes(encode(ops))
+
+def _snapshot(encode: Callable[[list], bytes]) -> bytes:
+    """A frame replacing the client's whole state"""
+    if encode is _dumps:
+        return b'[{"op":"replace","path":"","value":' + _dump_state() + b'}]'
+    return encode([{"op": "replace", "path": "", "value": dashboard_data}])
+
+def _pointer(*parts: str) -> str:
+    """JSON Pointer to a (nested) key"""
+    return "".join("/" + part.replace("~", "~0").replace("/", "~1") for part in parts)
+
+def _publish(ops: Iterable[dict]):
+    """Queue patch ops for every connected client"""
+    if not _subscribers:
+        return
+    ops = list(ops)
+    for queue in _subscribers:
+        try:
+            for op in ops:
+                queue.put_nowait(op)
+        except asyncio.QueueFull:
+            # Client isn't keeping up: drop its backlog and resync it
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(_RESYNC)
+
+def _publish_keys(*keys: str):
+    """Queue patches setting top-level keys to their current values"""
+    if _subscribers:
+        _publish({"op": "add", "path": _pointer(key), "value": dashboard_data[key]} for key in keys)
 
 def update_dashboard(pair_id: str, data: dict):
     """Update dashboard data from trading engine"""
     dashboard_data["pairs"][pair_id] = data
-    dashboard_data["last_update"] = datetime.now().isoformat()
-    _save_dashboard_data()
+    dashboard_data["last_update"] = time.time()
+    if _subscribers:
+        _publish((
+            {"op": "add", "path": _pointer("pairs", pair_id), "value": data},
+            {"op": "add", "path": "/last_update", "value": dashboard_data["last_update"]}
+        ))
+    _mark_dirty()
 
 def update_balance(balance: float):
     """Update account balance"""
     dashboard_data["account_balance"] = balance
     dashboard_data["available_balance"] = balance
-    _save_dashboard_data()
+    _publish_keys("account_balance", "available_balance")
+    _mark_dirty()
 
 def update_stats(stats: dict):
     """Update trading statistics"""
@@ -446,29 +703,219 @@ def update_stats(stats: dict):
     dashboard_data["win_rate"] = stats.get("win_rate", 0.0)
     dashboard_data["total_trades"] = stats.get("total_trades", 0)
     dashboard_data["available_balance"] = stats.get("available_balance", dashboard_data["account_balance"])
-    dashboard_data["last_update"] = datetime.now().isoformat()
-    _save_dashboard_data()
+    dashboard_data["last_update"] = time.time()
+    _publish_keys(
+        "total_pnl", "daily_pnl", "win_rate", "total_trades",
+        "available_balance", "last_update"
+    )
+    _mark_dirty()
+
+def _ensure_flusher(loop: asyncio.AbstractEventLoop):
+    """Start _flush_loop on the given loop unless it's already running there"""
+    global _flush_task, _flush_loop_owner
+    if _flush_task is None or _flush_task.done() or _flush_loop_owner is not loop:
+        _flush_loop_owner = loop
+        _flush_task = loop.create_task(_flush_loop())
+
+def _mark_dirty():
+    """Schedule a coalesced save of the dashboard data"""
+    global _in_process, _scalar_bytes
+    if not _in_process and ZMQ_AVAILABLE:
+        # Bind on the first update so subscribers are connected by the first flush
+        _zmq_socket()
+    _in_process = True
+    _scalar_bytes = None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Called from outside an event loop: hand off to the flusher's loop
+        # if it's alive, otherwise save right away
+        owner = _flush_loop_owner
+        if owner is not None and owner.is_running() and not owner.is_closed():
+            owner.call_soon_threadsafe(_dirty.set)
+        else:
+            _save_dashboard_data()
+        return
+
+    _ensure_flusher(loop)
+    _dirty.set()
+
+async def _flush_loop():
+    """Write the dashboard data whenever it's dirty, at most every FLUSH_INTERVAL"""
+    while True:
+        await _dirty.wait()
+        await asyncio.sleep(FLUSH_INTERVAL)
+        _dirty.clear()
+        _save_dashboard_data()
+
+@atexit.register
+def _flush_on_exit():
+    """Write out an update still waiting on the flush interval"""
+    if _dirty.is_set():
+        _save_dashboard_data()
+
+def _dumps(data) -> bytes:
+    """Serialize dashboard state (numpy scalars from the engine included)"""
+    return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def _packb(data) -> bytes:
+    """Serialize a frame as MessagePack"""
+    return ormsgpack.packb(data, option=ormsgpack.OPT_SERIALIZE_NUMPY)
+
+def _dump_state() -> bytes:
+    """Serialize dashboard_data, reusing the encoding of unchanged pairs"""
+    global _scalar_bytes
+    pairs = dashboard_data["pairs"]
+    fragments = []
+    for pair_id, value in pairs.items():
+        entry = _pair_bytes.get(pair_id)
+        if entry is None or entry[0] is not value:
+            entry = (value, orjson.dumps(pair_id) + b":" + _dumps(value))
+            _pair_bytes[pair_id] = entry
+        fragments.append(entry[1])
+    if len(_pair_bytes) > len(pairs):
+        for pair_id in _pair_bytes.keys() - pairs.keys():
+            del _pair_bytes[pair_id]
+
+    if _scalar_bytes is None:
+        _scalar_bytes = _dumps({key: value for key, value in dashboard_data.items() if key != "pairs"})
+    # _scalar_bytes is an encoded object: splice its members in after "pairs"
+    rest = b"," + _scalar_bytes[1:] if len(_scalar_bytes) > 2 else b"}"
+    return b'{"pairs":{' + b",".join(fragments) + b"}" + rest
+
+def _attach_shm(create: bool) -> Optional[shared_memory.SharedMemory]:
+    """Map the shared dashboard block, creating it on the writer side"""
+    global _shm
+    if _shm is None:
+        try:
+            try:
+                _shm = shared_memory.SharedMemory(name=SHM_NAME, create=create, size=SHM_SIZE)
+            except FileExistsError:
+                _shm = shared_memory.SharedMemory(name=SHM_NAME)
+        except OSError:
+            return None
+        # The block outlives both processes, like the data file; keep the
+        # resource tracker from unlinking it when either one exits
+        resource_tracker.unregister(_shm._name, "shared_memory")
+    return _shm
+
+def _publish_shm(payload: bytes):
+    """Write a serialized snapshot into the shared block under the seqlock"""
+    shm = _attach_shm(create=True)
+    if shm is None:
+        return
+
+    buf = shm.buf
+    seq = _SHM_HEADER.unpack_from(buf)[0]
+    begin = (seq + 1) | 1
+    _SHM_HEADER.pack_into(buf, 0, begin, 0)
+    if len(payload) <= len(buf) - _SHM_HEADER.size:
+        buf[_SHM_HEADER.size:_SHM_HEADER.size + len(payload)] = payload
+        length = len(payload)
+    else:
+        length = _SHM_OVERFLOW
+    _SHM_HEADER.pack_into(buf, 0, begin + 1, length)
+
+def _load_from_shm() -> bool:
+    """
+    Refresh dashboard_data from the shared block
+
+    Returns:
+        True if the block holds current data (whether or not it changed since
+        the last read), False if the caller should fall back to the file
+    """
+    global _shm_seen_seq
+    shm = _attach_shm(create=False)
+    if shm is None:
+        return False
+
+    buf = shm.buf
+    for _ in range(3):
+        seq, length = _SHM_HEADER.unpack_from(buf)
+        if seq == 0 or length == _SHM_OVERFLOW:
+            return False
+        if seq & 1:
+            continue
+        if seq == _shm_seen_seq:
+            return True
+        payload = bytes(buf[_SHM_HEADER.size:_SHM_HEADER.size + length])
+        if _SHM_HEADER.unpack_from(buf)[0] == seq:
+            _merge_loaded(orjson.loads(payload))
+            _shm_seen_seq = seq
+            return True
+    return False
+
+def _zmq_socket():
+    """The engine-side PUB socket, bound on first use"""
+    global _zmq_pub
+    if _zmq_pub is None:
+        try:
+            pub = zmq.Context.instance().socket(zmq.PUB)
+            pub.setsockopt(zmq.LINGER, 0)
+            pub.bind(ZMQ_ENDPOINT)
+            _zmq_pub = pub
+        except zmq.ZMQError as e:
+            print(f"Error binding dashboard publisher: {e}")
+    return _zmq_pub
+
+def _publish_zmq(payload: bytes):
+    """Send a snapshot to dashboard subscribers; dropped if none are keeping up"""
+    pub = _zmq_socket()
+    if pub is None:
+        return
+    try:
+        pub.send(payload, zmq.NOBLOCK)
+    except zmq.Again:
+        pass
 
 def _save_dashboard_data():
-    """Save dashboard data to file"""
+    """Publish dashboard data over ZeroMQ, to shared memory and the file (atomically, so readers never see a partial write)"""
     try:
-        data_file = Path("/tmp/bybit_dashboard_data.json")
-        with open(data_file, 'w') as f:
-            json.dump(dashboard_data, f)
+        payload = _dump_state()
+        if ZMQ_AVAILABLE:
+            _publish_zmq(payload)
+        _publish_shm(payload)
+        with open(_DATA_TMP_FILE, 'wb') as f:
+            f.write(payload)
+        os.replace(_DATA_TMP_FILE, DATA_FILE)
     except Exception as e:
         print(f"Error saving dashboard data: {e}")
 
 def _load_dashboard_data():
-    """Load dashboard data from file"""
+    """Load dashboard data from shared memory, falling back to the file"""
+    global _file_seen_mtime
     try:
-        data_file = Path("/tmp/bybit_dashboard_data.json")
-        if data_file.exists():
-            with open(data_file, 'r') as f:
-                loaded_data = json.load(f)
-                dashboard_data.update(loaded_data)
+        if _load_from_shm():
+            return
+        if DATA_FILE.exists():
+            mtime = DATA_FILE.stat().st_mtime_ns
+            if mtime == _file_seen_mtime:
+                return
+            _file_seen_mtime = mtime
+            with open(DATA_FILE, 'rb') as f:
+                loaded_data = orjson.loads(f.read())
+                _merge_loaded(loaded_data)
     except Exception as e:
         print(f"Error loading dashboard data: {e}")
 
+def _merge_loaded(loaded: dict):
+    """Merge state loaded from the engine, queueing patches for whatever changed"""
+    global _scalar_bytes
+    ops: List[dict] = []
+    for key, value in loaded.items():
+        if key == "pairs" and isinstance(value, dict):
+            pairs = dashboard_data["pairs"]
+            for pair_id, pair in value.items():
+                if pairs.get(pair_id) != pair:
+                    pairs[pair_id] = pair
+                    ops.append({"op": "add", "path": _pointer("pairs", pair_id), "value": pair})
+        elif dashboard_data.get(key) != value:
+            dashboard_data[key] = value
+            _scalar_bytes = None
+            ops.append({"op": "add", "path": _pointer(key), "value": value})
+    _publish(ops)
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=5000)
+    # uvloop + httptools (from uvicorn[standard]) rather than auto-detection
+    uvicorn.run(app, host="0.0.0.0", port=5000, loop="uvloop", http="httptools", ws="websockets")
@@ -418,4 +418,5 @@ def update_dashboard_data(
 if __name__ == "__main__":
     import uvicorn
     print("Starting Enhanced Multi-Strategy Dashboard on http://localhost:5001")
-    uvicorn.run(app, host="0.0.0.0", port=5001)
+    # uvloop + httptools (from uvicorn[standard]) rather than auto-detection
+    uvicorn.run(app, host="0.0.0.0", port=5001, loop="uvloop", http="httptools", ws="websockets")
@@ -1,8 +1,9 @@
 """Cointegration analysis for pairs trading"""
 
+import threading
 import numpy as np
 import pandas as pd
-from typing import Tuple, Optional, Dict
+from typing import Any, Tuple, Optional, Dict
 from statsmodels.tsa.stattools import adfuller, coint
 from statsmodels.regression.linear_model import OLS
 import logging
@@ -10,12 +11,128 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+_NOT_COINTEGRATED = (False, 1.0, 0.0, 1.0, None)
+
+
+class _PairStream:
+    """
+    Rolling window of one pair's prices with running regression sums
+
+    Sums are taken around the first observed prices so the moments don't
+    cancel catastrophically at large price levels.
+    """
+
+    __slots__ = (
+        'a', 'b', 'pos', 'n', 'shift_a', 'shift_b',
+        'sx', 'sy', 'sxy', 'sx2', 'sy2',
+        'last_bar', 'last_label', 'fit_beta', 'result', 'lock'
+    )
+
+    def __init__(self, window: int):
+        self.a = np.empty(window)
+        self.b = np.empty(window)
+        self.pos = 0
+        self.n = 0
+        self.shift_a = 0.0
+        self.shift_b = 0.0
+        self.sx = self.sy = self.sxy = self.sx2 = self.sy2 = 0.0
+        self.last_bar: Optional[int] = None
+        self.last_label: Any = None
+        self.fit_beta = float('nan')
+        self.result: Optional[Tuple[bool, float, float, float, Optional[float]]] = None
+        self.lock = threading.RLock()
+
+    @property
+    def window(self) -> int:
+        return len(self.a)
+
+    def seed(self, a: np.ndarray, b: np.ndarray):
+        """Replace the window with the last `window` points of a and b"""
+        a = a[-self.window:]
+        b = b[-self.window:]
+        self.n = len(a)
+        self.a[:self.n] = a
+        self.b[:self.n] = b
+        self.pos = self.n % self.window
+        self.shift_a = float(a[0]) if self.n else 0.0
+        self.shift_b = float(b[0]) if self.n else 0.0
+        self.resum()
+
+    def push(self, x: float, y: float):
+        """Append one bar, evicting the oldest once the window is full"""
+        if self.n == 0:
+            self.shift_a, self.shift_b = x, y
+
+        if self.n == self.window:
+            ox = self.a[self.pos] - self.shift_a
+            oy = self.b[self.pos] - self.shift_b
+            self.sx -= ox
+            self.sy -= oy
+            self.sxy -= ox * oy
+            self.sx2 -= ox * ox
+            self.sy2 -= oy * oy
+        else:
+            self.n += 1
+
+        self.a[self.pos] = x
+        self.b[self.pos] = y
+        self.pos = (self.pos + 1) % self.window
+
+        dx = x - self.shift_a
+        dy = y - self.shift_b
+        self.sx += dx
+        self.sy += dy
+        self.sxy += dx * dy
+        self.sx2 += dx * dx
+        self.sy2 += dy * dy
+
+    def resum(self):
+        """Recompute the running sums from the window (drops accumulated drift)"""
+        dx = self.a[:self.n] - self.shift_a
+        dy = self.b[:self.n] - self.shift_b
+        self.sx = float(dx.sum())
+        self.sy = float(dy.sum())
+        self.sxy = float(dx @ dy)
+        self.sx2 = float(dx @ dx)
+        self.sy2 = float(dy @ dy)
+
+    def hedge_ratio(self) -> float:
+        """OLS beta of b on a: (n·Σxy − ΣxΣy) / (n·Σx² − (Σx)²)"""
+        denom = self.n * self.sx2 - self.sx * self.sx
+        if denom <= 0:
+            return float('nan')
+        return (self.n * self.sxy - self.sx * self.sy) / denom
+
+    def ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Window contents, oldest first"""
+        if self.n < self.window:
+            return self.a[:self.n], self.b[:self.n]
+        return (
+            np.concatenate((self.a[self.pos:], self.a[:self.pos])),
+            np.concatenate((self.b[self.pos:], self.b[:self.pos]))
+        )
+
+
 class CointegrationAnalyzer:
     """Analyzes cointegration between asset pairs"""
 
-    def __init__(self, pvalue_threshold: float = 0.05):
+    def __init__(
+        self,
+        pvalue_threshold: float = 0.05,
+        stream_window: int = 1440,
+        adf_every: int = 30,
+        beta_tolerance: float = 0.01
+    ):
         self.pvalue_threshold = pvalue_threshold
 
+        # Streaming Engle-Granger: the hedge ratio is updated from running
+        # sums every bar, the full OLS + ADF only every `adf_every` bars or
+        # when beta drifts by more than `beta_tolerance` (relative)
+        self.stream_window = stream_window
+        self.adf_every = adf_every
+        self.beta_tolerance = beta_tolerance
+        self._streams: Dict[str, _PairStream] = {}
+
     def test_cointegration(
         self,
         price_a: pd.Series,
@@ -33,41 +150,11 @@ class CointegrationAnalyzer:
             - half_life: Optional[float] (mean reversion speed in periods)
         """
         try:
-            # Ensure inputs are pandas Series
-            if not isinstance(price_a, pd.Series):
-                price_a = pd.Series(price_a)
-            if not isinstance(price_b, pd.Series):
-                price_b = pd.Series(price_b)
-
-            # Align price series by index (timestamps) - CRITICAL FIX
-            # Ensure index is datetime
-            price_a.index = pd.to_datetime(price_a.index)
-            price_b.index = pd.to_datetime(price_b.index)
-
-            # Force unique indices by grouping by index and taking mean
-            # ALWAYS do this to be safe against any duplicates
-            price_a = price_a.groupby(level=0).mean()
-            price_b = price_b.groupby(level=0).mean()
-            
-            # Sort index
-            price_a = price_a.sort_index()
-            price_b = price_b.sort_index()
-            
-            # Create DataFrame with aligned indices using merge
-            df_a = price_a.to_frame(name='a')
-            df_b = price_b.to_frame(name='b')
-            
-            # Inner join on index
-            df = df_a.join(df_b, how='inner')
-            df = df.dropna()  # Remove any NaN values
-            
-            # Inner join on index
-            df = df_a.join(df_b, how='inner')
-            df = df.dropna()  # Remove any NaN values
+            df = self._align(price_a, price_b)
 
             if len(df) < 30:
                 logger.warning(f"Price series too short after alignment: {len(df)} points")
-                return False, 1.0, 0.0, 1.0, None
+                return _NOT_COINTEGRATED
 
             price_a = df['a']
             price_b = df['b']
@@ -81,7 +168,141 @@ class CointegrationAnalyzer:
 
         except Exception as e:
             logger.error(f"Error in cointegration test: {e}")
-            return False, 1.0, 0.0, 1.0, None
+            return _NOT_COINTEGRATED
+
+    @staticmethod
+    def _align(price_a: pd.Series, price_b: pd.Series) -> pd.DataFrame:
+        """Inner-join two price series on a unique, sorted datetime index"""
+        # Ensure inputs are pandas Series
+        if not isinstance(price_a, pd.Series):
+            price_a = pd.Series(price_a)
+        if not isinstance(price_b, pd.Series):
+            price_b = pd.Series(price_b)
+
+        # Align price series by index (timestamps) - CRITICAL FIX
+        # Ensure index is datetime
+        price_a.index = pd.to_datetime(price_a.index)
+        price_b.index = pd.to_datetime(price_b.index)
+
+        # Force unique indices by grouping by index and taking mean
+        # ALWAYS do this to be safe against any duplicates
+        price_a = price_a.groupby(level=0).mean()
+        price_b = price_b.groupby(level=0).mean()
+
+        # Sort index
+        price_a = price_a.sort_index()
+        price_b = price_b.sort_index()
+
+        # Inner join on index
+        df = price_a.to_frame(name='a').join(price_b.to_frame(name='b'), how='inner')
+        return df.dropna()  # Remove any NaN values
+
+    def update_and_test(
+        self,
+        pair_id: str,
+        last_a: float,
+        last_b: float,
+        bar_id: int
+    ) -> Tuple[bool, float, float, float, Optional[float]]:
+        """
+        Push one bar into the pair's rolling window and test cointegration
+
+        The hedge ratio comes from the running sums in O(1). The full
+        Engle-Granger test reruns when bar_id is a multiple of adf_every,
+        when beta has drifted past beta_tolerance since the last fit, or on
+        the first fit; otherwise the last p-value, test statistic and
+        half-life are reused. Bars with a bar_id not after the last one are
+        ignored.
+
+        Returns:
+            Same tuple as test_cointegration
+        """
+        stream = self._streams.get(pair_id)
+        if stream is None:
+            stream = self._streams.setdefault(pair_id, _PairStream(self.stream_window))
+
+        with stream.lock:
+            if stream.last_bar is not None and bar_id <= stream.last_bar:
+                return stream.result or _NOT_COINTEGRATED
+
+            stream.push(float(last_a), float(last_b))
+            stream.last_bar = bar_id
+            return self._stream_test(stream, bar_id)
+
+    def test_cointegration_incremental(
+        self,
+        pair_id: str,
+        price_a: pd.Series,
+        price_b: pd.Series
+    ) -> Tuple[bool, float, float, float, Optional[float]]:
+        """
+        test_cointegration for a rolling price window fed once per bar
+
+        When the aligned window is the previous call's window advanced by one
+        bar, only that bar goes through update_and_test; any other change
+        (first call, gap, resize) reseeds the pair's stream and runs the
+        full test.
+        """
+        try:
+            df = self._align(price_a, price_b)
+
+            if len(df) < 30:
+                logger.warning(f"Price series too short after alignment: {len(df)} points")
+                return _NOT_COINTEGRATED
+
+            index = df.index
+            stream = self._streams.get(pair_id)
+            if stream is not None and stream.window == len(df):
+                with stream.lock:
+                    if stream.n == stream.window and stream.last_label is not None:
+                        if index[-1] == stream.last_label:
+                            return stream.result or _NOT_COINTEGRATED
+                        if index[-2] == stream.last_label:
+                            stream.last_label = index[-1]
+                            return self.update_and_test(
+                                pair_id, df['a'].iat[-1], df['b'].iat[-1], stream.last_bar + 1
+                            )
+
+            stream = _PairStream(len(df))
+            with stream.lock:
+                stream.seed(df['a'].to_numpy(dtype=np.float64), df['b'].to_numpy(dtype=np.float64))
+                stream.last_bar = 0
+                stream.last_label = index[-1]
+                result = self._stream_test(stream, 0)
+            self._streams[pair_id] = stream
+            return result
+
+        except Exception as e:
+            logger.error(f"Error in cointegration test: {e}")
+            return _NOT_COINTEGRATED
+
+    def _stream_test(
+        self,
+        stream: _PairStream,
+        bar_id: int
+    ) -> Tuple[bool, float, float, float, Optional[float]]:
+        """Cointegration result for a stream's current window (caller holds stream.lock)"""
+        if stream.n < 30:
+            return _NOT_COINTEGRATED
+
+        beta = stream.hedge_ratio()
+        if (
+            stream.result is None or
+            bar_id % self.adf_every == 0 or
+            not abs(beta - stream.fit_beta) <= self.beta_tolerance * abs(stream.fit_beta)
+        ):
+            price_a, price_b = stream.ordered()
+            stream.result = self._engle_granger_test(price_a, price_b)
+            stream.fit_beta = stream.result[3]
+            stream.resum()
+            return stream.result
+
+        is_coint, pvalue, test_statistic, _, half_life = stream.result
+        return is_coint, pvalue, test_statistic, beta, half_life
+
+    def clear_streams(self):
+        """Drop all streaming cointegration state"""
+        self._streams.clear()
 
     def _engle_granger_test(
         self,
@@ -124,12 +345,12 @@ class CointegrationAnalyzer:
                 r_squared > 0.1  # Very low R² requirement for more trades
             )
 
-            half_life_str = f"{half_life:.2f}" if half_life else "N/A"
-            logger.debug(
-                f"Cointegration test: p-value={pvalue:.4f}, "
-                f"hedge_ratio={hedge_ratio:.4f}, R²={r_squared:.4f}, "
-                f"half_life={half_life_str}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                half_life_str = f"{half_life:.2f}" if half_life else "N/A"
+                logger.debug(
+                    "Cointegration test: p-value=%.4f, hedge_ratio=%.4f, R²=%.4f, half_life=%s",
+                    pvalue, hedge_ratio, r_squared, half_life_str
+                )
 
             return is_cointegrated, pvalue, test_statistic, hedge_ratio, half_life
 
@@ -63,7 +63,7 @@ class SignalGenerator:
             )
 
             if not is_coint:
-                logger.debug(f"{symbol_a}/{symbol_b} not cointegrated (p-value: {pvalue:.4f})")
+                logger.debug("%s/%s not cointegrated (p-value: %.4f)", symbol_a, symbol_b, pvalue)
 
                 # If we have a position and cointegration breaks, signal to close
                 if current_position:
@@ -87,11 +87,9 @@ class SignalGenerator:
                 hedge_ratio
             )
 
-            current_spread = float(spread.iloc[-1])
-            zscore = self.zscore_calculator.calculate_current_zscore(
-                current_spread,
-                spread[:-1]  # Use historical spread for calculation
-            )
+            # Z-score of the last value against the historical spread, from
+            # running sums (no spread[:-1] Series copy)
+            current_spread, zscore, _, _ = self.zscore_calculator.spread_snapshot(spread)
 
             # Get signal from z-score
             signal_str = self.zscore_calculator.get_signal_from_zscore(
@@ -1,7 +1,8 @@
 """Multi-Strategy Manager - Run multiple strategies simultaneously"""
 
 import asyncio
-from typing import List, Dict, Optional
+import time
+from typing import Any, List, Dict, Optional, Tuple
 import pandas as pd
 from dataclasses import dataclass
 import logging
@@ -14,7 +15,7 @@ from src.strategy.orderbook_imbalance_strategy import OrderBookImbalanceStrategy
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedSignal:
     """Aggregated signal from multiple strategies"""
     action: str  # LONG_SPREAD, SHORT_SPREAD, CLOSE, HOLD
@@ -70,6 +71,13 @@ class StrategyManager:
             'mean_reversion': {'trades': 0, 'wins': 0, 'pnl': 0.0}
         }
 
+        # Latest raw strategy outputs per pair, reused by both signal modes
+        # while their inputs are unchanged: pair_id -> (key, stored_at, results)
+        self._signal_cache: Dict[str, Tuple[tuple, float, List]] = {}
+        self.signal_cache_ttl = 1.0  # seconds
+        self._signal_cache_lookups = 0
+        self._signal_cache_hits = 0
+
         logger.info("Strategy Manager initialized with 4 strategies (Engle-Granger, OBI, Correlation+RSI, Mean Reversion)")
 
     async def generate_aggregated_signal(
@@ -97,15 +105,22 @@ class StrategyManager:
         Returns:
             AggregatedSignal with consensus action
         """
-        signals = {}
-
-        # Run all strategies in parallel
-        tasks = []
-        for name, strategy in self.strategies.items():
-            task = self._run_strategy(name, strategy, prices_a, prices_b, current_position, orderbook_a, orderbook_b)
-            tasks.append(task)
+        results = await self._run_all_strategies(
+            prices_a, prices_b, pair_id, current_position, orderbook_a, orderbook_b
+        )
+        return self._aggregate_results(results, pair_id, prices_a, prices_b, candles_a, candles_b)
 
-        results = await asyncio.gather(*tasks)
+    def _aggregate_results(
+        self,
+        results: List,
+        pair_id: str,
+        prices_a: pd.Series,
+        prices_b: pd.Series,
+        candles_a: Optional[pd.DataFrame],
+        candles_b: Optional[pd.DataFrame]
+    ) -> AggregatedSignal:
+        """Aggregate raw strategy results, boosting on a volume/ATR breakout"""
+        signals = {}
 
         # Collect signals
         for name, signal in results:
@@ -132,6 +147,66 @@ class StrategyManager:
             
         return aggregated
 
+    @staticmethod
+    def _orderbook_seq(orderbook: Optional[Dict]) -> Any:
+        """Identify an order book snapshot (Bybit update id when present)"""
+        if not orderbook:
+            return None
+        return orderbook.get('u', id(orderbook))
+
+    @staticmethod
+    def _series_key(series: pd.Series) -> tuple:
+        """Cheap fingerprint of a price series' latest state"""
+        if series.empty:
+            return (0,)
+        return (len(series), series.index[-1], series.iloc[-1])
+
+    async def _run_all_strategies(
+        self,
+        prices_a: pd.Series,
+        prices_b: pd.Series,
+        pair_id: str,
+        current_position: Optional[str],
+        orderbook_a: Optional[Dict],
+        orderbook_b: Optional[Dict]
+    ) -> List:
+        """
+        Run every strategy on a pair, reusing the previous results when the
+        inputs are unchanged and younger than signal_cache_ttl
+        """
+        key = (
+            self._series_key(prices_a),
+            self._series_key(prices_b),
+            current_position,
+            self._orderbook_seq(orderbook_a),
+            self._orderbook_seq(orderbook_b)
+        )
+        now = time.monotonic()
+        self._signal_cache_lookups += 1
+
+        cached = self._signal_cache.get(pair_id)
+        if cached is not None and cached[0] == key and now - cached[1] < self.signal_cache_ttl:
+            self._signal_cache_hits += 1
+            logger.debug(
+                "[%s] Strategy signal cache hit (%d/%d)",
+                pair_id, self._signal_cache_hits, self._signal_cache_lookups
+            )
+            return cached[2]
+
+        # Run all strategies in parallel
+        tasks = []
+        for name, strategy in self.strategies.items():
+            task = self._run_strategy(name, strategy, prices_a, prices_b, current_position, orderbook_a, orderbook_b)
+            tasks.append(task)
+
+        results = await asyncio.gather(*tasks)
+        self._signal_cache[pair_id] = (key, now, results)
+        return results
+
+    def clear_cache(self):
+        """Drop cached strategy outputs"""
+        self._signal_cache.clear()
+
     async def _run_strategy(self, name, strategy, prices_a, prices_b, current_position, orderbook_a=None, orderbook_b=None):
         """Run a single strategy"""
         try:
@@ -199,14 +274,15 @@ class StrategyManager:
                 metadata={}
             )
 
-        # Sort by confidence
-        sorted_actions = sorted(
-            actions.items(),
-            key=lambda x: (x[1]['count'], x[1]['total_confidence']),
-            reverse=True
-        )
-
-        dominant_action, details = sorted_actions[0]
+        # Pick the action with the most votes, then the highest confidence
+        # (ties go to the first action seen)
+        dominant_action, details = None, None
+        best_count, best_conf = -1, -1.0
+        for act, data in actions.items():
+            count, conf = data['count'], data['total_confidence']
+            if count > best_count or (count == best_count and conf > best_conf):
+                dominant_action, details = act, data
+                best_count, best_conf = count, conf
 
         # Calculate consensus
         if details['count'] == len(self.strategies):
@@ -355,15 +431,15 @@ class StrategyManager:
         Returns:
             Dict of {strategy_name: signal_dict} for all strategies
         """
-        signals = {}
-
-        # Run all strategies in parallel
-        tasks = []
-        for name, strategy in self.strategies.items():
-            task = self._run_strategy(name, strategy, prices_a, prices_b, current_position, orderbook_a, orderbook_b)
-            tasks.append(task)
+        results = await self._run_all_strategies(
+            prices_a, prices_b, pair_id, current_position, orderbook_a, orderbook_b
+        )
+        return self._actionable_signals(results, pair_id)
 
-        results = await asyncio.gather(*tasks)
+    @staticmethod
+    def _actionable_signals(results: List, pair_id: str) -> Dict[str, Dict]:
+        """Keep the raw strategy results worth trading on"""
+        signals = {}
 
         # Collect all signals
         for name, signal in results:
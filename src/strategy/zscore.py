@@ -92,6 +92,68 @@ class ZScoreCalculator:
             logger.error(f"Error calculating current z-score: {e}")
             return 0.0
 
+    def calculate_current_zscore_fast(
+        self,
+        current_spread: float,
+        mean: float,
+        std: float
+    ) -> float:
+        """
+        Calculate current z-score from precomputed historical mean/std
+
+        Same guards as calculate_current_zscore, without re-scanning the history
+        """
+        if std == 0 or np.isnan(std):
+            return 0.0
+
+        zscore = (current_spread - mean) / std
+
+        if np.isnan(zscore) or np.isinf(zscore):
+            return 0.0
+
+        return float(zscore)
+
+    def spread_snapshot(
+        self,
+        spread: pd.Series
+    ) -> Tuple[float, float, float, float]:
+        """
+        Summarize a spread in one NumPy scan
+
+        Returns:
+            - current spread (last value)
+            - current z-score against all prior values
+            - mean of the whole spread
+            - std of the whole spread (sample, NaNs skipped like pandas)
+        """
+        arr = spread.to_numpy(dtype=np.float64)
+        current = float(arr[-1])
+        history = arr[:-1]
+        history = history[~np.isnan(history)]
+
+        # Sums are taken around the first value so the variance doesn't
+        # cancel catastrophically for spreads far from zero
+        n = history.size
+        shift = float(history[0]) if n else 0.0
+        centered = history - shift
+        total = float(centered.sum())
+        total_sq = float(np.dot(centered, centered))
+
+        if n < 30:
+            logger.warning("Insufficient data for z-score calculation")
+            zscore = 0.0
+        else:
+            mean_prev, std_prev = _mean_std(n, shift, total, total_sq)
+            zscore = self.calculate_current_zscore_fast(current, mean_prev, std_prev)
+
+        if not np.isnan(current):
+            n += 1
+            total += current - shift
+            total_sq += (current - shift) ** 2
+
+        mean, std = _mean_std(n, shift, total, total_sq)
+        return current, zscore, mean, std
+
     def get_signal_from_zscore(
         self,
         zscore: float,
@@ -272,6 +334,17 @@ class ZScoreCalculator:
             return pd.Series(), pd.Series(), pd.Series()
 
 
+def _mean_std(n: int, shift: float, total: float, total_sq: float) -> Tuple[float, float]:
+    """Mean and sample std from shifted running sums (NaN when undefined, like pandas)"""
+    if n == 0:
+        return float('nan'), float('nan')
+    mean = shift + total / n
+    if n < 2:
+        return mean, float('nan')
+    var = max((total_sq - total * total / n) / (n - 1), 0.0)
+    return mean, var ** 0.5
+
+
 def detect_mean_reversion_strength(spread: pd.Series) -> float:
     """
     Detect the strength of mean reversion in spread